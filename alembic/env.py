@@ -8,6 +8,11 @@ import asyncio
 import os
 import sys
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Import database models
 sys.path.insert(0, os.path.dirname(__file__))
 from database.models import Base
@@ -67,4 +72,6 @@ async def run_migrations_online() -> None:
 if context.is_offline_mode():
     run_migrations_offline()
 else:
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(run_migrations_online())
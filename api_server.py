@@ -8,39 +8,58 @@ FastAPI server to connect backend arbitrage engine with frontend dashboard
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
-from opentelemetry.instrumentation.asyncio import AsyncioInstrumentor
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
-# Configure tracing
-trace.set_tracer_provider(TracerProvider())
+# Configure tracing: sample 1% of new traces, follow the parent's decision otherwise
+trace.set_tracer_provider(TracerProvider(sampler=ParentBased(TraceIdRatioBased(0.01))))
 trace.get_tracer_provider().add_span_processor(
-    BatchSpanProcessor(OTLPSpanExporter(endpoint="http://localhost:4318/v1/traces"))
+    BatchSpanProcessor(
+        OTLPSpanExporter(endpoint="http://localhost:4318/v1/traces"),
+        max_queue_size=2048,
+        schedule_delay_millis=2000,
+        max_export_batch_size=512,
+    )
 )
 
-# Instrument libraries
+# Instrument libraries (request-scoped only; patching asyncio would wrap every create_task)
 AioHttpClientInstrumentor().instrument()
-AsyncioInstrumentor().instrument()
 
 # Standard library imports
 import asyncio
-import json
+import hashlib
+import itertools
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from decimal import Decimal
+from typing import AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 # Third-party imports
-from fastapi import FastAPI, HTTPException, Path, WebSocket, WebSocketDisconnect
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+import msgpack
+import numpy as np
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Path, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local imports
 from arbitrage_backend import ArbitrageEngine
-from database.cache import get_redis_cache
+from database.cache import OPPORTUNITY_STREAM, get_redis_cache
 from database.connection import get_db_manager
+from database.models import ExecutionStatus, RiskLevel
 from database.repository import (
+    OPPORTUNITY_CHANNEL,
     AlertRepository,
     ChainMetricRepository,
     ExecutionRepository,
@@ -48,10 +67,14 @@ from database.repository import (
     OpportunityRepository,
     StatsRepository,
 )
-from infrastructure import ChainHealth
+from infrastructure import ChainHealth, NodeConfig
 
 logger = logging.getLogger(__name__)
 
+# Use the libuv-backed event loop when available
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # ============================================================================
 # FASTAPI APP SETUP
 # ============================================================================
@@ -60,9 +83,14 @@ app = FastAPI(
     title="Arbitrage Nexus API",
     description="Real-time arbitrage opportunity API",
     version="5.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for frontend
+# Instrument FastAPI for tracing. Registered before CORS so CORS ends up
+# outermost and answers preflight requests without opening a span.
+FastAPIInstrumentor.instrument_app(app)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, specify your frontend domain
@@ -71,40 +99,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Instrument FastAPI for tracing
-FastAPIInstrumentor.instrument_app(app)
-
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
 
-class OpportunityResponse(BaseModel):
-    id: str
+class APIModel(BaseModel):
+    """Base model that can be validated directly from ORM objects"""
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore", populate_by_name=True)
+
+
+class OpportunityResponse(APIModel):
+    id: str = Field(validation_alias=AliasChoices("opportunity_id", "id"))
     pair: str
     chain: str
-    buyExchange: str
-    sellExchange: str
-    buyPrice: float
-    sellPrice: float
-    spread: float
-    profit: float
-    gasEstimate: float
-    netProfit: float
-    volume24h: float
+    buyExchange: str = Field(validation_alias=AliasChoices("buyExchange", "buy_exchange"))
+    sellExchange: str = Field(validation_alias=AliasChoices("sellExchange", "sell_exchange"))
+    buyPrice: float = Field(validation_alias=AliasChoices("buyPrice", "buy_price"))
+    sellPrice: float = Field(validation_alias=AliasChoices("sellPrice", "sell_price"))
+    spread: float = Field(validation_alias=AliasChoices("spread", "spread_percent"))
+    profit: float = Field(validation_alias=AliasChoices("profit", "gross_profit"))
+    gasEstimate: float = Field(validation_alias=AliasChoices("gasEstimate", "gas_cost"))
+    netProfit: float = Field(validation_alias=AliasChoices("netProfit", "net_profit"))
+    volume24h: float = Field(validation_alias=AliasChoices("volume24h", "volume_24h"))
     liquidity: float
     confidence: float
-    risk: str
-    flashLoanAvailable: bool
+    risk: str = Field(validation_alias=AliasChoices("risk", "risk_level"))
+    flashLoanAvailable: bool = Field(validation_alias=AliasChoices("flashLoanAvailable", "flash_loan_available"))
+
+    @field_validator("risk", mode="before")
+    @classmethod
+    def _risk_label(cls, value):
+        return value.value.upper() if isinstance(value, RiskLevel) else value
+
+
+_OPPORTUNITY_LIST_ADAPTER = TypeAdapter(List[OpportunityResponse])
 
 
-class ExecutionRequest(BaseModel):
+class ExecutionRequest(APIModel):
     opportunity_id: str
     use_flash_loan: bool
     slippage_tolerance: float = 0.5
 
 
-class StatsResponse(BaseModel):
+class StatsResponse(APIModel):
     totalPnL: float
     todayPnL: float
     successRate: float
@@ -119,7 +158,7 @@ class StatsResponse(BaseModel):
     activeCapital: float
 
 
-class ChainStatus(BaseModel):
+class ChainStatus(APIModel):
     name: str
     status: str
     trades: int
@@ -127,7 +166,7 @@ class ChainStatus(BaseModel):
     latency: int
 
 
-class GasPriceData(BaseModel):
+class GasPriceData(APIModel):
     time: str
     eth: float
     polygon: float
@@ -135,7 +174,7 @@ class GasPriceData(BaseModel):
     bsc: float
 
 
-class NodeHealthResponse(BaseModel):
+class NodeHealthResponse(APIModel):
     chain: str
     status: str
     is_syncing: Optional[bool]
@@ -146,13 +185,13 @@ class NodeHealthResponse(BaseModel):
     consecutive_failures: int
 
 
-class NodesHealthSummary(BaseModel):
+class NodesHealthSummary(APIModel):
     timestamp: str
     overall_status: str
     chains: Dict[str, NodeHealthResponse]
 
 
-class ChainMetricsResponse(BaseModel):
+class ChainMetricsResponse(APIModel):
     chain: str
     status: str
     block_number: Optional[int]
@@ -175,16 +214,26 @@ class BotState:
         self.connected_clients = set()
         self.engine: Optional[ArbitrageEngine] = None
         self.last_health_update: Optional[ChainHealth] = None
+        self.pubsub_task: Optional[asyncio.Task] = None
+        self.engine_task: Optional[asyncio.Task] = None
+
+        # Latest engine output, replayed to WebSocket clients as they connect
+        self.opportunities: List[Dict] = []
+        self.stats: Dict = {}
+
+        # Short-lived health responses shared by concurrent pollers (key -> (monotonic time, response))
+        self.health_response_cache: Dict[str, Tuple[float, APIModel]] = {}
+        self.health_cache_ttl = 1.0
 
         # Database and cache managers
         self.db_manager = get_db_manager()
         self.redis_cache = get_redis_cache()
-        self.opportunity_repo: Optional[OpportunityRepository] = None
-        self.execution_repo: Optional[ExecutionRepository] = None
-        self.stats_repo: Optional[StatsRepository] = None
-        self.gas_price_repo: Optional[GasPriceRepository] = None
-        self.alert_repo: Optional[AlertRepository] = None
-        self.chain_metric_repo: Optional[ChainMetricRepository] = None
+        self.opportunity_repo = OpportunityRepository()
+        self.execution_repo = ExecutionRepository()
+        self.stats_repo = StatsRepository()
+        self.gas_price_repo = GasPriceRepository()
+        self.alert_repo = AlertRepository()
+        self.chain_metric_repo = ChainMetricRepository()
 
         # Rate limiting state
         self.execution_rate_limit_key = "api:executions:rate_limit"
@@ -193,6 +242,17 @@ class BotState:
 
 bot_state = BotState()
 
+
+async def get_async_session() -> AsyncGenerator[Optional[AsyncSession], None]:
+    """FastAPI dependency yielding an async database session, or None if the database is unavailable"""
+    if not bot_state.db_manager.is_initialized:
+        yield None
+        return
+
+    async with bot_state.db_manager.get_session() as session:
+        yield session
+
+
 # ============================================================================
 # WEBSOCKET CONNECTION MANAGER
 # ============================================================================
@@ -201,40 +261,149 @@ bot_state = BotState()
 class ConnectionManager:
     """Manages WebSocket connections"""
 
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    # Per-client outbound queue depth; further messages are dropped for that client
+    SEND_QUEUE_SIZE = 256
+    # Clients queued per batch before yielding to the event loop during a broadcast
+    BROADCAST_CHUNK_SIZE = 50
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+    def __init__(self):
+        self.active_connections: Set[WebSocket] = set()
+        self.send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+        # Clients that asked for MessagePack binary frames instead of JSON text
+        self.msgpack_clients: Set[WebSocket] = set()
+
+    def connect(self, websocket: WebSocket, initial_message: dict, use_msgpack: bool = False):
+        """Register an accepted socket; initial_message is queued ahead of any broadcast"""
+        queue = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        if use_msgpack:
+            queue.put_nowait(msgpack.packb(initial_message))
+            self.msgpack_clients.add(websocket)
+        else:
+            queue.put_nowait(orjson.dumps(initial_message, default=str).decode())
+        self.send_queues[websocket] = queue
+        self.active_connections.add(websocket)
+        self.writer_tasks[websocket] = asyncio.create_task(self._writer(websocket))
         print(f"✓ Client connected. Total: {len(self.active_connections)}")
 
+    def send(self, websocket: WebSocket, payload: str):
+        """Queue a pre-serialized frame for one client; its writer is the only task that sends"""
+        queue = self.send_queues.get(websocket)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            print("Client send queue full, dropping message")
+
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket not in self.send_queues:
+            return
+
+        self.active_connections.discard(websocket)
+        self.msgpack_clients.discard(websocket)
+        del self.send_queues[websocket]
+        writer = self.writer_tasks.pop(websocket)
+        if writer is not asyncio.current_task():
+            writer.cancel()
         print(f"✗ Client disconnected. Total: {len(self.active_connections)}")
 
+    async def _writer(self, websocket: WebSocket):
+        """Drain a client's send queue so a slow socket only delays itself"""
+        queue = self.send_queues[websocket]
+        try:
+            while True:
+                payload = await queue.get()
+                if isinstance(payload, bytes):
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error sending to client: {e}")
+            self.disconnect(websocket)
+
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"Error sending to client: {e}")
-                dead_connections.append(connection)
+        # Serialize once for all clients; JSON goes out as a text frame
+        await self.broadcast_text(orjson.dumps(message, default=str).decode())
+
+    async def broadcast_text(self, payload: str):
+        """Queue an already-serialized JSON message for every connected client"""
+        # Re-encode once for all MessagePack clients, and only if there are any
+        packed = msgpack.packb(orjson.loads(payload)) if self.msgpack_clients else None
 
-        # Remove dead connections
-        for conn in dead_connections:
-            self.disconnect(conn)
+        connections = list(self.active_connections)
+        for start in range(0, len(connections), self.BROADCAST_CHUNK_SIZE):
+            for connection in connections[start : start + self.BROADCAST_CHUNK_SIZE]:
+                queue = self.send_queues.get(connection)
+                if queue is None:  # disconnected while we yielded
+                    continue
+                try:
+                    queue.put_nowait(packed if connection in self.msgpack_clients else payload)
+                except asyncio.QueueFull:
+                    print("Client send queue full, dropping message")
+
+            # Let writers, timers and new handshakes run between batches
+            await asyncio.sleep(0)
 
 
 manager = ConnectionManager()
 
+# Redis pub/sub channels relayed to every worker's WebSocket clients
+BROADCAST_CHANNEL = "ws:broadcast"
+EXECUTIONS_CHANNEL = "arbitrage:executions"
+
+
+async def publish_update(message: dict):
+    """Fan out a WebSocket message to clients on all workers via Redis (local broadcast if Redis is down)"""
+    if bot_state.redis_cache.redis_client is not None:
+        delivered = await bot_state.redis_cache.publish(BROADCAST_CHANNEL, orjson.dumps(message, default=str))
+        if delivered:
+            return
+
+    # No relay received it (Redis down or publish failed), so at least serve this worker's clients
+    await manager.broadcast(message)
+
+
+async def relay_pubsub_messages():
+    """Forward Redis pub/sub messages to this worker's WebSocket clients"""
+    while True:
+        try:
+            # Messages are already JSON on the wire; forward them without a decode/encode round-trip
+            async for channel, payload in bot_state.redis_cache.subscribe(
+                BROADCAST_CHANNEL, EXECUTIONS_CHANNEL, decode=False
+            ):
+                if channel == EXECUTIONS_CHANNEL:
+                    payload = '{"type":"execution_update","data":' + payload + "}"
+                await manager.broadcast_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Pub/sub relay error, resubscribing: {e}")
+
+        await asyncio.sleep(1)
+
+
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
 
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag for a response body"""
+    return f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+
+def conditional_json_response(request: Request, body: bytes, etag: str, max_age: int = 5) -> Response:
+    """Return a JSON body with caching headers, or 304 if the client already has it"""
+    headers = {"ETag": etag, "Cache-Control": f"max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/")
 async def root():
     """API health check"""
@@ -242,46 +411,27 @@ async def root():
 
 
 @app.get("/api/opportunities", response_model=List[OpportunityResponse])
-async def get_opportunities():
+async def get_opportunities(session: Optional[AsyncSession] = Depends(get_async_session)):
     """Get current arbitrage opportunities from cache/database"""
     try:
-        # Try to get from Redis cache first
-        cached_opps = await bot_state.redis_cache.get("opportunities:recent")
+        # Serve the cached JSON body as-is; it was built from the same fields as OpportunityResponse
+        cached_opps = await bot_state.redis_cache.get_raw("opportunities:recent")
         if cached_opps:
-            return json.loads(cached_opps)
+            return Response(content=cached_opps, media_type="application/json")
 
         # If cache miss, query database
-        if bot_state.opportunity_repo:
-            opps = await bot_state.opportunity_repo.get_recent(limit=50)
-
-            # Convert to response format
-            response_opps = []
-            for opp in opps:
-                response_opps.append(
-                    OpportunityResponse(
-                        id=str(opp.id),
-                        pair=opp.pair,
-                        chain=opp.chain,
-                        buyExchange=opp.buy_exchange,
-                        sellExchange=opp.sell_exchange,
-                        buyPrice=float(opp.buy_price),
-                        sellPrice=float(opp.sell_price),
-                        spread=float(opp.spread),
-                        profit=float(opp.gross_profit),
-                        gasEstimate=float(opp.gross_profit - opp.net_profit),
-                        netProfit=float(opp.net_profit),
-                        volume24h=0.0,
-                        liquidity=0.0,
-                        confidence=float(opp.confidence),
-                        risk=opp.risk_level.upper(),
-                        flashLoanAvailable=opp.flash_loan_available,
-                    )
-                )
+        if session is not None:
+            opps = await bot_state.opportunity_repo.get_recent(session, limit=50)
+
+            # Map ORM rows straight to the response schema and encode in pydantic-core
+            payload = _OPPORTUNITY_LIST_ADAPTER.dump_json(
+                _OPPORTUNITY_LIST_ADAPTER.validate_python(opps, from_attributes=True)
+            )
 
-            # Cache result for 10 seconds
-            await bot_state.redis_cache.set("opportunities:recent", json.dumps([o.dict() for o in response_opps]), ttl=10)
+            # Invalidated by NOTIFY when the engine inserts a batch; the TTL is only a backstop
+            await bot_state.redis_cache.set("opportunities:recent", payload, ttl=60)
 
-            return response_opps
+            return Response(content=payload, media_type="application/json")
 
         return []
     except Exception as e:
@@ -290,37 +440,36 @@ async def get_opportunities():
 
 
 @app.get("/api/stats", response_model=StatsResponse)
-async def get_stats():
+async def get_stats(session: Optional[AsyncSession] = Depends(get_async_session)):
     """Get bot statistics from database or cache"""
     try:
         # Try to get from Redis cache first
         cached_stats = await bot_state.redis_cache.get("bot:stats:current")
         if cached_stats:
-            stats_data = json.loads(cached_stats)
-            return StatsResponse(**stats_data)
+            return StatsResponse(**cached_stats)
 
         # Query database for latest stats
-        if bot_state.stats_repo:
-            latest_stats = await bot_state.stats_repo.get_latest()
+        if session is not None:
+            latest_stats = await bot_state.stats_repo.get_latest(session)
 
             if latest_stats:
                 stats_data = {
                     "totalPnL": float(latest_stats.total_profit),
                     "todayPnL": float(latest_stats.total_profit) * 0.1,  # Approximation
-                    "successRate": float(latest_stats.success_rate) if latest_stats.success_rate else 0.0,
+                    "successRate": latest_stats.success_rate or 0.0,
                     "totalTrades": latest_stats.trades_executed,
                     "averageProfit": float(latest_stats.avg_profit_per_trade) if latest_stats.avg_profit_per_trade else 0.0,
                     "maxDrawdown": float(latest_stats.max_drawdown) if latest_stats.max_drawdown else 0.0,
-                    "winRate": float(latest_stats.success_rate) if latest_stats.success_rate else 0.0,
+                    "winRate": latest_stats.success_rate or 0.0,
                     "avgExecutionTime": 0.0,
                     "gasEfficiency": 0.0,
-                    "sharpeRatio": float(latest_stats.sharpe_ratio) if latest_stats.sharpe_ratio else 0.0,
+                    "sharpeRatio": latest_stats.sharpe_ratio or 0.0,
                     "maxConsecutiveWins": 0,
                     "activeCapital": float(latest_stats.active_capital) if latest_stats.active_capital else 0.0,
                 }
 
                 # Cache for 5 seconds
-                await bot_state.redis_cache.set("bot:stats:current", json.dumps(stats_data), ttl=5)
+                await bot_state.redis_cache.set("bot:stats:current", orjson.dumps(stats_data), ttl=5)
 
                 return StatsResponse(**stats_data)
 
@@ -365,8 +514,8 @@ async def start_bot():
 
     bot_state.is_running = True
 
-    # Start the engine in background
-    asyncio.create_task(run_bot_engine())
+    # Start the engine in background (runs eagerly up to its first await on 3.12+)
+    bot_state.engine_task = asyncio.create_task(run_bot_engine())
 
     return {"status": "started", "message": "Bot started successfully"}
 
@@ -382,65 +531,70 @@ async def stop_bot():
     if bot_state.engine:
         bot_state.engine.stop_scanning()
 
+    # The engine loop sleeps on its opportunity queue, so wake it by cancelling
+    if bot_state.engine_task:
+        bot_state.engine_task.cancel()
+
     return {"status": "stopped", "message": "Bot stopped successfully"}
 
 
 @app.post("/api/execute")
-async def execute_arbitrage(request: ExecutionRequest):
+async def execute_arbitrage(request: ExecutionRequest, session: Optional[AsyncSession] = Depends(get_async_session)):
     """Execute an arbitrage opportunity with rate limiting"""
 
-    # Check rate limit
     try:
-        is_allowed = await bot_state.redis_cache.rate_limit(
-            bot_state.execution_rate_limit_key, max_requests=bot_state.max_executions_per_minute, window_seconds=60
+        rate_check = bot_state.redis_cache.rate_limit(
+            bot_state.execution_rate_limit_key,
+            max_requests=bot_state.max_executions_per_minute,
+            window_seconds=60,
         )
 
+        # The rate limit applies even when the database is down
+        if session is None:
+            is_allowed, opp = await rate_check, None
+        else:
+            # Check the rate limit and look up the opportunity concurrently
+            is_allowed, opp = await asyncio.gather(
+                rate_check, bot_state.opportunity_repo.get_by_id(session, request.opportunity_id)
+            )
+
         if not is_allowed:
             raise HTTPException(
-                status_code=429, detail=f"Rate limit exceeded. Max {bot_state.max_executions_per_minute} executions per minute"
+                status_code=429,
+                detail=f"Rate limit exceeded. Max {bot_state.max_executions_per_minute} executions per minute",
             )
-    except Exception as e:
-        logger.warning(f"Rate limit check failed, allowing request: {e}")
-
-    # Find the opportunity in database
-    try:
-        if bot_state.opportunity_repo:
-            opp = await bot_state.opportunity_repo.get_by_id(int(request.opportunity_id))
 
+        if session is not None:
             if not opp:
                 raise HTTPException(status_code=404, detail="Opportunity not found")
 
-            # Create execution record
+            # Simulated result
+            tx_hash = "0x" + "1234567890abcdef" * 4
+
+            # Record the execution with its final status in a single INSERT ... RETURNING
             execution = await bot_state.execution_repo.create(
-                opportunity_id=request.opportunity_id,
-                chain=opp.chain,
-                status="pending",
-                tx_hash=None,
-                block_number=None,
-                gas_used=None,
-                gas_price=None,
-                actual_profit=None,
-                slippage=request.slippage_tolerance,
-                error_message=None,
-                executed_at=datetime.utcnow(),
+                session,
+                {
+                    "opportunity_id": request.opportunity_id,
+                    "chain": opp.chain,
+                    "status": ExecutionStatus.SUCCESS,
+                    "tx_hash": tx_hash,
+                    "gas_used": 250000,
+                    "actual_profit": opp.net_profit,
+                    "slippage": request.slippage_tolerance,
+                },
             )
 
-            # Simulated result
             result = {
                 "success": True,
                 "profit": float(opp.net_profit),
-                "gas_used": 250000,
-                "tx_hash": "0x" + "1234567890abcdef" * 4,
+                "gas_used": execution.gas_used,
+                "tx_hash": tx_hash,
                 "execution_id": execution.id,
             }
 
-            # Update execution status
-            await bot_state.execution_repo.update_status(
-                execution.id, "success", tx_hash=result["tx_hash"], actual_profit=float(opp.net_profit)
-            )
-
             # Publish execution event to Redis pub/sub for WebSocket broadcast
-            await bot_state.redis_cache.publish("arbitrage:executions", json.dumps(result))
+            await bot_state.redis_cache.publish(EXECUTIONS_CHANNEL, orjson.dumps(result))
 
             return result
 
@@ -452,50 +606,31 @@ async def execute_arbitrage(request: ExecutionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Static chain status served by /api/chains, encoded once at import time
+_CHAIN_STATUS_PAYLOAD: List[Dict] = [
+    {"name": "Ethereum", "status": "online", "trades": 420, "gas": 45, "latency": 12},
+    {"name": "Polygon", "status": "online", "trades": 380, "gas": 120, "latency": 8},
+    {"name": "Arbitrum", "status": "online", "trades": 290, "gas": 0, "latency": 10},
+    {"name": "BSC", "status": "online", "trades": 210, "gas": 3, "latency": 15},
+    {"name": "Avalanche", "status": "online", "trades": 145, "gas": 25, "latency": 18},
+    {"name": "Base", "status": "online", "trades": 95, "gas": 0, "latency": 9},
+]
+_CHAIN_STATUS_BODY = orjson.dumps(_CHAIN_STATUS_PAYLOAD)
+_CHAIN_STATUS_ETAG = make_etag(_CHAIN_STATUS_BODY)
+
+
 @app.get("/api/chains", response_model=List[ChainStatus])
-async def get_chain_status():
+async def get_chain_status(request: Request):
     """Get status of all blockchain networks"""
-    chains = [
-        {
-            "name": "Ethereum",
-            "status": "online",
-            "trades": 420,
-            "gas": 45,
-            "latency": 12,
-        },
-        {
-            "name": "Polygon",
-            "status": "online",
-            "trades": 380,
-            "gas": 120,
-            "latency": 8,
-        },
-        {
-            "name": "Arbitrum",
-            "status": "online",
-            "trades": 290,
-            "gas": 0,
-            "latency": 10,
-        },
-        {"name": "BSC", "status": "online", "trades": 210, "gas": 3, "latency": 15},
-        {
-            "name": "Avalanche",
-            "status": "online",
-            "trades": 145,
-            "gas": 25,
-            "latency": 18,
-        },
-        {"name": "Base", "status": "online", "trades": 95, "gas": 0, "latency": 9},
-    ]
-    return chains
+    return conditional_json_response(request, _CHAIN_STATUS_BODY, _CHAIN_STATUS_ETAG)
 
 
 @app.get("/api/executions")
-async def get_executions(limit: int = 50, offset: int = 0):
+async def get_executions(limit: int = 50, offset: int = 0, session: Optional[AsyncSession] = Depends(get_async_session)):
     """Get recent executions from database"""
     try:
-        if bot_state.execution_repo:
-            executions = await bot_state.execution_repo.get_recent(limit=limit)
+        if session is not None:
+            executions = await bot_state.execution_repo.get_recent(session, limit=limit)
 
             result = []
             for exec_record in executions:
@@ -504,7 +639,7 @@ async def get_executions(limit: int = 50, offset: int = 0):
                         "id": exec_record.id,
                         "opportunityId": exec_record.opportunity_id,
                         "chain": exec_record.chain,
-                        "status": exec_record.status,
+                        "status": exec_record.status.value,
                         "txHash": exec_record.tx_hash,
                         "profit": float(exec_record.actual_profit) if exec_record.actual_profit else 0.0,
                         "gasUsed": exec_record.gas_used,
@@ -522,21 +657,25 @@ async def get_executions(limit: int = 50, offset: int = 0):
 
 
 @app.get("/api/alerts")
-async def get_alerts(limit: int = 50, acknowledged: Optional[bool] = False):
+async def get_alerts(
+    limit: int = 50,
+    acknowledged: Optional[bool] = False,
+    session: Optional[AsyncSession] = Depends(get_async_session),
+):
     """Get alerts from database"""
     try:
-        if bot_state.alert_repo:
+        if session is not None:
             if acknowledged:
-                alerts = await bot_state.alert_repo.get_recent(limit=limit)
+                alerts = await bot_state.alert_repo.get_recent(session, limit=limit)
             else:
-                alerts = await bot_state.alert_repo.get_unacknowledged(limit=limit)
+                alerts = await bot_state.alert_repo.get_unacknowledged(session, limit=limit)
 
             result = []
             for alert in alerts:
                 result.append(
                     {
                         "id": alert.id,
-                        "severity": alert.severity,
+                        "severity": alert.severity.value,
                         "category": alert.category,
                         "chain": alert.chain,
                         "message": alert.message,
@@ -555,29 +694,23 @@ async def get_alerts(limit: int = 50, acknowledged: Optional[bool] = False):
 
 
 @app.get("/api/gas-prices", response_model=List[GasPriceData])
-async def get_gas_prices():
+async def get_gas_prices(request: Request):
     """Get historical gas prices"""
     # This would come from your actual monitoring
-    import time
-
     current_time = time.strftime("%H:%M")
 
-    return [
-        {"time": current_time, "eth": 45, "polygon": 120, "arbitrum": 0.15, "bsc": 3},
-    ]
-
-
-@app.get("/api/gas-prices", response_model=List[GasPriceData])
-async def get_gas_prices():
-    """Get historical gas prices"""
-    # This would come from your actual monitoring
-    import time
+    body = orjson.dumps(
+        [
+            {"time": current_time, "eth": 45, "polygon": 120, "arbitrum": 0.15, "bsc": 3},
+        ]
+    )
+    return conditional_json_response(request, body, make_etag(body))
 
-    current_time = time.strftime("%H:%M")
 
-    return [
-        {"time": current_time, "eth": 45, "polygon": 120, "arbitrum": 0.15, "bsc": 3},
-    ]
+@app.get("/api/db/pool")
+async def get_db_pool_status():
+    """Get database connection pool diagnostics"""
+    return bot_state.db_manager.pool_status()
 
 
 # ============================================================================
@@ -585,12 +718,30 @@ async def get_gas_prices():
 # ============================================================================
 
 
+def get_cached_health_response(key: str) -> Optional[APIModel]:
+    """Get a health response built within the last health_cache_ttl seconds"""
+    entry = bot_state.health_response_cache.get(key)
+    if entry and time.monotonic() - entry[0] < bot_state.health_cache_ttl:
+        return entry[1]
+    return None
+
+
+def cache_health_response(key: str, response: APIModel) -> APIModel:
+    """Store a health response for reuse by pollers within the TTL"""
+    bot_state.health_response_cache[key] = (time.monotonic(), response)
+    return response
+
+
 @app.get("/api/nodes/health", response_model=NodesHealthSummary)
 async def get_nodes_health():
     """Get health status of all monitored blockchain nodes"""
     if not bot_state.engine or not bot_state.engine.health_monitor:
         raise HTTPException(status_code=503, detail="Health monitor not available - engine not running")
 
+    cached = get_cached_health_response("nodes")
+    if cached:
+        return cached
+
     health = bot_state.engine.health_monitor.get_health_summary()
 
     chains_data = {}
@@ -606,10 +757,13 @@ async def get_nodes_health():
             consecutive_failures=metrics.consecutive_failures,
         )
 
-    return NodesHealthSummary(
-        timestamp=health.timestamp.isoformat(),
-        overall_status=health.overall_status.value,
-        chains=chains_data,
+    return cache_health_response(
+        "nodes",
+        NodesHealthSummary(
+            timestamp=health.timestamp.isoformat(),
+            overall_status=health.overall_status.value,
+            chains=chains_data,
+        ),
     )
 
 
@@ -624,6 +778,11 @@ async def get_chain_metrics(
     if not bot_state.engine or not bot_state.engine.health_monitor:
         raise HTTPException(status_code=503, detail="Health monitor not available - engine not running")
 
+    cache_key = f"chain:{chain}"
+    cached = get_cached_health_response(cache_key)
+    if cached:
+        return cached
+
     health = bot_state.engine.health_monitor.get_health_summary()
 
     if chain not in health.chains:
@@ -636,17 +795,20 @@ async def get_chain_metrics(
 
     # Calculate time since last check
     time_since_check = 0
-    if metrics.last_check:
-        time_since_check = int((datetime.now() - metrics.last_check.replace(tzinfo=None)).total_seconds())
-
-    return ChainMetricsResponse(
-        chain=chain,
-        status=metrics.status.value,
-        block_number=metrics.block_number,
-        peer_count=metrics.peer_count,
-        syncing=metrics.is_syncing,
-        uptime_percent=uptime,
-        last_check_age_seconds=time_since_check,
+    if metrics.last_check_ts:
+        time_since_check = int(time.time() - metrics.last_check_ts)
+
+    return cache_health_response(
+        cache_key,
+        ChainMetricsResponse(
+            chain=chain,
+            status=metrics.status.value,
+            block_number=metrics.block_number,
+            peer_count=metrics.peer_count,
+            syncing=metrics.is_syncing,
+            uptime_percent=uptime,
+            last_check_age_seconds=time_since_check,
+        ),
     )
 
 
@@ -675,42 +837,50 @@ async def get_nodes_config():
 # WEBSOCKET ENDPOINT
 # ============================================================================
 
+PING_FRAME = '{"type":"ping"}'
+PONG_FRAME = '{"type":"pong"}'
+
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time updates"""
-    await manager.connect(websocket)
+    """WebSocket endpoint for real-time updates (connect with ?format=msgpack for binary frames)"""
+    use_msgpack = websocket.query_params.get("format") == "msgpack"
+    await websocket.accept()
 
     try:
-        # Send initial state
-        await websocket.send_json(
-            {
-                "type": "initial_state",
-                "data": {
-                    "is_running": bot_state.is_running,
-                    "opportunities": bot_state.opportunities,
-                    "stats": bot_state.stats,
-                },
-            }
-        )
+        # Replay recent opportunities from the shared stream; fall back to this worker's copy
+        opportunities = await bot_state.redis_cache.stream_latest(OPPORTUNITY_STREAM, count=20)
+
+        # Initial state is queued first, so it always reaches the client before any broadcast;
+        # no await between the snapshot and registration, so no update falls in between
+        initial_state = {
+            "type": "initial_state",
+            "data": {
+                "is_running": bot_state.is_running,
+                "opportunities": opportunities or bot_state.opportunities,
+                "stats": bot_state.stats,
+            },
+        }
+        manager.connect(websocket, initial_state, use_msgpack=use_msgpack)
 
         # Keep connection alive and listen for messages
-        while True:
-            try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
+        async for data in websocket.iter_text():
+            # Heartbeats arrive verbatim; answer them without parsing JSON
+            if data == PING_FRAME:
+                manager.send(websocket, PONG_FRAME)
+                continue
 
-                # Handle different message types
-                if message.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
+            message = orjson.loads(data)
 
-            except asyncio.TimeoutError:
-                continue
+            # Handle different message types
+            if message.get("type") == "ping":
+                manager.send(websocket, PONG_FRAME)
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except Exception as e:
         print(f"WebSocket error: {e}")
+    finally:
         manager.disconnect(websocket)
 
 
@@ -732,8 +902,6 @@ async def run_bot_engine():
             bot_state.is_running = False
             return
 
-        from infrastructure import NodeConfig
-
         node_config = NodeConfig.from_yaml(config_file)
 
         # Create and initialize engine
@@ -745,49 +913,44 @@ async def run_bot_engine():
 
         logger.info("✓ Engine initialized")
 
-        while bot_state.is_running:
-            try:
-                # TODO: Get real opportunities from engine
-                # opportunities = await bot_state.engine.arbitrage_detector.scan_all_chains()
-
-                # Simulated opportunities for now
-                opportunities = generate_mock_opportunities()
-                bot_state.opportunities = opportunities
-
-                # Broadcast opportunities update
-                await manager.broadcast({"type": "opportunities_update", "data": opportunities})
-
-                # Broadcast stats
-                await manager.broadcast({"type": "stats_update", "data": bot_state.stats})
-
-                # Broadcast health status if available
-                if bot_state.engine.health_monitor:
-                    health = bot_state.engine.health_monitor.get_health_summary()
-                    bot_state.last_health_update = health
-
-                    health_data = {
-                        "timestamp": health.timestamp.isoformat(),
-                        "overall_status": health.overall_status.value,
-                        "chains": {
-                            k: {
-                                "status": v.status.value,
-                                "block_number": v.block_number,
-                                "peer_count": v.peer_count,
-                                "is_syncing": v.is_syncing,
-                                "consecutive_failures": v.consecutive_failures,
-                            }
-                            for k, v in health.chains.items()
-                        },
+        # The dashboard is fed simulated opportunities through the engine's queue,
+        # the same queue ArbitrageEngine.start_scanning publishes to
+        queue = bot_state.engine.opportunity_queue
+        background_tasks = [
+            asyncio.create_task(produce_mock_opportunities()),
+            asyncio.create_task(broadcast_health_heartbeat()),
+        ]
+
+        try:
+            while bot_state.is_running:
+                try:
+                    # Wake only when the detector has something new, then coalesce any burst
+                    opportunities = await queue.get()
+                    while not queue.empty():
+                        opportunities = queue.get_nowait()
+
+                    bot_state.opportunities = opportunities
+                    bot_state.stats = {
+                        k: float(v) if isinstance(v, Decimal) else v for k, v in bot_state.engine.stats.items()
                     }
 
-                    await manager.broadcast({"type": "node_health_update", "data": health_data})
+                    # Keep a replayable history for reconnecting clients and other workers
+                    await bot_state.redis_cache.stream_opportunities(opportunities)
 
-                # Wait before next scan
-                await asyncio.sleep(5)
+                    # Broadcast opportunities and stats as a single frame per client
+                    await publish_update(
+                        {
+                            "type": "tick",
+                            "opportunities": opportunities,
+                            "stats": bot_state.stats,
+                        }
+                    )
 
-            except Exception as e:
-                logger.error(f"Error in bot engine loop: {e}")
-                await asyncio.sleep(5)
+                except Exception as e:
+                    logger.error(f"Error in bot engine loop: {e}")
+        finally:
+            for task in background_tasks:
+                task.cancel()
 
     except Exception as e:
         logger.error(f"Fatal error starting engine: {e}")
@@ -799,53 +962,97 @@ async def run_bot_engine():
         bot_state.is_running = False
 
 
-def generate_mock_opportunities() -> List[Dict]:
-    """Generate mock opportunities for testing"""
-    import random
+async def produce_mock_opportunities(interval: float = 5.0):
+    """Stand in for the detector by pushing simulated opportunities onto the engine queue"""
+    while bot_state.is_running:
+        bot_state.engine.publish_opportunities(generate_mock_opportunities())
+        await asyncio.sleep(interval)
 
-    pairs = ["ETH/USDT", "BTC/USDC", "MATIC/USDT", "AVAX/USDT", "ARB/USDC"]
-    chains = ["Ethereum", "Polygon", "Arbitrum", "BSC", "Avalanche"]
-    exchanges = ["Uniswap V3", "SushiSwap", "PancakeSwap", "QuickSwap", "Camelot"]
 
-    opportunities = []
+async def broadcast_health_heartbeat(interval: float = 10.0):
+    """Periodically broadcast node health, only when it changed since the last broadcast"""
+    last_version = None
 
-    for i in range(5):
-        pair = random.choice(pairs)
-        chain = random.choice(chains)
-        buy_ex = random.choice(exchanges)
-        sell_ex = random.choice([e for e in exchanges if e != buy_ex])
+    while bot_state.is_running:
+        try:
+            monitor = bot_state.engine.health_monitor
+            if monitor and monitor.version != last_version:
+                last_version = monitor.version
+                bot_state.last_health_update = monitor.get_health_summary()
+                await publish_update({"type": "node_health_update", "data": monitor.health_dict})
+        except Exception as e:
+            logger.error(f"Error broadcasting health heartbeat: {e}")
 
-        buy_price = 3250 + random.uniform(-50, 50)
-        spread = random.uniform(0.05, 0.5)
-        sell_price = buy_price * (1 + spread / 100)
+        await asyncio.sleep(interval)
 
-        gross_profit = spread * 10
-        gas_cost = random.uniform(10, 50)
-        net_profit = gross_profit - gas_cost
 
-        if net_profit > 0:
-            opportunities.append(
-                {
-                    "id": f"{chain}_{pair}_{int(datetime.now().timestamp())}_{i}",
-                    "pair": pair,
-                    "chain": chain,
-                    "buyExchange": buy_ex,
-                    "sellExchange": sell_ex,
-                    "buyPrice": round(buy_price, 4),
-                    "sellPrice": round(sell_price, 4),
-                    "spread": round(spread, 2),
-                    "profit": round(gross_profit, 2),
-                    "gasEstimate": round(gas_cost, 2),
-                    "netProfit": round(net_profit, 2),
-                    "volume24h": random.uniform(500000, 5000000),
-                    "liquidity": random.uniform(200000, 2000000),
-                    "confidence": random.uniform(75, 99),
-                    "risk": random.choice(["Low", "Medium", "High"]),
-                    "flashLoanAvailable": True,
-                }
-            )
+MOCK_PAIRS = ["ETH/USDT", "BTC/USDC", "MATIC/USDT", "AVAX/USDT", "ARB/USDC"]
+MOCK_CHAINS = ["Ethereum", "Polygon", "Arbitrum", "BSC", "Avalanche"]
+MOCK_EXCHANGES = ["Uniswap V3", "SushiSwap", "PancakeSwap", "QuickSwap", "Camelot"]
+MOCK_RISKS = ["Low", "Medium", "High"]
 
-    return opportunities
+_mock_rng = np.random.default_rng()
+_mock_id_seq = itertools.count()
+
+
+def generate_mock_opportunities(count: int = 5) -> List[Dict]:
+    """Generate mock opportunities for testing"""
+    rng = _mock_rng
+
+    # Draw every random field for the whole batch at once
+    pair_idx = rng.integers(len(MOCK_PAIRS), size=count)
+    chain_idx = rng.integers(len(MOCK_CHAINS), size=count)
+    buy_idx = rng.integers(len(MOCK_EXCHANGES), size=count)
+    # Offset by 1..n-1 so the sell exchange always differs from the buy exchange
+    sell_idx = (buy_idx + rng.integers(1, len(MOCK_EXCHANGES), size=count)) % len(MOCK_EXCHANGES)
+    risk_idx = rng.integers(len(MOCK_RISKS), size=count)
+
+    buy_prices = 3250 + rng.uniform(-50, 50, count)
+    spreads = rng.uniform(0.05, 0.5, count)
+    sell_prices = buy_prices * (1 + spreads / 100)
+
+    gross_profits = spreads * 100  # spread % on a $10k notional
+    gas_costs = rng.uniform(10, 50, count)
+    net_profits = gross_profits - gas_costs
+
+    volumes = rng.uniform(500000, 5000000, count).tolist()
+    liquidities = rng.uniform(200000, 2000000, count).tolist()
+    confidences = rng.uniform(75, 99, count).tolist()
+
+    # Round in bulk and hand back plain Python values so orjson can encode them
+    buy_prices = np.round(buy_prices, 4).tolist()
+    sell_prices = np.round(sell_prices, 4).tolist()
+    profitable = np.flatnonzero(net_profits > 0).tolist()
+    spreads = np.round(spreads, 2).tolist()
+    gross_profits = np.round(gross_profits, 2).tolist()
+    gas_costs = np.round(gas_costs, 2).tolist()
+    net_profits = np.round(net_profits, 2).tolist()
+    pair_idx, chain_idx = pair_idx.tolist(), chain_idx.tolist()
+    buy_idx, sell_idx, risk_idx = buy_idx.tolist(), sell_idx.tolist(), risk_idx.tolist()
+
+    timestamp = time.time_ns()
+
+    return [
+        {
+            "id": f"{MOCK_CHAINS[chain_idx[i]]}_{MOCK_PAIRS[pair_idx[i]]}_{timestamp}_{next(_mock_id_seq)}",
+            "pair": MOCK_PAIRS[pair_idx[i]],
+            "chain": MOCK_CHAINS[chain_idx[i]],
+            "buyExchange": MOCK_EXCHANGES[buy_idx[i]],
+            "sellExchange": MOCK_EXCHANGES[sell_idx[i]],
+            "buyPrice": buy_prices[i],
+            "sellPrice": sell_prices[i],
+            "spread": spreads[i],
+            "profit": gross_profits[i],
+            "gasEstimate": gas_costs[i],
+            "netProfit": net_profits[i],
+            "volume24h": volumes[i],
+            "liquidity": liquidities[i],
+            "confidence": confidences[i],
+            "risk": MOCK_RISKS[risk_idx[i]],
+            "flashLoanAvailable": True,
+        }
+        for i in profitable
+    ]
 
 
 # ============================================================================
@@ -853,9 +1060,31 @@ def generate_mock_opportunities() -> List[Dict]:
 # ============================================================================
 
 
+# Keep references so fire-and-forget tasks are not garbage collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _forget_background_task(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background task failed: {task.exception()}")
+
+
+def on_opportunities_inserted(batch_id: str):
+    """Drop the cached /api/opportunities body so the next request reads the new batch"""
+    task = asyncio.create_task(bot_state.redis_cache.delete("opportunities:recent"))
+    _background_tasks.add(task)
+    task.add_done_callback(_forget_background_task)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup"""
+    # Run new tasks eagerly so coroutines that finish without suspending
+    # (e.g. cache hits) skip the scheduler round-trip. No-op before Python 3.12.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     logger.info("\n" + "=" * 60)
     logger.info("🚀 ARBITRAGE NEXUS API SERVER (v5.0)")
     logger.info("=" * 60)
@@ -865,6 +1094,21 @@ async def startup_event():
     logger.info("Health Check: http://localhost:8000/api/nodes/health")
     logger.info("=" * 60 + "\n")
 
+    # Connect the async database engine used by request-scoped sessions
+    try:
+        await bot_state.db_manager.initialize()
+        await bot_state.db_manager.warm_pool()
+        await bot_state.db_manager.listen(OPPORTUNITY_CHANNEL, on_opportunities_inserted)
+    except Exception as e:
+        logger.warning(f"⚠️  Database unavailable (continuing without persistence): {e}")
+
+    # Connect Redis and relay pub/sub messages to this worker's WebSocket clients
+    try:
+        await bot_state.redis_cache.initialize()
+        bot_state.pubsub_task = asyncio.create_task(relay_pubsub_messages())
+    except Exception as e:
+        logger.warning(f"⚠️  Redis unavailable (broadcasting to local clients only): {e}")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -875,6 +1119,15 @@ async def shutdown_event():
         bot_state.is_running = False
         await bot_state.engine.cleanup()
 
+    if bot_state.engine_task:
+        bot_state.engine_task.cancel()
+
+    if bot_state.pubsub_task:
+        bot_state.pubsub_task.cancel()
+
+    await bot_state.redis_cache.close()
+    await bot_state.db_manager.close()
+
     logger.info("✓ Server shutdown complete\n")
 
 
@@ -891,4 +1144,5 @@ if __name__ == "__main__":
         port=8000,
         reload=True,  # Auto-reload on code changes
         log_level="info",
+        ws_per_message_deflate=True,
     )
@@ -5,17 +5,25 @@ Complete backend infrastructure for the Arbitrage Nexus dashboard
 """
 
 import asyncio
-import json
+import heapq
+import itertools
 import logging
+import logging.handlers
 import os
+import queue
+import signal
+import sys
 import time
-from collections import defaultdict
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import aiohttp
+import numpy as np
+from cachetools import TTLCache
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
 from web3 import Web3
 
 from database.cache import get_redis_cache
@@ -47,7 +55,7 @@ CHAIN_METADATA = {
     "base": {"aave_pool_provider": "0xe20fCBdBfFC4Dd138cE8b2E6FBb6CB49777ad64D"},
 }
 
-DEX_ROUTERS = {
+_RAW_DEX_ROUTERS = {
     "ethereum": {
         "uniswap_v3": "0xe592427a0aece92de3edee1f18e0157c05861564",
         "uniswap_v2": "0x7a250d5630b4cf539739df2c5dacb4c659f2488d",
@@ -95,7 +103,7 @@ TRADING_PAIRS = [
 ]
 
 # Token addresses (example for Ethereum - need to add for each chain)
-TOKEN_ADDRESSES = {
+_RAW_TOKEN_ADDRESSES = {
     "ethereum": {
         "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
         "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
@@ -105,12 +113,44 @@ TOKEN_ADDRESSES = {
     # Add other chains...
 }
 
+# Checksum every address once at import so calls don't re-hash them
+DEX_ROUTERS = {
+    chain: {dex: Web3.to_checksum_address(address) for dex, address in routers.items()}
+    for chain, routers in _RAW_DEX_ROUTERS.items()
+}
+TOKEN_ADDRESSES = {
+    chain: {token: Web3.to_checksum_address(address) for token, address in tokens.items()}
+    for chain, tokens in _RAW_TOKEN_ADDRESSES.items()
+}
+
+TOKEN_DECIMALS = {
+    "ethereum": {"WETH": 18, "USDT": 6, "USDC": 6, "WBTC": 8},
+}
+
+# Per-process sequence appended to opportunity ids so ids within one nanosecond tick stay unique
+_opportunity_seq = itertools.count()
+
+# Net profit (USD) above which an opportunity is published before the full scan completes
+FAST_PATH_THRESHOLD = 500.0
+
+# Risk codes produced by ArbitrageDetector.assess_risk_batch
+RISK_LABELS = ("Low", "Medium", "High")
+RISK_LEVELS = {label: RiskLevel(label.lower()) for label in RISK_LABELS}
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+GET_AMOUNTS_OUT_SELECTOR = bytes.fromhex("d06ca61f")  # getAmountsOut(uint256,address[])
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
+# Slotted dataclasses drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PriceQuote:
     """Price quote from a DEX"""
 
@@ -118,15 +158,15 @@ class PriceQuote:
     dex: str
     token_in: str
     token_out: str
-    amount_in: Decimal
-    amount_out: Decimal
-    price: Decimal
+    amount_in: float
+    amount_out: float
+    price: float
     timestamp: float
-    gas_estimate: Decimal
-    liquidity: Decimal
+    gas_estimate: float
+    liquidity: float
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ArbitrageOpportunity:
     """Arbitrage opportunity between two DEXs"""
 
@@ -135,39 +175,44 @@ class ArbitrageOpportunity:
     pair: str
     buy_exchange: str
     sell_exchange: str
-    buy_price: Decimal
-    sell_price: Decimal
-    spread_percent: Decimal
-    gross_profit: Decimal
-    gas_cost: Decimal
-    net_profit: Decimal
-    volume_24h: Decimal
-    liquidity: Decimal
+    buy_price: float
+    sell_price: float
+    spread_percent: float
+    gross_profit: float
+    gas_cost: float
+    net_profit: float
+    volume_24h: float
+    liquidity: float
     confidence: float
     risk_level: str
     flash_loan_available: bool
     timestamp: float
+    _dict_cache: Optional[dict] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization"""
-        return {
+        """Convert to dictionary for JSON serialization (built once, then reused)"""
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        self._dict_cache = {
             "id": self.id,
             "pair": self.pair,
             "chain": self.chain,
             "buyExchange": self.buy_exchange,
             "sellExchange": self.sell_exchange,
-            "buyPrice": float(self.buy_price),
-            "sellPrice": float(self.sell_price),
-            "spread": float(self.spread_percent),
-            "profit": float(self.gross_profit),
-            "gasEstimate": float(self.gas_cost),
-            "netProfit": float(self.net_profit),
-            "volume24h": float(self.volume_24h),
-            "liquidity": float(self.liquidity),
+            "buyPrice": self.buy_price,
+            "sellPrice": self.sell_price,
+            "spread": self.spread_percent,
+            "profit": self.gross_profit,
+            "gasEstimate": self.gas_cost,
+            "netProfit": self.net_profit,
+            "volume24h": self.volume_24h,
+            "liquidity": self.liquidity,
             "confidence": self.confidence,
             "risk": self.risk_level,
             "flashLoanAvailable": self.flash_loan_available,
         }
+        return self._dict_cache
 
 
 # ============================================================================
@@ -186,25 +231,75 @@ class PriceFetcher:
 
     def __init__(self, blockchain_manager: EnhancedBlockchainManager):
         self.blockchain_manager = blockchain_manager
-        self.price_cache = defaultdict(dict)
         self.cache_ttl = 5  # seconds
+        # Bounded cache keyed by (chain, dex, token_in, token_out); entries expire cache_ttl seconds
+        # after insertion. dex is None for a pair's full list of multicall quotes.
+        self.price_cache: TTLCache = TTLCache(maxsize=4096, ttl=self.cache_ttl)
+        # Gas only changes per block: chain -> (block_number, gas cost, monotonic time checked)
+        self._gas_cache: Dict[str, Tuple[int, float, float]] = {}
+        self._gas_locks: Dict[str, asyncio.Lock] = {}
+        self.gas_recheck_interval = 1.0  # seconds before asking the node for a new block number
+        # Resolved Web3 clients per chain, plus a retry time for chains whose endpoints are all down
+        self._web3: Dict[str, Any] = {}
+        self._web3_retry_at: Dict[str, float] = {}
+        self.web3_retry_backoff = 5.0  # seconds
+
+    async def _get_web3(self, chain: str):
+        """Resolve (and keep) the chain's Web3 client instead of re-checking endpoints per quote"""
+        w3 = self._web3.get(chain)
+        if w3 is not None:
+            return w3
+
+        if time.monotonic() < self._web3_retry_at.get(chain, 0.0):
+            raise NoHealthyEndpointsError(f"Endpoints for {chain} recently failed, backing off")
+
+        try:
+            w3 = await self.blockchain_manager.get_http_web3(chain)
+        except NoHealthyEndpointsError:
+            self._web3_retry_at[chain] = time.monotonic() + self.web3_retry_backoff
+            raise
+
+        self._web3[chain] = w3
+        return w3
+
+    async def get_gas_estimate(self, chain: str, w3) -> float:
+        """Gas cost estimate for a chain, re-estimated only when a new block arrives"""
+        cached = self._gas_cache.get(chain)
+        if cached and time.monotonic() - cached[2] < self.gas_recheck_interval:
+            return cached[1]
+
+        lock = self._gas_locks.setdefault(chain, asyncio.Lock())
+        async with lock:
+            # Another quote may have refreshed the entry while we waited
+            cached = self._gas_cache.get(chain)
+            now = time.monotonic()
+            if cached and now - cached[2] < self.gas_recheck_interval:
+                return cached[1]
+
+            block_number = await w3.eth.block_number
+            if cached and cached[0] == block_number:
+                gas_cost = cached[1]
+            else:
+                gas_cost = float(await self.blockchain_manager.estimate_gas_cost(chain))
+
+            self._gas_cache[chain] = (block_number, gas_cost, now)
+            return gas_cost
 
     async def fetch_dex_price(
-        self, chain: str, dex: str, token_in: str, token_out: str, amount_in: Decimal
+        self, chain: str, dex: str, token_in: str, token_out: str, amount_in: float
     ) -> Optional[PriceQuote]:
         """Fetch price quote from a specific DEX"""
 
         # Check cache first
-        cache_key = f"{chain}:{dex}:{token_in}:{token_out}"
-        if cache_key in self.price_cache:
-            cached_quote, timestamp = self.price_cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
-                return cached_quote
+        cache_key = (chain, dex, token_in, token_out)
+        cached_quote = self.price_cache.get(cache_key)
+        if cached_quote is not None:
+            return cached_quote
 
         try:
             # Use EnhancedBlockchainManager with proper error handling
             try:
-                w3 = await self.blockchain_manager.get_http_web3(chain)
+                w3 = await self._get_web3(chain)
             except NoHealthyEndpointsError as e:
                 logger.error(f"No healthy endpoints for {chain}: {e}")
                 return None
@@ -216,7 +311,7 @@ class PriceFetcher:
             # This would involve calling the router contract's getAmountsOut function
             # For now, returning simulated data
 
-            amount_out = amount_in * Decimal("3250")  # Simulated
+            amount_out = amount_in * 3250.0  # Simulated
             price = amount_out / amount_in
 
             quote = PriceQuote(
@@ -228,23 +323,113 @@ class PriceFetcher:
                 amount_out=amount_out,
                 price=price,
                 timestamp=time.time(),
-                gas_estimate=await self.blockchain_manager.estimate_gas_cost(chain),
-                liquidity=Decimal("1000000"),  # Simulated
+                gas_estimate=await self.get_gas_estimate(chain, w3),
+                liquidity=1_000_000.0,  # Simulated
             )
 
             # Update cache
-            self.price_cache[cache_key] = (quote, time.time())
+            self.price_cache[cache_key] = quote
 
             return quote
 
         except Exception as e:
             logger.error(f"Error fetching price from {dex} on {chain}: {e}")
+            # Re-resolve on the next call so the manager can fail over
+            self._web3.pop(chain, None)
             return None
 
+    @staticmethod
+    def supports_multicall(chain: str, pair: Tuple[str, str]) -> bool:
+        """Whether both tokens of a pair have known addresses and decimals on a chain"""
+        addresses = TOKEN_ADDRESSES.get(chain, {})
+        decimals = TOKEN_DECIMALS.get(chain, {})
+        return all(token in addresses and token in decimals for token in pair)
+
+    async def fetch_all_prices_multicall(
+        self, chain: str, pairs: List[Tuple[str, str]], amount_in: float = 1.0
+    ) -> Dict[Tuple[str, str], List[PriceQuote]]:
+        """
+        Quote every DEX router for every pair on a chain with a single Multicall3 eth_call.
+
+        Pairs without known token addresses are skipped. Sub-calls that revert (e.g. routers
+        without getAmountsOut) are dropped. Results are cached per pair for fetch_all_prices.
+        """
+        tokens = TOKEN_ADDRESSES.get(chain, {})
+        decimals = TOKEN_DECIMALS.get(chain, {})
+        pairs = [pair for pair in pairs if self.supports_multicall(chain, pair)]
+        if not pairs:
+            return {}
+
+        calls = []
+        call_keys = []
+        for token_in, token_out in pairs:
+            path = [tokens[token_in], tokens[token_out]]
+            call_data = GET_AMOUNTS_OUT_SELECTOR + abi_encode(
+                ["uint256", "address[]"], [int(amount_in * 10 ** decimals[token_in]), path]
+            )
+            for dex, router in DEX_ROUTERS.get(chain, {}).items():
+                calls.append((router, True, call_data))
+                call_keys.append((dex, token_in, token_out))
+
+        try:
+            w3 = await self._get_web3(chain)
+        except NoHealthyEndpointsError as e:
+            logger.error(f"No healthy endpoints for {chain}: {e}")
+            return {}
+
+        try:
+            raw = await w3.eth.call(
+                {
+                    "to": MULTICALL3_ADDRESS,
+                    "data": AGGREGATE3_SELECTOR + abi_encode(["(address,bool,bytes)[]"], [calls]),
+                }
+            )
+            (results,) = abi_decode(["(bool,bytes)[]"], raw)
+            gas_estimate = await self.get_gas_estimate(chain, w3)
+        except Exception as e:
+            logger.error(f"Multicall price fetch failed on {chain}: {e}")
+            self._web3.pop(chain, None)
+            return {}
+
+        now = time.time()
+        quotes: Dict[Tuple[str, str], List[PriceQuote]] = {pair: [] for pair in pairs}
+        for (dex, token_in, token_out), (success, return_data) in zip(call_keys, results):
+            if not success or not return_data:
+                continue
+
+            (amounts,) = abi_decode(["uint256[]"], return_data)
+            amount_out = amounts[-1] / 10 ** decimals[token_out]
+            quotes[(token_in, token_out)].append(
+                PriceQuote(
+                    chain=chain,
+                    dex=dex,
+                    token_in=token_in,
+                    token_out=token_out,
+                    amount_in=amount_in,
+                    amount_out=amount_out,
+                    price=amount_out / amount_in,
+                    timestamp=now,
+                    gas_estimate=gas_estimate,
+                    liquidity=1_000_000.0,  # Simulated, as in fetch_dex_price
+                )
+            )
+
+        for (token_in, token_out), pair_quotes in quotes.items():
+            self.price_cache[(chain, None, token_in, token_out)] = pair_quotes
+
+        return quotes
+
     async def fetch_all_prices(self, chain: str, pair: Tuple[str, str]) -> List[PriceQuote]:
         """Fetch prices for a pair from all DEXs on a chain"""
         token_in, token_out = pair
-        amount_in = Decimal("1")  # 1 token
+        amount_in = 1.0  # 1 token
+
+        # Pairs with on-chain addresses are quoted in bulk via Multicall3
+        if self.supports_multicall(chain, pair):
+            cached_quotes = self.price_cache.get((chain, None, token_in, token_out))
+            if cached_quotes is not None:
+                return cached_quotes
+            return (await self.fetch_all_prices_multicall(chain, [pair], amount_in)).get(pair, [])
 
         dexs = DEX_ROUTERS.get(chain, {})
         quotes = []
@@ -275,38 +460,63 @@ class ArbitrageDetector:
         self.blockchain_manager = blockchain_manager
         self.price_fetcher = price_fetcher
         self.opportunities = []
+        self.max_concurrent_scans = 32
+        self.max_concurrent_scans_per_chain = 8
 
-    def calculate_confidence(self, spread: Decimal, liquidity: Decimal, volatility: Decimal) -> float:
+    def calculate_confidence(self, spread: float, liquidity: float, volatility: float) -> float:
         """Calculate confidence score for an opportunity"""
         confidence = 50.0
 
         # Higher spread = higher confidence
-        if spread > Decimal("0.5"):
+        if spread > 0.5:
             confidence += 30
-        elif spread > Decimal("0.2"):
+        elif spread > 0.2:
             confidence += 20
-        elif spread > Decimal("0.1"):
+        elif spread > 0.1:
             confidence += 10
 
         # Higher liquidity = higher confidence
-        if liquidity > Decimal("1000000"):
+        if liquidity > 1_000_000:
             confidence += 15
-        elif liquidity > Decimal("500000"):
+        elif liquidity > 500_000:
             confidence += 10
 
         # Lower volatility = higher confidence
-        if volatility < Decimal("0.05"):
+        if volatility < 0.05:
             confidence += 5
 
         return min(99.0, confidence)
 
-    def assess_risk(self, spread: Decimal, gas_cost: Decimal, net_profit: Decimal) -> str:
+    def calculate_confidence_batch(
+        self, spread: np.ndarray, liquidity: np.ndarray, volatility: float
+    ) -> np.ndarray:
+        """Vectorized calculate_confidence over arrays of spreads and liquidities"""
+        confidence = 50.0 + np.select([spread > 0.5, spread > 0.2, spread > 0.1], [30.0, 20.0, 10.0], 0.0)
+        confidence += np.select([liquidity > 1_000_000, liquidity > 500_000], [15.0, 10.0], 0.0)
+        if volatility < 0.05:
+            confidence += 5.0
+
+        return np.minimum(confidence, 99.0)
+
+    def assess_risk_batch(self, spread: np.ndarray, gas_cost: np.ndarray, net_profit: np.ndarray) -> List[str]:
+        """Vectorized assess_risk over arrays of spreads, gas costs and net profits"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profit_margin = np.where(net_profit > 0, net_profit / (net_profit + gas_cost), 0.0)
+
+        codes = np.select(
+            [(profit_margin > 0.5) & (spread > 0.3), (profit_margin > 0.3) & (spread > 0.15)],
+            [0, 1],
+            2,
+        )
+        return [RISK_LABELS[code] for code in codes.tolist()]
+
+    def assess_risk(self, spread: float, gas_cost: float, net_profit: float) -> str:
         """Assess risk level of an opportunity"""
-        profit_margin = net_profit / (net_profit + gas_cost) if net_profit > 0 else Decimal("0")
+        profit_margin = net_profit / (net_profit + gas_cost) if net_profit > 0 else 0.0
 
-        if profit_margin > Decimal("0.5") and spread > Decimal("0.3"):
+        if profit_margin > 0.5 and spread > 0.3:
             return "Low"
-        elif profit_margin > Decimal("0.3") and spread > Decimal("0.15"):
+        elif profit_margin > 0.3 and spread > 0.15:
             return "Medium"
         else:
             return "High"
@@ -322,70 +532,126 @@ class ArbitrageDetector:
         if len(quotes) < 2:
             return []
 
+        # Pairwise matrices: row i is the buy quote, column j the sell quote
+        prices = np.fromiter((q.price for q in quotes), dtype=np.float64, count=len(quotes))
+        amounts_in = np.fromiter((q.amount_in for q in quotes), dtype=np.float64, count=len(quotes))
+        amounts_out = np.fromiter((q.amount_out for q in quotes), dtype=np.float64, count=len(quotes))
+        gas_estimates = np.fromiter((q.gas_estimate for q in quotes), dtype=np.float64, count=len(quotes))
+        liquidities = np.fromiter((q.liquidity for q in quotes), dtype=np.float64, count=len(quotes))
+
+        spread = (prices[None, :] - prices[:, None]) / prices[:, None] * 100.0
+        gas_cost = gas_estimates[:, None] + gas_estimates[None, :]
+        net_profit = (amounts_out[None, :] - amounts_in[:, None]) - gas_cost
+        liquidity = np.minimum.outer(liquidities, liquidities)
+
+        # Each unordered pair once (buy from the earlier quote), minimum 0.05% spread
+        mask = np.triu(np.ones_like(spread, dtype=bool), k=1) & (spread > 0.05) & (net_profit > min_profit)
+        buy_idx, sell_idx = np.nonzero(mask)
+        if not len(buy_idx):
+            return []
+
+        # Score every surviving pair in one pass, then convert to Python floats in bulk
+        selected_spread = spread[buy_idx, sell_idx]
+        selected_gas_cost = gas_cost[buy_idx, sell_idx]
+        selected_net_profit = net_profit[buy_idx, sell_idx]
+        selected_liquidity = liquidity[buy_idx, sell_idx]
+
+        confidences = self.calculate_confidence_batch(
+            selected_spread,
+            selected_liquidity,
+            0.1,  # Simulated volatility
+        ).tolist()
+        risk_levels = self.assess_risk_batch(selected_spread, selected_gas_cost, selected_net_profit)
+
+        now = time.time()
+        id_prefix = f"{chain}_{pair[0]}_{pair[1]}_{time.time_ns()}"
+        pair_name = f"{pair[0]}/{pair[1]}"
         opportunities = []
 
-        # Compare all quote pairs
-        for i, buy_quote in enumerate(quotes):
-            for sell_quote in quotes[i + 1 :]:
-                # Check if profitable to buy from first and sell to second
-                spread = ((sell_quote.price - buy_quote.price) / buy_quote.price) * Decimal("100")
-
-                if spread > Decimal("0.05"):  # Minimum 0.05% spread
-                    gross_profit = sell_quote.amount_out - buy_quote.amount_in
-                    gas_cost = buy_quote.gas_estimate + sell_quote.gas_estimate
-                    net_profit = gross_profit - gas_cost
-
-                    if net_profit > Decimal(str(min_profit)):
-                        confidence = self.calculate_confidence(
-                            spread,
-                            min(buy_quote.liquidity, sell_quote.liquidity),
-                            Decimal("0.1"),  # Simulated volatility
-                        )
-
-                        opp = ArbitrageOpportunity(
-                            id=f"{chain}_{pair[0]}_{pair[1]}_{int(time.time())}",
-                            chain=chain,
-                            pair=f"{pair[0]}/{pair[1]}",
-                            buy_exchange=buy_quote.dex,
-                            sell_exchange=sell_quote.dex,
-                            buy_price=buy_quote.price,
-                            sell_price=sell_quote.price,
-                            spread_percent=spread,
-                            gross_profit=gross_profit,
-                            gas_cost=gas_cost,
-                            net_profit=net_profit,
-                            volume_24h=Decimal("1000000"),  # Simulated
-                            liquidity=min(buy_quote.liquidity, sell_quote.liquidity),
-                            confidence=confidence,
-                            risk_level=self.assess_risk(spread, gas_cost, net_profit),
-                            flash_loan_available=True,
-                            timestamp=time.time(),
-                        )
-
-                        opportunities.append(opp)
+        for k, (i, j, opp_spread, opp_gas_cost, opp_net_profit, opp_liquidity) in enumerate(
+            zip(
+                buy_idx.tolist(),
+                sell_idx.tolist(),
+                selected_spread.tolist(),
+                selected_gas_cost.tolist(),
+                selected_net_profit.tolist(),
+                selected_liquidity.tolist(),
+            )
+        ):
+            buy_quote, sell_quote = quotes[i], quotes[j]
+
+            opportunities.append(
+                ArbitrageOpportunity(
+                    id=f"{id_prefix}_{next(_opportunity_seq)}",
+                    chain=chain,
+                    pair=pair_name,
+                    buy_exchange=buy_quote.dex,
+                    sell_exchange=sell_quote.dex,
+                    buy_price=buy_quote.price,
+                    sell_price=sell_quote.price,
+                    spread_percent=opp_spread,
+                    gross_profit=sell_quote.amount_out - buy_quote.amount_in,
+                    gas_cost=opp_gas_cost,
+                    net_profit=opp_net_profit,
+                    volume_24h=1_000_000.0,  # Simulated
+                    liquidity=opp_liquidity,
+                    confidence=confidences[k],
+                    risk_level=risk_levels[k],
+                    flash_loan_available=True,
+                    timestamp=now,
+                )
+            )
 
         return opportunities
 
-    async def scan_all_chains(self) -> List[ArbitrageOpportunity]:
-        """Scan all chains and pairs for opportunities"""
+    async def scan_all_chains(
+        self, on_high_value: Optional[Callable[[List[ArbitrageOpportunity]], None]] = None
+    ) -> List[ArbitrageOpportunity]:
+        """
+        Scan all chains and pairs for opportunities.
+
+        Args:
+            on_high_value: Called as soon as any (chain, pair) scan yields opportunities with
+                net profit above FAST_PATH_THRESHOLD, without waiting for slower chains
+        """
         all_opportunities = []
 
-        tasks = []
-        for chain in CHAINS_CONFIG.keys():
-            for pair in TRADING_PAIRS:
-                task = self.detect_opportunities(chain, pair)
-                tasks.append(task)
+        # Pairs on one chain share that chain's endpoints, so bound them per chain as well as overall
+        overall_sem = asyncio.Semaphore(self.max_concurrent_scans)
+        chain_sems = {
+            chain: asyncio.Semaphore(self.max_concurrent_scans_per_chain)
+            for chain in self.blockchain_manager.node_config.get_all_chains()
+        }
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def detect(chain: str, pair: Tuple[str, str]) -> List[ArbitrageOpportunity]:
+            async with overall_sem, chain_sems[chain]:
+                return await self.detect_opportunities(chain, pair)
 
-        for result in results:
-            if isinstance(result, list):
-                all_opportunities.extend(result)
+        # One Multicall3 round-trip per chain primes the quote cache for every pair it can cover
+        await asyncio.gather(
+            *(self.price_fetcher.fetch_all_prices_multicall(chain, TRADING_PAIRS) for chain in chain_sems),
+            return_exceptions=True,
+        )
 
-        # Sort by net profit descending
-        all_opportunities.sort(key=lambda x: x.net_profit, reverse=True)
+        tasks = [asyncio.ensure_future(detect(chain, pair)) for chain in chain_sems for pair in TRADING_PAIRS]
 
-        return all_opportunities[:20]  # Return top 20
+        # Drain in completion order so one slow chain doesn't hold up handling of the rest
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception as e:
+                logger.warning(f"Opportunity detection failed: {e}")
+                continue
+
+            all_opportunities.extend(result)
+
+            if on_high_value:
+                high_value = [opp for opp in result if opp.net_profit > FAST_PATH_THRESHOLD]
+                if high_value:
+                    on_high_value(high_value)
+
+        # Top 20 by net profit, descending, without sorting the whole list
+        return heapq.nlargest(20, all_opportunities, key=attrgetter("net_profit"))
 
 
 # ============================================================================
@@ -404,12 +670,21 @@ class ArbitrageEngine:
             node_config: NodeConfig object with blockchain configuration
         """
         self.node_config = node_config
+        self._chains = tuple(node_config.get_all_chains())  # Chain config is fixed for the engine's lifetime
         self.blockchain_manager = EnhancedBlockchainManager(node_config)
         self.health_monitor = NodeHealthMonitor(self.blockchain_manager)
         self.price_fetcher = PriceFetcher(self.blockchain_manager)
         self.arbitrage_detector = ArbitrageDetector(self.blockchain_manager, self.price_fetcher)
         self.is_running = False
         self.mempool_subs: Dict[str, str] = {}  # chain -> subscription_id
+        self.block_subs: Dict[str, str] = {}  # chain -> subscription_id
+        # Set by new blocks or pending txs that hit a watched router; wakes the scan loop early
+        self._scan_trigger = asyncio.Event()
+        self.watched_addresses = frozenset(
+            address.lower() for routers in DEX_ROUTERS.values() for address in routers.values()
+        )
+        # Each scan's opportunities (as dicts) are pushed here for consumers such as the API server
+        self.opportunity_queue: asyncio.Queue = asyncio.Queue(maxsize=16)
         self.stats = {
             "total_scans": 0,
             "opportunities_found": 0,
@@ -420,16 +695,35 @@ class ArbitrageEngine:
         # Database and cache managers
         self.db_manager = get_db_manager()
         self.redis_cache = get_redis_cache()
-        self.opportunity_repo = OpportunityRepository(self.db_manager)
-        self.execution_repo = ExecutionRepository(self.db_manager)
-        self.stats_repo = StatsRepository(self.db_manager)
-        self.gas_price_repo = GasPriceRepository(self.db_manager)
-        self.alert_repo = AlertRepository(self.db_manager)
-        self.chain_metric_repo = ChainMetricRepository(self.db_manager)
+        self.opportunity_repo = OpportunityRepository()
+        self.execution_repo = ExecutionRepository()
+        self.stats_repo = StatsRepository()
+        self.gas_price_repo = GasPriceRepository()
+        self.alert_repo = AlertRepository()
+        self.chain_metric_repo = ChainMetricRepository()
 
         # Tracking for stats snapshot timing
-        self.last_stats_snapshot = time.time()
+        self.last_stats_snapshot = time.monotonic()
         self.stats_snapshot_interval = 60  # Update stats every 60 seconds
+        self._stats_dirty = False  # Set whenever self.stats changes; skips no-op snapshots
+
+        # Chain metrics are buffered and flushed with one COPY per batch
+        self.chain_metric_buffer: List[dict] = []
+        self.chain_metric_flush_size = 50
+        self.chain_metric_flush_interval = 30.0
+        self.last_chain_metric_flush = time.monotonic()
+
+        # Peer counts change slowly, so net_peerCount is refreshed at most every peer_count_ttl seconds
+        self._peer_count_cache: Dict[str, Tuple[float, int]] = {}
+        self.peer_count_ttl = 30.0
+
+        # Signatures of recently persisted opportunities -> monotonic time first written;
+        # insertion-ordered, so the oldest entry is evicted first once the cap is hit
+        self._recent_opp_hashes: Dict[int, float] = {}
+        self.recent_opp_max = 10_000
+        self.recent_opp_window = 60.0
+        self.latest_cache_interval = 1.0
+        self._last_latest_cache = 0.0
 
     async def initialize(self):
         """Initialize connections and monitoring."""
@@ -454,92 +748,212 @@ class ArbitrageEngine:
         """Callback for health monitor updates."""
         logger.info(f"Health update: {health_status.overall_status.value}")
 
-    async def _persist_opportunities(self, opportunities: List[ArbitrageOpportunity]):
+    async def _persist_opportunities(
+        self, opportunities: List[ArbitrageOpportunity], now_mono: Optional[float] = None
+    ):
         """Persist opportunities to database and cache"""
         if not opportunities:
             return
+        if now_mono is None:
+            now_mono = time.monotonic()
 
         try:
-            # Persist to database
-            for opp in opportunities:
-                await self.opportunity_repo.create(
-                    opportunity_id=f"{opp.chain}_{opp.pair}_{int(time.time())}",
-                    chain=opp.chain,
-                    pair=opp.pair,
-                    buy_exchange=opp.buy_exchange,
-                    sell_exchange=opp.sell_exchange,
-                    buy_price=opp.buy_price,
-                    sell_price=opp.sell_price,
-                    spread=opp.spread_percent,
-                    gross_profit=opp.gross_profit,
-                    net_profit=opp.net_profit,
-                    confidence=opp.confidence,
-                    risk_level=opp.risk_level.lower(),
-                    flash_loan_available=getattr(opp, "flash_loan_available", False),
-                    detected_at=datetime.utcnow(),
-                )
-
-            # Cache top opportunities for quick API access
-            await self.redis_cache.cache_opportunities(opportunities)
+            # Persist to database in a single round-trip, skipping repeats of recent rows
+            detected_at = datetime.utcnow()
+            fresh = self._filter_new_opportunities(opportunities, now_mono)
+            rows = [
+                {
+                    "opportunity_id": opp.id,
+                    "chain": opp.chain,
+                    "pair": opp.pair,
+                    "buy_exchange": opp.buy_exchange,
+                    "sell_exchange": opp.sell_exchange,
+                    "buy_price": opp.buy_price,
+                    "sell_price": opp.sell_price,
+                    "spread_percent": opp.spread_percent,
+                    "gross_profit": opp.gross_profit,
+                    "gas_cost": opp.gas_cost,
+                    "net_profit": opp.net_profit,
+                    "volume_24h": opp.volume_24h,
+                    "liquidity": opp.liquidity,
+                    "confidence": opp.confidence,
+                    "risk_level": RISK_LEVELS[opp.risk_level],
+                    "flash_loan_available": opp.flash_loan_available,
+                    "detected_at": detected_at,
+                }
+                for opp in fresh
+            ]
+            if rows:
+                async with self.db_manager.get_session() as session:
+                    await self.opportunity_repo.bulk_create(session, rows)
+                    await self.opportunity_repo.notify_inserted(session, detected_at.isoformat())
+                # Only remember rows once they are committed, so a failed write is retried next scan
+                self._remember_opportunities(fresh, now_mono)
+
+            # Stream only the new opportunities; tailing consumers receive just the delta
+            if fresh:
+                await self.redis_cache.stream_opportunities([opp.to_dict() for opp in fresh])
+
+            # The full latest-snapshot key is kept for API reads, rewritten at most once per interval
+            if now_mono - self._last_latest_cache >= self.latest_cache_interval:
+                await self.redis_cache.cache_opportunities([opp.to_dict() for opp in opportunities])
+                self._last_latest_cache = now_mono
 
             logger.debug(f"✓ Persisted {len(opportunities)} opportunities to database and cache")
         except Exception as e:
             logger.warning(f"Failed to persist opportunities: {e}")
 
-    async def _update_stats_snapshot(self):
+    def _filter_new_opportunities(
+        self, opportunities: List[ArbitrageOpportunity], now: float
+    ) -> List[ArbitrageOpportunity]:
+        """Drop opportunities already persisted within recent_opp_window seconds"""
+        recent = self._recent_opp_hashes
+        batch = set()
+        fresh = []
+
+        for opp in opportunities:
+            signature = self._opportunity_signature(opp)
+            seen_at = recent.get(signature)
+            if signature in batch or (seen_at is not None and now - seen_at < self.recent_opp_window):
+                continue
+
+            batch.add(signature)
+            fresh.append(opp)
+
+        return fresh
+
+    def _remember_opportunities(self, opportunities: List[ArbitrageOpportunity], now: float):
+        """Record persisted opportunities so repeats within recent_opp_window are skipped"""
+        recent = self._recent_opp_hashes
+
+        for opp in opportunities:
+            signature = self._opportunity_signature(opp)
+            recent.pop(signature, None)
+            recent[signature] = now
+
+        while len(recent) > self.recent_opp_max:
+            del recent[next(iter(recent))]
+
+    @staticmethod
+    def _opportunity_signature(opp: ArbitrageOpportunity) -> int:
+        return hash((opp.chain, opp.pair, opp.buy_exchange, opp.sell_exchange, round(opp.spread_percent, 2)))
+
+    def publish_opportunities(self, opportunities: List[dict]):
+        """Hand a batch of opportunities to whoever is waiting on opportunity_queue"""
+        if self.opportunity_queue.full():
+            # Each batch is a full snapshot, so the stalest one is safe to drop
+            self.opportunity_queue.get_nowait()
+        self.opportunity_queue.put_nowait(opportunities)
+
+    async def _update_stats_snapshot(self, now_mono: Optional[float] = None):
         """Update statistics snapshot in database"""
+        if now_mono is None:
+            now_mono = time.monotonic()
+
         try:
-            if time.time() - self.last_stats_snapshot < self.stats_snapshot_interval:
+            if not self._stats_dirty:
+                return
+            if now_mono - self.last_stats_snapshot < self.stats_snapshot_interval:
                 return
 
-            # Create stats snapshot
-            await self.stats_repo.create_snapshot(
-                total_scans=self.stats["total_scans"],
-                opportunities_found=self.stats["opportunities_found"],
-                trades_executed=self.stats["trades_executed"],
-                successful_trades=self.stats.get("successful_trades", 0),
-                failed_trades=self.stats.get("failed_trades", 0),
-                total_profit=float(self.stats["total_profit"]),
-                gas_spent=float(self.stats.get("gas_spent", 0)),
-                net_profit=float(self.stats.get("net_profit", 0)),
-                success_rate=float(self.stats.get("success_rate", 0)),
-                avg_profit_per_trade=float(self.stats.get("avg_profit_per_trade", 0)),
-                max_drawdown=float(self.stats.get("max_drawdown", 0)),
-                sharpe_ratio=float(self.stats.get("sharpe_ratio", 0)),
-                active_capital=float(self.stats.get("active_capital", 0)),
-            )
+            # Numeric columns take the Decimal counters as-is; asyncpg encodes NUMERIC natively
+            async with self.db_manager.get_session() as session:
+                await self.stats_repo.create_snapshot(
+                    session,
+                    {
+                        "total_scans": self.stats["total_scans"],
+                        "opportunities_found": self.stats["opportunities_found"],
+                        "trades_executed": self.stats["trades_executed"],
+                        "successful_trades": self.stats.get("successful_trades", 0),
+                        "failed_trades": self.stats.get("failed_trades", 0),
+                        "total_profit": self.stats["total_profit"],
+                        "total_gas_spent": self.stats.get("gas_spent", 0),
+                        "net_profit": self.stats.get("net_profit", 0),
+                        "success_rate": self.stats.get("success_rate", 0),
+                        "avg_profit_per_trade": self.stats.get("avg_profit_per_trade", 0),
+                        "max_drawdown": self.stats.get("max_drawdown", 0),
+                        "sharpe_ratio": self.stats.get("sharpe_ratio", 0),
+                        "active_capital": self.stats.get("active_capital", 0),
+                    },
+                )
 
-            self.last_stats_snapshot = time.time()
+            self.last_stats_snapshot = now_mono
+            self._stats_dirty = False
             logger.debug("✓ Stats snapshot saved to database")
         except Exception as e:
             logger.warning(f"Failed to update stats snapshot: {e}")
 
+    async def _collect_one_chain(self, chain: str) -> Optional[dict]:
+        """Collect a chain_metrics row for one chain, or None if it has no client"""
+        w3 = await self.blockchain_manager.get_http_web3(chain)
+        if not w3:
+            return None
+
+        started = time.perf_counter()
+        block, peer_count = await asyncio.gather(w3.eth.block_number, self._get_peer_count(chain, w3))
+
+        return {
+            "chain": chain,
+            "timestamp": datetime.utcnow(),
+            "block_number": block,
+            "peer_count": peer_count,
+            "is_syncing": False,
+            "sync_progress": 100.0,
+            "response_time_ms": int((time.perf_counter() - started) * 1000),
+            "status": "healthy",
+        }
+
+    async def _get_peer_count(self, chain: str, w3) -> int:
+        """Peer count for a chain, served from cache while it is fresh"""
+        now = time.monotonic()
+        cached = self._peer_count_cache.get(chain)
+        if cached and now - cached[0] < self.peer_count_ttl:
+            return cached[1]
+
+        try:
+            peer_count = int(await w3.net.peer_count)
+        except Exception:
+            peer_count = 0  # Many hosted RPC endpoints disable net_peerCount
+
+        self._peer_count_cache[chain] = (now, peer_count)
+        return peer_count
+
     async def _record_chain_metrics(self):
         """Record chain health metrics to database"""
         try:
-            for chain in self.node_config.get_all_chains():
-                try:
-                    w3 = await self.blockchain_manager.get_http_web3(chain)
-                    if not w3:
-                        continue
-
-                    block = w3.eth.block_number
-                    peer_count = len(w3.net.peer_count) if hasattr(w3.net, "peer_count") else 0
-
-                    await self.chain_metric_repo.record(
-                        chain=chain,
-                        block_number=block,
-                        peer_count=peer_count,
-                        is_syncing=False,
-                        sync_progress=100.0,
-                        response_time_ms=0,
-                        status="healthy",
-                    )
-                except Exception as e:
-                    logger.debug(f"Could not record metrics for {chain}: {e}")
+            chains = self._chains
+            results = await asyncio.gather(
+                *[self._collect_one_chain(chain) for chain in chains],
+                return_exceptions=True,
+            )
+
+            for chain, result in zip(chains, results):
+                if isinstance(result, Exception):
+                    logger.debug(f"Could not record metrics for {chain}: {result}")
+                elif result:
+                    self.chain_metric_buffer.append(result)
+
+            if (
+                len(self.chain_metric_buffer) >= self.chain_metric_flush_size
+                or time.monotonic() - self.last_chain_metric_flush >= self.chain_metric_flush_interval
+            ):
+                await self._flush_chain_metrics()
         except Exception as e:
             logger.debug(f"Error recording chain metrics: {e}")
 
+    async def _flush_chain_metrics(self):
+        """Write buffered chain metrics to the database"""
+        rows, self.chain_metric_buffer = self.chain_metric_buffer, []
+        self.last_chain_metric_flush = time.monotonic()
+        if not rows:
+            return
+
+        try:
+            async with self.db_manager.get_session() as session:
+                await self.chain_metric_repo.bulk_record(session, rows)
+        except Exception as e:
+            logger.debug(f"Failed to flush {len(rows)} chain metrics: {e}")
+
     async def start_mempool_monitoring(self, chains: Optional[List[str]] = None):
         """
         Start monitoring mempool for pending transactions.
@@ -548,7 +962,7 @@ class ArbitrageEngine:
             chains: List of chains to monitor (defaults to all configured chains)
         """
         if not chains:
-            chains = self.node_config.get_all_chains()
+            chains = self._chains
 
         logger.info(f"Starting mempool monitoring for chains: {chains}")
 
@@ -556,6 +970,7 @@ class ArbitrageEngine:
             try:
                 sub_id = await self.blockchain_manager.subscribe_pending_transactions(chain, self._handle_pending_tx)
                 self.mempool_subs[chain] = sub_id
+                self.block_subs[chain] = await self.blockchain_manager.subscribe_new_blocks(chain, self._handle_new_block)
                 logger.info(f"✓ Mempool monitoring started for {chain}")
             except Exception as e:
                 logger.error(f"Failed to start mempool monitoring for {chain}: {e}")
@@ -563,12 +978,17 @@ class ArbitrageEngine:
     async def _handle_pending_tx(self, tx_data: Dict[str, Any]):
         """Handle pending transaction from mempool subscription."""
         try:
-            # TODO: Implement pending transaction analysis
-            # This would analyze pending transactions for MEV opportunities
+            # Only swaps routed through a DEX we price can move our opportunities
+            if (tx_data.get("to") or "").lower() in self.watched_addresses:
+                self._scan_trigger.set()
             logger.debug(f"Pending transaction: {tx_data}")
         except Exception as e:
             logger.error(f"Error handling pending transaction: {e}")
 
+    async def _handle_new_block(self, block_data: Dict[str, Any]):
+        """Handle a new block header; pool reserves may have changed, so rescan"""
+        self._scan_trigger.set()
+
     async def start_scanning(self, interval: int = 5):
         """Start continuous scanning for opportunities"""
         self.is_running = True
@@ -579,27 +999,36 @@ class ArbitrageEngine:
 
         while self.is_running:
             try:
-                start_time = time.time()
+                # One clock read per scan, shared by the post-scan throttles and the duration log
+                start_time = time.monotonic()
 
                 # Scan for opportunities
-                opportunities = await self.arbitrage_detector.scan_all_chains()
+                # High-value finds go out immediately; the ranked batch follows when all chains finish
+                opportunities = await self.arbitrage_detector.scan_all_chains(
+                    on_high_value=lambda opps: self.publish_opportunities([opp.to_dict() for opp in opps])
+                )
 
                 # Update stats
                 self.stats["total_scans"] += 1
                 self.stats["opportunities_found"] += len(opportunities)
+                self._stats_dirty = True
 
-                # Persist opportunities to database and cache
-                await self._persist_opportunities(opportunities)
-
-                # Update stats snapshot periodically
-                await self._update_stats_snapshot()
-
-                # Record chain metrics
-                await self._record_chain_metrics()
+                # Notify consumers first
+                if opportunities:
+                    self.publish_opportunities([opp.to_dict() for opp in opportunities])
+
+                # Persistence, stats snapshot and chain metrics each use their own
+                # session and handle their own errors, so overlap their DB round-trips
+                await asyncio.gather(
+                    self._persist_opportunities(opportunities, now_mono=start_time),
+                    self._update_stats_snapshot(now_mono=start_time),
+                    self._record_chain_metrics(),
+                    return_exceptions=True,
+                )
 
                 # Display results
                 logger.info(f"\n⚡ Scan #{self.stats['total_scans']} - Found {len(opportunities)} opportunities")
-                logger.info(f"⏱️  Scan time: {time.time() - start_time:.2f}s")
+                logger.info(f"⏱️  Scan time: {time.monotonic() - start_time:.2f}s")
 
                 if opportunities:
                     logger.info("\n🎯 Top Opportunities:")
@@ -610,13 +1039,14 @@ class ArbitrageEngine:
                         logger.info(f"     Spread: {opp.spread_percent:.2f}% | Net: ${opp.net_profit:.2f}")
                         logger.info(f"     Confidence: {opp.confidence:.0f}% | Risk: {opp.risk_level}")
 
-                # Wait for next scan
-                await asyncio.sleep(interval)
+                # Wait for a new block or relevant pending tx, at most one interval
+                try:
+                    await asyncio.wait_for(self._scan_trigger.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._scan_trigger.clear()
 
-            except KeyboardInterrupt:
-                logger.info("\n\n⏹️  Stopping engine...")
-                self.is_running = False
-                break
             except Exception as e:
                 logger.error(f"\n❌ Error in scan loop: {e}")
                 await asyncio.sleep(interval)
@@ -628,6 +1058,20 @@ class ArbitrageEngine:
         """Stop the scanning loop and cleanup resources."""
         logger.info("Stopping arbitrage engine...")
         self.is_running = False
+        self._scan_trigger.set()  # Wake the loop so it exits now instead of after the interval
+
+    def install_signal_handlers(self):
+        """
+        Stop scanning on SIGINT/SIGTERM so the caller's cleanup always runs.
+
+        Only for standalone use: under uvicorn the server owns the signal handlers.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop_scanning)
+            except NotImplementedError:
+                pass  # Windows event loops don't support add_signal_handler
 
     async def cleanup(self):
         """Cleanup resources - close connections and stop monitor."""
@@ -636,19 +1080,21 @@ class ArbitrageEngine:
         # Stop health monitor
         await self.health_monitor.stop()
 
-        # Unsubscribe from mempool streams
-        for chain, sub_id in self.mempool_subs.items():
-            try:
-                await self.blockchain_manager.unsubscribe(chain, sub_id)
-                logger.info(f"✓ Unsubscribed from {chain} mempool")
-            except Exception as e:
-                logger.error(f"Error unsubscribing from {chain}: {e}")
+        # Unsubscribe from mempool and new block streams
+        for subs in (self.mempool_subs, self.block_subs):
+            for chain, sub_id in subs.items():
+                try:
+                    await self.blockchain_manager.unsubscribe(chain, sub_id)
+                    logger.info(f"✓ Unsubscribed from {sub_id}")
+                except Exception as e:
+                    logger.error(f"Error unsubscribing from {chain}: {e}")
 
-        # Final stats snapshot
+        # Final stats snapshot and any buffered chain metrics
         try:
             await self._update_stats_snapshot()
         except Exception as e:
             logger.debug(f"Could not save final stats snapshot: {e}")
+        await self._flush_chain_metrics()
 
         # Close database connections
         try:
@@ -694,6 +1140,7 @@ async def main():
 
         # Initialize connections
         await engine.initialize()
+        engine.install_signal_handlers()
 
         # Start mempool monitoring for selected chains
         await engine.start_mempool_monitoring(["ethereum", "polygon", "arbitrum"])
@@ -710,12 +1157,16 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler("arbitrage.log"), logging.StreamHandler()],
-    )
+    # Configure logging; file and console writes happen on a listener thread,
+    # so the event loop only enqueues records
+    log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    log_handlers = [logging.FileHandler("arbitrage.log"), logging.StreamHandler()]
+    for log_handler in log_handlers:
+        log_handler.setFormatter(log_formatter)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+    log_listener.start()
 
     print(
         """
@@ -727,4 +1178,7 @@ if __name__ == "__main__":
     """
     )
 
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
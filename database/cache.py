@@ -2,18 +2,51 @@
 Redis cache manager for real-time caching and rate limiting.
 """
 
+import asyncio
 import redis.asyncio as aioredis
-from typing import Optional, Any, List, Dict
-import json
+from cachetools import TLRUCache
+from redis.exceptions import NoScriptError
+from typing import Optional, Any, AsyncIterator, List, Dict, Tuple
 import logging
+import orjson
 import os
 from datetime import timedelta
-from math import floor
-import time
+from decimal import Decimal
+from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Encode the types orjson has no native support for"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for Redis"""
+    return orjson.dumps(
+        value,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+    )
+
+
+# Capped stream of newly detected opportunities; consumers tail it with stream_read
+OPPORTUNITY_STREAM = "opportunities:stream"
+
+# Fixed-window counter: the first hit in a window starts the expiry clock,
+# so the key itself is the window and no timestamp bucketing is needed.
+_RATELIMIT_LUA = """
+local c = redis.call('INCR', KEYS[1])
+if c == 1 then redis.call('PEXPIRE', KEYS[1], ARGV[2]) end
+return c <= tonumber(ARGV[1]) and 1 or 0
+"""
+
+
 class RedisCache:
     """Manages Redis caching, pub/sub, and rate limiting"""
 
@@ -31,25 +64,45 @@ class RedisCache:
         self.redis_url = redis_url
         self.default_ttl = default_ttl
         self.key_prefix = "arbitrage:"
+        self.max_connections = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
         self.redis_client: Optional[aioredis.Redis] = None
+        self._pool: Optional[aioredis.ConnectionPool] = None
+        self._rl_sha: Optional[str] = None
+
+        # In-process L1 tier for hot keys; a short TTL bounds staleness from other writers,
+        # and no entry outlives its remaining TTL in Redis. Entries are (value, ttl_seconds).
+        self.l1_ttl = 2.0
+        self._l1: TLRUCache = TLRUCache(maxsize=1024, ttu=lambda _key, entry, now: now + entry[1])
+        self._l1_locks: Dict[str, asyncio.Lock] = {}
 
     async def initialize(self) -> None:
         """Initialize Redis connection"""
         try:
-            self.redis_client = await aioredis.from_url(
+            # redis-py parses replies with hiredis automatically when it is installed;
+            # unix:// URLs are accepted here as well for a co-located Redis
+            self._pool = aioredis.ConnectionPool.from_url(
                 self.redis_url,
                 encoding="utf8",
                 decode_responses=True,
+                max_connections=self.max_connections,
                 socket_connect_timeout=5,
                 socket_keepalive=True,
+                health_check_interval=30,
             )
+            self.redis_client = aioredis.Redis(connection_pool=self._pool)
 
             # Test connection
             await self.redis_client.ping()
+            self._rl_sha = await self.redis_client.script_load(_RATELIMIT_LUA)
             logger.info("✓ Redis cache initialized successfully")
 
         except Exception as e:
             logger.error(f"✗ Failed to initialize Redis: {e}")
+            # Leave the cache visibly uninitialized so callers take their no-Redis paths
+            if self._pool is not None:
+                await self._pool.disconnect()
+            self.redis_client = None
+            self._pool = None
             raise
 
     def _make_key(self, key: str) -> str:
@@ -66,38 +119,78 @@ class RedisCache:
             full_key = self._make_key(key)
             ttl_seconds = ttl or self.default_ttl
 
-            # Serialize to JSON if not string
-            if isinstance(value, str):
+            # Serialize to JSON if not already encoded
+            if isinstance(value, (str, bytes)):
                 serialized = value
             else:
-                serialized = json.dumps(value, default=str)
+                serialized = _dumps(value)
 
             await self.redis_client.setex(full_key, ttl_seconds, serialized)
+            self._l1.pop(key, None)
             return True
         except Exception as e:
             logger.warning(f"Failed to set cache key {key}: {e}")
             return False
 
+    def _l1_store(self, key: str, value: Any, pttl: int) -> None:
+        """Keep a value in L1 for at most l1_ttl, and never past its remaining Redis TTL"""
+        if value is None:
+            return
+        # PTTL is -1 for keys without an expiry
+        ttl = self.l1_ttl if pttl < 0 else min(self.l1_ttl, pttl / 1000)
+        if ttl > 0:
+            self._l1[key] = (value, ttl)
+
+    @staticmethod
+    def _decode(value: Optional[str]) -> Optional[Any]:
+        """Deserialize a cached value, falling back to the raw string"""
+        if value is None:
+            return None
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
+        """Get value from cache, serving hot keys from the in-process L1 tier"""
         if not self.redis_client:
             return None
 
-        try:
-            full_key = self._make_key(key)
-            value = await self.redis_client.get(full_key)
+        entry = self._l1.get(key)
+        if entry is not None:
+            return entry[0]
 
-            if value is None:
-                return None
+        # One Redis fetch per key at a time; concurrent readers wait and hit L1
+        lock = self._l1_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._l1.get(key)
+                if entry is not None:
+                    return entry[0]
 
-            # Try to deserialize JSON
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                full_key = self._make_key(key)
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    raw, pttl = await pipe.get(full_key).pttl(full_key).execute()
+                value = self._decode(raw)
+                self._l1_store(key, value, pttl)
                 return value
         except Exception as e:
             logger.warning(f"Failed to get cache key {key}: {e}")
             return None
+        finally:
+            if not lock.locked():
+                self._l1_locks.pop(key, None)
+
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Get value from cache without deserializing it"""
+        if not self.redis_client:
+            return None
+
+        try:
+            return await self.redis_client.get(self._make_key(key))
+        except Exception as e:
+            logger.warning(f"Failed to get cache key {key}: {e}")
+            return None
 
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
@@ -107,6 +200,7 @@ class RedisCache:
         try:
             full_key = self._make_key(key)
             await self.redis_client.delete(full_key)
+            self._l1.pop(key, None)
             return True
         except Exception as e:
             logger.warning(f"Failed to delete cache key {key}: {e}")
@@ -134,6 +228,7 @@ class RedisCache:
         try:
             full_key = self._make_key(key)
             new_value = await self.redis_client.incr(full_key, amount)
+            self._l1.pop(key, None)
 
             if ttl:
                 await self.redis_client.expire(full_key, ttl)
@@ -144,25 +239,31 @@ class RedisCache:
             return 0
 
     async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
-        """Get multiple keys in one call"""
+        """Get multiple keys in one call, fetching only L1 misses from Redis"""
         if not self.redis_client:
             return [None] * len(keys)
 
         try:
-            full_keys = [self._make_key(k) for k in keys]
-            values = await self.redis_client.mget(full_keys)
-
-            result = []
-            for value in values:
-                if value is None:
-                    result.append(None)
-                else:
-                    try:
-                        result.append(json.loads(value))
-                    except json.JSONDecodeError:
-                        result.append(value)
-
-            return result
+            entries = [self._l1.get(k) for k in keys]
+            result = [None if entry is None else entry[0] for entry in entries]
+            missing = [k for k, v in zip(keys, result) if v is None]
+            if not missing:
+                return result
+
+            full_keys = [self._make_key(k) for k in missing]
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.mget(full_keys)
+                for full_key in full_keys:
+                    pipe.pttl(full_key)
+                values, *pttls = await pipe.execute()
+
+            fetched = {}
+            for key, value, pttl in zip(missing, values, pttls):
+                decoded = self._decode(value)
+                self._l1_store(key, decoded, pttl)
+                fetched[key] = decoded
+
+            return [fetched[k] if v is None else v for k, v in zip(keys, result)]
         except Exception as e:
             logger.warning(f"Failed to get multiple cache keys: {e}")
             return [None] * len(keys)
@@ -174,16 +275,21 @@ class RedisCache:
 
         try:
             ttl_seconds = ttl or self.default_ttl
-            pipe = self.redis_client.pipeline()
+            # Plain pipeline (no MULTI/EXEC): every SETEX goes out in a single round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
 
             for key, value in items.items():
                 full_key = self._make_key(key)
                 serialized = (
-                    value if isinstance(value, str) else json.dumps(value, default=str)
+                    value
+                    if isinstance(value, (str, bytes))
+                    else _dumps(value)
                 )
                 pipe.setex(full_key, ttl_seconds, serialized)
 
             await pipe.execute()
+            for key in items:
+                self._l1.pop(key, None)
             return True
         except Exception as e:
             logger.warning(f"Failed to set multiple cache keys: {e}")
@@ -198,8 +304,8 @@ class RedisCache:
             full_channel = self._make_key(channel)
             serialized = (
                 message
-                if isinstance(message, str)
-                else json.dumps(message, default=str)
+                if isinstance(message, (str, bytes))
+                else _dumps(message)
             )
             subscribers = await self.redis_client.publish(full_channel, serialized)
             return subscribers
@@ -207,11 +313,118 @@ class RedisCache:
             logger.warning(f"Failed to publish to channel {channel}: {e}")
             return 0
 
+    async def subscribe(self, *channels: str, decode: bool = True) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Subscribe to Redis pub/sub channels.
+
+        Args:
+            channels: Channel names (without key prefix)
+            decode: Deserialize JSON messages; pass False to receive the raw string
+
+        Yields:
+            (channel, message) tuples
+        """
+        if not self.redis_client:
+            return
+
+        pubsub = self.redis_client.pubsub()
+        await pubsub.subscribe(*[self._make_key(c) for c in channels])
+
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+
+                channel = message["channel"][len(self.key_prefix) :]
+                data = message["data"]
+                if decode:
+                    try:
+                        data = orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        pass
+
+                yield channel, data
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.close()
+
+    async def stream_add(self, stream: str, entries: List[Any], maxlen: int = 1000) -> bool:
+        """
+        Append entries to a capped Redis Stream.
+
+        Args:
+            stream: Stream name (without key prefix)
+            entries: Values to append, one stream entry each
+            maxlen: Approximate number of entries to retain
+
+        Returns:
+            True if the entries were written
+        """
+        if not self.redis_client or not entries:
+            return False
+
+        try:
+            full_key = self._make_key(stream)
+            pipe = self.redis_client.pipeline(transaction=False)
+
+            for entry in entries:
+                data = entry if isinstance(entry, (str, bytes)) else _dumps(entry)
+                pipe.xadd(full_key, {"data": data}, maxlen=maxlen, approximate=True)
+
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to append to stream {stream}: {e}")
+            return False
+
+    async def stream_latest(self, stream: str, count: int = 20) -> List[Any]:
+        """Get the most recent stream entries, newest first"""
+        if not self.redis_client:
+            return []
+
+        try:
+            entries = await self.redis_client.xrevrange(self._make_key(stream), count=count)
+            return [orjson.loads(fields["data"]) for _, fields in entries]
+        except Exception as e:
+            logger.warning(f"Failed to read stream {stream}: {e}")
+            return []
+
+    async def stream_read(
+        self, stream: str, last_id: str = "$", count: int = 100, block_ms: int = 5000
+    ) -> List[Tuple[str, Any]]:
+        """
+        Wait for stream entries newer than last_id (XREAD BLOCK).
+
+        Args:
+            stream: Stream name (without key prefix)
+            last_id: Entry id to read after; "$" waits for entries added from now on
+            count: Maximum entries to return
+            block_ms: How long to wait for new entries before returning empty
+
+        Returns:
+            (entry_id, value) tuples, oldest first; pass the last entry_id back in to resume
+        """
+        if not self.redis_client:
+            return []
+
+        try:
+            response = await self.redis_client.xread(
+                {self._make_key(stream): last_id}, count=count, block=block_ms
+            )
+            if not response:
+                return []
+
+            _, entries = response[0]
+            return [(entry_id, orjson.loads(fields["data"])) for entry_id, fields in entries]
+        except Exception as e:
+            logger.warning(f"Failed to read stream {stream}: {e}")
+            return []
+
     async def rate_limit(
         self, key: str, max_requests: int, window_seconds: int
     ) -> bool:
         """
-        Implement sliding window rate limiting.
+        Implement fixed window rate limiting with one atomic EVALSHA.
 
         Args:
             key: Rate limit key
@@ -226,25 +439,16 @@ class RedisCache:
 
         try:
             full_key = self._make_key(f"ratelimit:{key}")
-            current_time = time.time()
-            window_start = current_time - window_seconds
-
-            # Remove old entries
-            await self.redis_client.zremrangebyscore(full_key, 0, window_start)
+            args = (1, full_key, max_requests, window_seconds * 1000)
 
-            # Count current requests in window
-            count = await self.redis_client.zcard(full_key)
+            try:
+                allowed = await self.redis_client.evalsha(self._rl_sha, *args)
+            except NoScriptError:
+                # Script cache is flushed on a Redis restart; reload and retry once
+                self._rl_sha = await self.redis_client.script_load(_RATELIMIT_LUA)
+                allowed = await self.redis_client.evalsha(self._rl_sha, *args)
 
-            if count < max_requests:
-                # Add current request
-                await self.redis_client.zadd(
-                    full_key, {str(current_time): current_time}
-                )
-                # Set expiry
-                await self.redis_client.expire(full_key, window_seconds + 1)
-                return True
-            else:
-                return False
+            return allowed == 1
         except Exception as e:
             logger.warning(f"Rate limit check failed for {key}: {e}")
             return True  # Allow if check fails
@@ -255,6 +459,10 @@ class RedisCache:
         """Cache opportunities"""
         return await self.set("opportunities:latest", opportunities, ttl=ttl)
 
+    async def stream_opportunities(self, opportunities: List[dict]) -> bool:
+        """Append opportunities to the capped opportunity stream"""
+        return await self.stream_add(OPPORTUNITY_STREAM, opportunities, maxlen=1000)
+
     async def get_cached_opportunities(self, chain: Optional[str] = None) -> List[dict]:
         """Get cached opportunities"""
         if chain:
@@ -283,6 +491,8 @@ class RedisCache:
         """Close Redis connection"""
         if self.redis_client:
             await self.redis_client.close()
+        if self._pool:
+            await self._pool.disconnect()
             logger.info("✓ Redis connection closed")
 
 
@@ -8,13 +8,18 @@ from sqlalchemy import (
     Integer,
     String,
     Numeric,
+    Double,
     DateTime,
     Boolean,
     Enum,
     Text,
     Index,
     ForeignKey,
+    SmallInteger,
+    TypeDecorator,
+    desc,
     func,
+    text,
 )
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -30,6 +35,33 @@ class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python Enum as a SMALLINT code instead of a Postgres text enum.
+
+    Codes follow member declaration order, so new members must be appended.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
 class ExecutionStatus(enum.Enum):
     """Execution status enum"""
 
@@ -69,18 +101,16 @@ class Opportunity(Base):
     sell_exchange: Mapped[str] = mapped_column(String(100))
     buy_price: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     sell_price: Mapped[Decimal] = mapped_column(Numeric(20, 8))
-    spread_percent: Mapped[Decimal] = mapped_column(Numeric(10, 4))
+    spread_percent: Mapped[float] = mapped_column(Double)
     gross_profit: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     gas_cost: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     net_profit: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     volume_24h: Mapped[Decimal] = mapped_column(Numeric(20, 2))
     liquidity: Mapped[Decimal] = mapped_column(Numeric(20, 2))
-    confidence: Mapped[Decimal] = mapped_column(Numeric(5, 2))
+    confidence: Mapped[float] = mapped_column(Double)
     risk_level: Mapped[RiskLevel] = mapped_column(Enum(RiskLevel))
     flash_loan_available: Mapped[bool] = mapped_column(Boolean, default=False)
-    detected_at: Mapped[datetime] = mapped_column(
-        DateTime, index=True, default=datetime.utcnow
-    )
+    detected_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     executed: Mapped[bool] = mapped_column(Boolean, default=False)
     execution_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("executions.id"), nullable=True
@@ -90,12 +120,18 @@ class Opportunity(Base):
     __table_args__ = (
         Index("ix_opportunities_chain_detected", "chain", "detected_at"),
         Index("ix_opportunities_profit_detected", "net_profit", "detected_at"),
+        # Serves "newest first" listings without a sort
+        Index("ix_opportunities_detected_desc", desc("detected_at")),
+        # Small partial index over the queue of opportunities not yet executed
+        Index(
+            "ix_opportunities_unexecuted",
+            desc("detected_at"),
+            postgresql_where=text("NOT executed"),
+        ),
     )
 
-    # Relationships
-    execution: Mapped[Optional["Execution"]] = relationship(
-        back_populates="opportunity"
-    )
+    # Relationships (both tables point at each other, so each side names its own FK)
+    execution: Mapped[Optional["Execution"]] = relationship(foreign_keys=[execution_id])
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
@@ -108,13 +144,13 @@ class Opportunity(Base):
             "sellExchange": self.sell_exchange,
             "buyPrice": float(self.buy_price),
             "sellPrice": float(self.sell_price),
-            "spread": float(self.spread_percent),
+            "spread": self.spread_percent,
             "profit": float(self.gross_profit),
             "gasEstimate": float(self.gas_cost),
             "netProfit": float(self.net_profit),
             "volume24h": float(self.volume_24h),
             "liquidity": float(self.liquidity),
-            "confidence": float(self.confidence),
+            "confidence": self.confidence,
             "risk": self.risk_level.value,
             "flashLoanAvailable": self.flash_loan_available,
             "detected_at": self.detected_at.isoformat() if self.detected_at else None,
@@ -131,7 +167,7 @@ class Execution(Base):
         String(100), ForeignKey("opportunities.opportunity_id")
     )
     chain: Mapped[str] = mapped_column(String(50), index=True)
-    status: Mapped[ExecutionStatus] = mapped_column(Enum(ExecutionStatus), index=True)
+    status: Mapped[ExecutionStatus] = mapped_column(SmallIntEnum(ExecutionStatus), index=True)
     tx_hash: Mapped[Optional[str]] = mapped_column(
         String(66), unique=True, nullable=True
     )
@@ -143,11 +179,9 @@ class Execution(Base):
     actual_profit: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(20, 8), nullable=True
     )
-    slippage: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 4), nullable=True)
+    slippage: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    executed_at: Mapped[datetime] = mapped_column(
-        DateTime, index=True, default=datetime.utcnow
-    )
+    executed_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     confirmed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     execution_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
@@ -155,10 +189,11 @@ class Execution(Base):
     __table_args__ = (
         Index("ix_executions_chain_time", "chain", "executed_at"),
         Index("ix_executions_status_time", "status", "executed_at"),
+        Index("ix_executions_executed_desc", desc("executed_at")),
     )
 
     # Relationships
-    opportunity: Mapped["Opportunity"] = relationship(back_populates="execution")
+    opportunity: Mapped["Opportunity"] = relationship(foreign_keys=[opportunity_id])
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -170,9 +205,9 @@ class Execution(Base):
             "tx_hash": self.tx_hash,
             "block_number": self.block_number,
             "gas_used": self.gas_used,
-            "gas_price": float(self.gas_price_gwei) if self.gas_price_gwei else None,
-            "actual_profit": float(self.actual_profit) if self.actual_profit else None,
-            "slippage": float(self.slippage) if self.slippage else None,
+            "gas_price": float(self.gas_price_gwei) if self.gas_price_gwei is not None else None,
+            "actual_profit": float(self.actual_profit) if self.actual_profit is not None else None,
+            "slippage": self.slippage,
             "error_message": self.error_message,
             "executed_at": self.executed_at.isoformat(),
             "confirmed_at": (
@@ -187,9 +222,10 @@ class StatsSnapshot(Base):
 
     __tablename__ = "stats_snapshots"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Hypertable unique keys must include the partitioning column
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime, index=True, default=datetime.utcnow
+        DateTime, primary_key=True, index=True, server_default=func.now()
     )
     total_scans: Mapped[int] = mapped_column(Integer)
     opportunities_found: Mapped[int] = mapped_column(Integer)
@@ -199,12 +235,10 @@ class StatsSnapshot(Base):
     total_profit: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     total_gas_spent: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     net_profit: Mapped[Decimal] = mapped_column(Numeric(20, 8))
-    success_rate: Mapped[Decimal] = mapped_column(Numeric(5, 2))
+    success_rate: Mapped[float] = mapped_column(Double)
     avg_profit_per_trade: Mapped[Decimal] = mapped_column(Numeric(20, 8))
     max_drawdown: Mapped[Decimal] = mapped_column(Numeric(20, 8))
-    sharpe_ratio: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 4), nullable=True
-    )
+    sharpe_ratio: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     active_capital: Mapped[Decimal] = mapped_column(Numeric(20, 2))
 
     # Indexes
@@ -222,10 +256,10 @@ class StatsSnapshot(Base):
             "totalProfit": float(self.total_profit),
             "totalGasSpent": float(self.total_gas_spent),
             "netProfit": float(self.net_profit),
-            "successRate": float(self.success_rate),
+            "successRate": self.success_rate,
             "avgProfitPerTrade": float(self.avg_profit_per_trade),
             "maxDrawdown": float(self.max_drawdown),
-            "sharpeRatio": float(self.sharpe_ratio) if self.sharpe_ratio else None,
+            "sharpeRatio": self.sharpe_ratio,
             "activeCapital": float(self.active_capital),
         }
 
@@ -235,10 +269,11 @@ class GasPrice(Base):
 
     __tablename__ = "gas_prices"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Hypertable unique keys must include the partitioning column
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     chain: Mapped[str] = mapped_column(String(50), index=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime, index=True, default=datetime.utcnow
+        DateTime, primary_key=True, index=True, server_default=func.now()
     )
     gas_price_gwei: Mapped[Decimal] = mapped_column(Numeric(10, 2))
     base_fee: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
@@ -256,8 +291,8 @@ class GasPrice(Base):
             "chain": self.chain,
             "timestamp": self.timestamp.isoformat(),
             "gasPrice": float(self.gas_price_gwei),
-            "baseFee": float(self.base_fee) if self.base_fee else None,
-            "priorityFee": float(self.priority_fee) if self.priority_fee else None,
+            "baseFee": float(self.base_fee) if self.base_fee is not None else None,
+            "priorityFee": float(self.priority_fee) if self.priority_fee is not None else None,
             "blockNumber": self.block_number,
         }
 
@@ -268,13 +303,13 @@ class Alert(Base):
     __tablename__ = "alerts"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    severity: Mapped[AlertSeverity] = mapped_column(Enum(AlertSeverity), index=True)
+    severity: Mapped[AlertSeverity] = mapped_column(SmallIntEnum(AlertSeverity), index=True)
     category: Mapped[str] = mapped_column(String(50), index=True)
     chain: Mapped[Optional[str]] = mapped_column(String(50), index=True, nullable=True)
     message: Mapped[str] = mapped_column(Text)
     details: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, index=True, default=datetime.utcnow
+        DateTime, index=True, server_default=func.now()
     )
     acknowledged: Mapped[bool] = mapped_column(Boolean, default=False)
     acknowledged_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -304,17 +339,16 @@ class ChainMetric(Base):
 
     __tablename__ = "chain_metrics"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Hypertable unique keys must include the partitioning column
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     chain: Mapped[str] = mapped_column(String(50), index=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime, index=True, default=datetime.utcnow
+        DateTime, primary_key=True, index=True, server_default=func.now()
     )
     block_number: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     peer_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     is_syncing: Mapped[bool] = mapped_column(Boolean)
-    sync_progress: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2), nullable=True
-    )
+    sync_progress: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     response_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     status: Mapped[str] = mapped_column(String(20))
 
@@ -329,7 +363,7 @@ class ChainMetric(Base):
             "block_number": self.block_number,
             "peer_count": self.peer_count,
             "is_syncing": self.is_syncing,
-            "sync_progress": float(self.sync_progress) if self.sync_progress else None,
+            "sync_progress": self.sync_progress,
             "response_time_ms": self.response_time_ms,
             "status": self.status,
         }
@@ -2,11 +2,37 @@
 Repository layer for database operations - abstracts SQLAlchemy queries.
 """
 
-from sqlalchemy import select, update, delete, func, and_, or_, desc
+from sqlalchemy import (
+    Integer,
+    Numeric,
+    String,
+    and_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    desc,
+    event,
+    func,
+    insert,
+    lambda_stmt,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from sqlalchemy.orm import Session, aliased, raiseload, selectinload
+from cachetools import TTLCache
+from typing import Awaitable, Callable, List, Optional, Dict, Any, AsyncIterator, Sequence
+from datetime import datetime
 from decimal import Decimal
+import asyncio
 import logging
 
 from .models import (
@@ -23,6 +49,117 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per server-side cursor round-trip when streaming time series
+TIME_SERIES_BATCH = 500
+
+# TimescaleDB continuous aggregate of gas_prices (see DatabaseManager.setup_timescale_hypertables)
+GAS_AVG_1M = table(
+    "gas_avg_1m", column("chain"), column("bucket"), column("price_sum"), column("sample_count")
+)
+
+# Whether gas_avg_1m exists; TimescaleDB is optional, so this is checked once on first use
+_gas_aggregate_available: Optional[bool] = None
+
+# Postgres NOTIFY channel signalled after each committed opportunity batch
+OPPORTUNITY_CHANNEL = "arbitrage_opportunities"
+
+# Look-back windows the API and bot actually request; these are inlined as SQL constants
+COMMON_WINDOW_HOURS = frozenset({1, 24, 168})
+
+
+def _hours_ago(hours: int):
+    """
+    SQL expression for the UTC timestamp `hours` ago, evaluated by the database.
+
+    Common windows are inlined as interval literals so TimescaleDB can exclude
+    chunks when planning; other values stay bound to keep the statement cache small.
+    Sessions run with TimeZone=UTC, so LOCALTIMESTAMP matches the naive UTC columns.
+    """
+    if hours in COMMON_WINDOW_HOURS:
+        return func.localtimestamp() - literal_column(f"INTERVAL '{int(hours)} hours'")
+    return func.localtimestamp() - literal_column("INTERVAL '1 hour'") * bindparam("hours", int(hours), Integer)
+
+
+# Dashboard aggregates shared by every poller for a few seconds, keyed by (table, hours)
+_statistics_cache: TTLCache = TTLCache(maxsize=32, ttl=10)
+_statistics_locks: Dict[tuple, asyncio.Lock] = {}
+
+
+async def _cached_statistics(key: tuple, compute: Callable[[], Awaitable[dict]]) -> dict:
+    """Return a cached aggregate, letting only one concurrent caller run the query on a miss"""
+    cached = _statistics_cache.get(key)
+    if cached is not None:
+        return cached
+
+    lock = _statistics_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _statistics_cache.get(key)
+        if cached is None:
+            cached = await compute()
+            _statistics_cache[key] = cached
+        return cached
+
+
+def invalidate_statistics(table_name: str) -> None:
+    """Drop cached aggregates for a table after its rows change"""
+    stale = [key for key in list(_statistics_cache) if key[0] == table_name]
+    for key in stale:
+        _statistics_cache.pop(key, None)
+
+
+def _invalidate_statistics_on_commit(session: AsyncSession, table_name: str) -> None:
+    """Defer invalidation until the session commits; a rollback leaves the cache alone"""
+    session.info.setdefault("stale_statistics", set()).add(table_name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_statistics(session: Session) -> None:
+    for table_name in session.info.pop("stale_statistics", ()):
+        invalidate_statistics(table_name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_statistics(session: Session) -> None:
+    session.info.pop("stale_statistics", None)
+
+
+def _latest_per_chain(model, chains: Sequence[str]):
+    """
+    Newest row of a (chain, timestamp) table for each given chain.
+
+    A LATERAL subquery per chain is one backwards seek on the (chain, timestamp)
+    index, instead of the full scan and sort DISTINCT ON needs.
+    """
+    chain_names = values(column("name", String), name="chain_names").data([(c,) for c in chains])
+    latest = (
+        select(model)
+        .where(model.chain == chain_names.c.name)
+        .order_by(desc(model.timestamp))
+        .limit(1)
+        .lateral()
+    )
+    return select(aliased(model, latest)).select_from(chain_names).join(latest, true())
+
+
+def _execution_statistics_query(hours: int):
+    """One-row aggregate of executions over the last `hours`, derived ratios included"""
+    total = func.count(Execution.id)
+    successful = func.count(Execution.id).filter(Execution.status == ExecutionStatus.SUCCESS)
+    failed = func.count(Execution.id).filter(Execution.status == ExecutionStatus.FAILED)
+    total_profit = func.coalesce(func.sum(Execution.actual_profit), 0)
+    total_gas = func.coalesce(func.sum(Execution.gas_used), 0)
+
+    return select(
+        total.label("total"),
+        successful.label("successful"),
+        failed.label("failed"),
+        total_profit.label("total_profit"),
+        total_gas.label("total_gas"),
+        (total_profit - total_gas).label("net_profit"),
+        func.coalesce(cast(successful * 100, Numeric) / func.nullif(total, 0), 0).label("success_rate"),
+        func.coalesce(total_profit / func.nullif(successful, 0), 0).label("avg_profit"),
+    ).where(Execution.executed_at > _hours_ago(hours))
+
 
 class OpportunityRepository:
     """Repository for opportunity operations"""
@@ -31,17 +168,34 @@ class OpportunityRepository:
         self, session: AsyncSession, opportunity_data: dict
     ) -> Opportunity:
         """Create new opportunity record"""
-        opp = Opportunity(**opportunity_data)
-        session.add(opp)
-        await session.flush()
-        return opp
+        result = await session.execute(
+            insert(Opportunity).values(**opportunity_data).returning(Opportunity)
+        )
+        return result.scalar_one()
+
+    async def bulk_create(self, session: AsyncSession, rows: List[dict]) -> None:
+        """Insert many opportunities in one executemany; rows whose opportunity_id exists are skipped"""
+        if not rows:
+            return
+
+        await session.execute(
+            pg_insert(Opportunity).on_conflict_do_nothing(index_elements=["opportunity_id"]),
+            rows,
+        )
+
+    async def notify_inserted(self, session: AsyncSession, batch_id: str) -> None:
+        """Notify LISTENing workers of a new batch; Postgres delivers it when the session commits"""
+        await session.execute(
+            text("SELECT pg_notify(:channel, :batch_id)"),
+            {"channel": OPPORTUNITY_CHANNEL, "batch_id": batch_id},
+        )
 
     async def get_by_id(
         self, session: AsyncSession, opportunity_id: str
     ) -> Optional[Opportunity]:
         """Get opportunity by ID"""
         result = await session.execute(
-            select(Opportunity).where(Opportunity.opportunity_id == opportunity_id)
+            lambda_stmt(lambda: select(Opportunity).where(Opportunity.opportunity_id == opportunity_id))
         )
         return result.scalars().first()
 
@@ -49,10 +203,15 @@ class OpportunityRepository:
         self, session: AsyncSession, limit: int = 20, chain: Optional[str] = None
     ) -> List[Opportunity]:
         """Get recent opportunities"""
-        query = select(Opportunity).order_by(desc(Opportunity.detected_at)).limit(limit)
+        query = lambda_stmt(
+            lambda: select(Opportunity)
+            .options(selectinload(Opportunity.execution), raiseload("*"))
+            .order_by(desc(Opportunity.detected_at))
+            .limit(limit)
+        )
 
         if chain:
-            query = query.where(Opportunity.chain == chain)
+            query += lambda q: q.where(Opportunity.chain == chain)
 
         result = await session.execute(query)
         return result.scalars().all()
@@ -61,10 +220,11 @@ class OpportunityRepository:
         self, session: AsyncSession, limit: int = 10, hours: int = 24
     ) -> List[Opportunity]:
         """Get top opportunities by net profit"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_time = _hours_ago(hours)
 
         query = (
             select(Opportunity)
+            .options(selectinload(Opportunity.execution), raiseload("*"))
             .where(Opportunity.detected_at > cutoff_time)
             .order_by(desc(Opportunity.net_profit))
             .limit(limit)
@@ -84,8 +244,13 @@ class OpportunityRepository:
         )
 
     async def get_statistics(self, session: AsyncSession, hours: int = 24) -> dict:
-        """Get aggregated opportunity statistics"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        """Get aggregated opportunity statistics (cached for a few seconds)"""
+        return await _cached_statistics(
+            (Opportunity.__tablename__, hours), lambda: self._query_statistics(session, hours)
+        )
+
+    async def _query_statistics(self, session: AsyncSession, hours: int) -> dict:
+        cutoff_time = _hours_ago(hours)
 
         result = await session.execute(
             select(
@@ -114,10 +279,11 @@ class ExecutionRepository:
 
     async def create(self, session: AsyncSession, execution_data: dict) -> Execution:
         """Create new execution record"""
-        execution = Execution(**execution_data)
-        session.add(execution)
-        await session.flush()
-        return execution
+        result = await session.execute(
+            insert(Execution).values(**execution_data).returning(Execution)
+        )
+        _invalidate_statistics_on_commit(session, Execution.__tablename__)
+        return result.scalar_one()
 
     async def update_status(
         self,
@@ -133,13 +299,14 @@ class ExecutionRepository:
         await session.execute(
             update(Execution).where(Execution.id == execution_id).values(**update_data)
         )
+        _invalidate_statistics_on_commit(session, Execution.__tablename__)
 
     async def get_by_tx_hash(
         self, session: AsyncSession, tx_hash: str
     ) -> Optional[Execution]:
         """Get execution by transaction hash"""
         result = await session.execute(
-            select(Execution).where(Execution.tx_hash == tx_hash)
+            lambda_stmt(lambda: select(Execution).where(Execution.tx_hash == tx_hash))
         )
         return result.scalars().first()
 
@@ -150,52 +317,38 @@ class ExecutionRepository:
         status: Optional[ExecutionStatus] = None,
     ) -> List[Execution]:
         """Get recent executions"""
-        query = select(Execution).order_by(desc(Execution.executed_at)).limit(limit)
+        query = lambda_stmt(
+            lambda: select(Execution)
+            .options(raiseload("*"))
+            .order_by(desc(Execution.executed_at))
+            .limit(limit)
+        )
 
         if status:
-            query = query.where(Execution.status == status)
+            query += lambda q: q.where(Execution.status == status)
 
         result = await session.execute(query)
         return result.scalars().all()
 
     async def get_statistics(self, session: AsyncSession, hours: int = 24) -> dict:
-        """Calculate execution statistics"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-        # Total stats
-        total_result = await session.execute(
-            select(
-                func.count(Execution.id).label("total"),
-                func.sum(
-                    (Execution.status == ExecutionStatus.SUCCESS).cast(
-                        __import__("sqlalchemy").Integer
-                    )
-                ).label("successful"),
-                func.sum(
-                    (Execution.status == ExecutionStatus.FAILED).cast(
-                        __import__("sqlalchemy").Integer
-                    )
-                ).label("failed"),
-                func.sum(Execution.actual_profit).label("total_profit"),
-                func.sum(Execution.gas_used).label("total_gas"),
-            ).where(Execution.executed_at > cutoff_time)
+        """Calculate execution statistics, including derived ratios (cached for a few seconds)"""
+        return await _cached_statistics(
+            (Execution.__tablename__, hours), lambda: self._query_statistics(session, hours)
         )
 
-        row = total_result.first()
-        total_count = row.total or 0
-        successful = row.successful or 0
-        failed = row.failed or 0
+    async def _query_statistics(self, session: AsyncSession, hours: int) -> dict:
+        result = await session.execute(_execution_statistics_query(hours))
 
+        row = result.first()
         return {
-            "total_executions": total_count,
-            "successful": successful,
-            "failed": failed,
-            "success_rate": (successful / total_count * 100) if total_count > 0 else 0,
-            "total_profit": float(row.total_profit) if row.total_profit else 0,
-            "total_gas": float(row.total_gas) if row.total_gas else 0,
-            "avg_profit_per_trade": (
-                (float(row.total_profit) / successful) if successful > 0 else 0
-            ),
+            "total_executions": row.total,
+            "successful": row.successful,
+            "failed": row.failed,
+            "success_rate": row.success_rate,
+            "total_profit": row.total_profit,
+            "total_gas": row.total_gas,
+            "net_profit": row.net_profit,
+            "avg_profit_per_trade": row.avg_profit,
         }
 
 
@@ -206,10 +359,52 @@ class StatsRepository:
         self, session: AsyncSession, stats_data: dict
     ) -> StatsSnapshot:
         """Create stats snapshot"""
-        snapshot = StatsSnapshot(**stats_data)
-        session.add(snapshot)
-        await session.flush()
-        return snapshot
+        result = await session.execute(
+            insert(StatsSnapshot).values(**stats_data).returning(StatsSnapshot)
+        )
+        return result.scalar_one()
+
+    COPY_COLUMNS = (
+        "timestamp",
+        "total_scans",
+        "opportunities_found",
+        "trades_executed",
+        "successful_trades",
+        "failed_trades",
+        "total_profit",
+        "total_gas_spent",
+        "net_profit",
+        "success_rate",
+        "avg_profit_per_trade",
+        "max_drawdown",
+        "sharpe_ratio",
+        "active_capital",
+    )
+
+    async def bulk_backfill(self, session: AsyncSession, snapshots: List[dict]) -> None:
+        """
+        Insert historical snapshots with a single binary COPY (asyncpg only).
+
+        Meant for backfills and recomputes; live snapshots keep using create_snapshot.
+        """
+        if not snapshots:
+            return
+
+        now = datetime.utcnow()
+        records = [
+            tuple(
+                (snapshot.get(col) or now) if col == "timestamp" else snapshot.get(col)
+                for col in self.COPY_COLUMNS
+            )
+            for snapshot in snapshots
+        ]
+
+        # COPY runs on the session's own connection, so it commits with the session
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            StatsSnapshot.__tablename__, records=records, columns=self.COPY_COLUMNS
+        )
 
     async def get_latest(self, session: AsyncSession) -> Optional[StatsSnapshot]:
         """Get most recent stats snapshot"""
@@ -220,42 +415,42 @@ class StatsRepository:
 
     async def get_time_series(
         self, session: AsyncSession, hours: int = 24, interval_minutes: int = 5
-    ) -> List[StatsSnapshot]:
-        """Get stats time series for charting"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    ) -> AsyncIterator[StatsSnapshot]:
+        """Stream stats time series for charting, oldest first"""
+        cutoff_time = _hours_ago(hours)
 
-        result = await session.execute(
+        result = await session.stream(
             select(StatsSnapshot)
             .where(StatsSnapshot.timestamp > cutoff_time)
             .order_by(StatsSnapshot.timestamp)
+            .execution_options(yield_per=TIME_SERIES_BATCH)
         )
-        return result.scalars().all()
+        async for snapshot in result.scalars():
+            yield snapshot
 
     async def calculate_current_stats(self, session: AsyncSession) -> dict:
-        """Calculate current stats from executions table"""
-        # Get execution stats for last 24 hours
-        execution_repo = ExecutionRepository()
-        exec_stats = await execution_repo.get_statistics(session, hours=24)
+        """Calculate current stats from the last 24 hours of executions and opportunities in one query"""
+        executions = _execution_statistics_query(24).cte("e")
+        opportunities = (
+            select(func.count(Opportunity.id).label("opportunities"))
+            .where(Opportunity.detected_at > _hours_ago(24))
+            .cte("o")
+        )
 
-        # Get opportunity stats
-        opportunity_repo = OpportunityRepository()
-        opp_stats = await opportunity_repo.get_statistics(session, hours=24)
+        result = await session.execute(select(executions, opportunities))
+        row = result.first()
 
         return {
-            "total_scans": opp_stats.get("count", 0),
-            "opportunities_found": opp_stats.get("count", 0),
-            "trades_executed": exec_stats.get("total_executions", 0),
-            "successful_trades": exec_stats.get("successful", 0),
-            "failed_trades": exec_stats.get("failed", 0),
-            "total_profit": Decimal(str(exec_stats.get("total_profit", 0))),
-            "total_gas_spent": Decimal(str(exec_stats.get("total_gas", 0))),
-            "net_profit": Decimal(
-                str(exec_stats.get("total_profit", 0) - exec_stats.get("total_gas", 0))
-            ),
-            "success_rate": Decimal(str(exec_stats.get("success_rate", 0))),
-            "avg_profit_per_trade": Decimal(
-                str(exec_stats.get("avg_profit_per_trade", 0))
-            ),
+            "total_scans": row.opportunities,
+            "opportunities_found": row.opportunities,
+            "trades_executed": row.total,
+            "successful_trades": row.successful,
+            "failed_trades": row.failed,
+            "total_profit": row.total_profit,
+            "total_gas_spent": row.total_gas,
+            "net_profit": row.net_profit,
+            "success_rate": row.success_rate,
+            "avg_profit_per_trade": row.avg_profit,
             "max_drawdown": Decimal("0"),  # TODO: Calculate from time series
             "sharpe_ratio": None,  # TODO: Calculate from returns
             "active_capital": Decimal("0"),  # TODO: Get from configuration
@@ -270,60 +465,74 @@ class GasPriceRepository:
     ) -> GasPrice:
         """Record gas price observation"""
         data = {"chain": chain, "gas_price_gwei": gas_price, **kwargs}
-        gas_price_obj = GasPrice(**data)
-        session.add(gas_price_obj)
-        await session.flush()
-        return gas_price_obj
+        result = await session.execute(insert(GasPrice).values(**data).returning(GasPrice))
+        return result.scalar_one()
 
     async def get_latest(
-        self, session: AsyncSession, chain: Optional[str] = None
+        self,
+        session: AsyncSession,
+        chain: Optional[str] = None,
+        chains: Optional[Sequence[str]] = None,
     ) -> Dict[str, Decimal]:
-        """Get latest gas price for each chain"""
+        """Get latest gas price for one chain, the given chains, or every chain"""
         if chain:
-            result = await session.execute(
-                select(GasPrice)
-                .where(GasPrice.chain == chain)
-                .order_by(desc(GasPrice.timestamp))
-                .limit(1)
-            )
-            gas_prices = result.scalars().all()
+            chains = [chain]
+
+        if chains:
+            query = _latest_per_chain(GasPrice, chains)
         else:
-            # Get latest for each chain
-            subquery = (
-                select(GasPrice.chain, GasPrice.gas_price_gwei, GasPrice.timestamp)
+            # Unknown chain set: fall back to DISTINCT ON over the whole table
+            query = (
+                select(GasPrice)
                 .order_by(GasPrice.chain, desc(GasPrice.timestamp))
                 .distinct(GasPrice.chain)
             )
 
-            result = await session.execute(select(GasPrice).from_statement(subquery))
-            gas_prices = result.scalars().all()
-
-        return {gp.chain: gp.gas_price_gwei for gp in gas_prices}
+        result = await session.execute(query)
+        return {gp.chain: gp.gas_price_gwei for gp in result.scalars().all()}
 
     async def get_time_series(
         self, session: AsyncSession, chain: str, hours: int = 24
-    ) -> List[GasPrice]:
-        """Get gas price history"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    ) -> AsyncIterator[GasPrice]:
+        """Stream gas price history, oldest first"""
+        cutoff_time = _hours_ago(hours)
 
-        result = await session.execute(
+        result = await session.stream(
             select(GasPrice)
             .where(and_(GasPrice.chain == chain, GasPrice.timestamp > cutoff_time))
             .order_by(GasPrice.timestamp)
+            .execution_options(yield_per=TIME_SERIES_BATCH)
         )
-        return result.scalars().all()
+        async for gas_price in result.scalars():
+            yield gas_price
 
     async def get_average(
         self, session: AsyncSession, chain: str, hours: int = 1
     ) -> Decimal:
-        """Calculate average gas price over time period"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-        result = await session.execute(
-            select(func.avg(GasPrice.gas_price_gwei).label("avg_price")).where(
+        """
+        Average gas price over time period.
+
+        Reads the 1-minute continuous aggregate when it exists, weighting each bucket
+        by its sample count so the result matches avg() over the raw rows.
+        """
+        global _gas_aggregate_available
+        if _gas_aggregate_available is None:
+            result = await session.execute(select(func.to_regclass("gas_avg_1m").isnot(None)))
+            _gas_aggregate_available = bool(result.scalar())
+
+        cutoff_time = _hours_ago(hours)
+
+        if _gas_aggregate_available:
+            query = select(
+                (func.sum(GAS_AVG_1M.c.price_sum) / func.nullif(func.sum(GAS_AVG_1M.c.sample_count), 0))
+                .label("avg_price")
+            ).where(and_(GAS_AVG_1M.c.chain == chain, GAS_AVG_1M.c.bucket > cutoff_time))
+        else:
+            query = select(func.avg(GasPrice.gas_price_gwei).label("avg_price")).where(
                 and_(GasPrice.chain == chain, GasPrice.timestamp > cutoff_time)
             )
-        )
+
+        result = await session.execute(query)
 
         avg = result.scalar()
         return Decimal(str(avg)) if avg else Decimal("0")
@@ -341,13 +550,18 @@ class AlertRepository:
         **kwargs
     ) -> Alert:
         """Create new alert"""
-        alert = Alert(severity=severity, category=category, message=message, **kwargs)
-        session.add(alert)
-        await session.flush()
-        return alert
+        result = await session.execute(
+            insert(Alert)
+            .values(severity=severity, category=category, message=message, **kwargs)
+            .returning(Alert)
+        )
+        return result.scalar_one()
 
     async def get_unacknowledged(
-        self, session: AsyncSession, severity: Optional[AlertSeverity] = None
+        self,
+        session: AsyncSession,
+        limit: int = 100,
+        severity: Optional[AlertSeverity] = None,
     ) -> List[Alert]:
         """Get unacknowledged alerts"""
         query = select(Alert).where(Alert.acknowledged == False)
@@ -355,7 +569,7 @@ class AlertRepository:
         if severity:
             query = query.where(Alert.severity == severity)
 
-        query = query.order_by(desc(Alert.created_at))
+        query = query.order_by(desc(Alert.created_at)).limit(limit)
 
         result = await session.execute(query)
         return result.scalars().all()
@@ -392,32 +606,71 @@ class ChainMetricRepository:
     ) -> ChainMetric:
         """Record chain health metrics"""
         data = {"chain": chain, **metrics}
-        metric = ChainMetric(**data)
-        session.add(metric)
-        await session.flush()
-        return metric
-
-    async def get_latest(self, session: AsyncSession) -> Dict[str, ChainMetric]:
-        """Get latest metrics for all chains"""
-        result = await session.execute(
-            select(ChainMetric)
-            .order_by(ChainMetric.chain, desc(ChainMetric.timestamp))
-            .distinct(ChainMetric.chain)
+        result = await session.execute(insert(ChainMetric).values(**data).returning(ChainMetric))
+        return result.scalar_one()
+
+    COPY_COLUMNS = (
+        "chain",
+        "timestamp",
+        "block_number",
+        "peer_count",
+        "is_syncing",
+        "sync_progress",
+        "response_time_ms",
+        "status",
+    )
+
+    async def bulk_record(self, session: AsyncSession, rows: List[dict]) -> None:
+        """Append many metric rows with a single binary COPY (asyncpg only)"""
+        if not rows:
+            return
+
+        now = datetime.utcnow()
+        records = [
+            tuple(
+                (row.get(col) or now) if col == "timestamp" else row.get(col)
+                for col in self.COPY_COLUMNS
+            )
+            for row in rows
+        ]
+
+        # COPY runs on the session's own connection, so it commits with the session
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            ChainMetric.__tablename__, records=records, columns=self.COPY_COLUMNS
         )
+
+    async def get_latest(
+        self, session: AsyncSession, chains: Optional[Sequence[str]] = None
+    ) -> Dict[str, ChainMetric]:
+        """Get latest metrics for the given chains, or every chain"""
+        if chains:
+            query = _latest_per_chain(ChainMetric, chains)
+        else:
+            query = (
+                select(ChainMetric)
+                .order_by(ChainMetric.chain, desc(ChainMetric.timestamp))
+                .distinct(ChainMetric.chain)
+            )
+
+        result = await session.execute(query)
         metrics = result.scalars().all()
         return {m.chain: m for m in metrics}
 
     async def get_time_series(
         self, session: AsyncSession, chain: str, hours: int = 24
-    ) -> List[ChainMetric]:
-        """Get metrics history"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    ) -> AsyncIterator[ChainMetric]:
+        """Stream metrics history, oldest first"""
+        cutoff_time = _hours_ago(hours)
 
-        result = await session.execute(
+        result = await session.stream(
             select(ChainMetric)
             .where(
                 and_(ChainMetric.chain == chain, ChainMetric.timestamp > cutoff_time)
             )
             .order_by(ChainMetric.timestamp)
+            .execution_options(yield_per=TIME_SERIES_BATCH)
         )
-        return result.scalars().all()
+        async for metric in result.scalars():
+            yield metric
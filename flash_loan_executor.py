@@ -4,17 +4,32 @@ FLASH LOAN EXECUTOR
 Handles flash loan execution and smart contract interactions for arbitrage
 """
 
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
+from web3.providers import AsyncHTTPProvider
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
 from eth_account import Account
+from hexbytes import HexBytes
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Optional, Dict, List
-import json
+from typing import Any, Optional, Dict, List, Tuple
+import aiohttp
+import asyncio
+import functools
+import logging
+import math
+import time
+import orjson
+
+from infrastructure import BroadcastPool, Multicall, TxReceiptWaiter
+
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # AAVE V3 FLASH LOAN CONTRACT ABI (Simplified)
 # ============================================================================
 
-AAVE_POOL_ABI = json.loads('''[
+AAVE_POOL_ABI = orjson.loads('''[
     {
         "inputs": [
             {"internalType": "address", "name": "receiverAddress", "type": "address"},
@@ -40,7 +55,7 @@ AAVE_POOL_ABI = json.loads('''[
 ]''')
 
 # ERC20 Token ABI (minimal)
-ERC20_ABI = json.loads('''[
+ERC20_ABI = orjson.loads('''[
     {
         "constant": true,
         "inputs": [{"name": "_owner", "type": "address"}],
@@ -68,7 +83,7 @@ ERC20_ABI = json.loads('''[
 ]''')
 
 # Uniswap V2 Router ABI (minimal)
-UNISWAP_V2_ROUTER_ABI = json.loads('''[
+UNISWAP_V2_ROUTER_ABI = orjson.loads('''[
     {
         "inputs": [
             {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
@@ -94,6 +109,196 @@ UNISWAP_V2_ROUTER_ABI = json.loads('''[
     }
 ]''')
 
+@functools.lru_cache(maxsize=512)
+def checksum_address(address: str) -> str:
+    """EIP-55 checksum an address, memoized since the same few addresses recur every trade"""
+    return Web3.to_checksum_address(address)
+
+
+@functools.lru_cache(maxsize=512)
+def checksum_path(path: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Checksum a swap path once per unique path"""
+    return tuple(checksum_address(addr) for addr in path)
+
+
+# Function selectors for the read calls sent in JSON-RPC batches and multicalls
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+GET_POOL_SELECTOR = bytes.fromhex("026b1d5f")  # getPool()
+FACTORY_SELECTOR = bytes.fromhex("c45a0155")  # factory()
+GET_PAIR_SELECTOR = bytes.fromhex("e6a43905")  # getPair(address,address)
+GET_RESERVES_SELECTOR = bytes.fromhex("0902f1ac")  # getReserves()
+
+# Calldata for the two transactions we send, assembled from 32-byte words
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+SWAP_EXACT_TOKENS_SELECTOR = bytes.fromhex("38ed1739")  # swapExactTokensForTokens(uint256,uint256,address[],address,uint256)
+PATH_OFFSET_WORD = (5 * 32).to_bytes(32, 'big')
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, 'big')
+
+
+@functools.lru_cache(maxsize=512)
+def _address_word(address: str) -> bytes:
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+@functools.lru_cache(maxsize=256)
+def _path_tail(path: Tuple[str, ...]) -> bytes:
+    """ABI tail of an address[] argument: length word followed by padded addresses"""
+    return _word(len(path)) + b''.join(_address_word(addr) for addr in path)
+
+
+def encode_approve(spender: str, amount: int) -> bytes:
+    return APPROVE_SELECTOR + _address_word(spender) + _word(amount)
+
+
+def encode_swap_exact_tokens(amount_in: int, min_amount_out: int, path: Tuple[str, ...],
+                             to: str, deadline: int) -> bytes:
+    return (SWAP_EXACT_TOKENS_SELECTOR + _word(amount_in) + _word(min_amount_out) + PATH_OFFSET_WORD
+            + _address_word(to) + _word(deadline) + _path_tail(path))
+
+# ============================================================================
+# LOCAL UNISWAP V2 QUOTING
+# ============================================================================
+
+def v2_amount_out(amount_in: int, reserve_in: int, reserve_out: int, fee_num: int = 997) -> int:
+    """Uniswap V2 getAmountOut: integer math identical to the on-chain library"""
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return 0
+    amount_in_with_fee = amount_in * fee_num
+    return amount_in_with_fee * reserve_out // (reserve_in * 1000 + amount_in_with_fee)
+
+
+# Default tolerance between quoted and executed output, in basis points
+SLIPPAGE_BPS = 100
+
+
+def apply_slippage(amount: int, bps: int) -> int:
+    """Minimum acceptable output for amount with bps of slippage, in exact integer math"""
+    return amount * (10_000 - bps) // 10_000
+
+
+def optimal_v2_arbitrage_size(reserve_in_buy: int, reserve_out_buy: int,
+                              reserve_in_sell: int, reserve_out_sell: int,
+                              fee_num: int = 997) -> int:
+    """
+    Closed-form input that maximizes profit of a buy-then-sell across two V2 pools.
+
+    Reserves are given per leg in swap direction: the buy pool swaps A -> B
+    (reserve_in_buy of A, reserve_out_buy of B), the sell pool swaps B -> A.
+    The composed swap is out(x) = K*x / (D + E*x), so d(out - x)/dx = 0 gives
+    x* = (sqrt(K*D) - D) / E. Returns 0 when no size is profitable.
+    """
+    k = fee_num * fee_num * reserve_out_buy * reserve_out_sell
+    d = 1000 * 1000 * reserve_in_buy * reserve_in_sell
+    e = fee_num * (1000 * reserve_in_sell + fee_num * reserve_out_buy)
+    if k <= d or e <= 0:
+        return 0
+    return (math.isqrt(k * d) - d) // e
+
+
+class PoolReserveCache:
+    """
+    Reserves of the V2 pairs we quote against, refreshed in one JSON-RPC batch.
+
+    Pair addresses are resolved once per (router, token pair). A pair's reserves
+    are re-read once mark_stale() has been called since they were stored (e.g.
+    from a new-head subscription) or after max_age seconds. Reserves read
+    elsewhere, such as in a multicall, can be handed in through store().
+    """
+
+    def __init__(self, rpc_batch, eth_call, max_age: float = 12.0):
+        self._rpc_batch = rpc_batch
+        self._eth_call = eth_call
+        self.max_age = max_age
+        self._factories: Dict[str, str] = {}
+        self._pairs: Dict[Tuple[str, str, str], str] = {}
+        self._reserves: Dict[str, Tuple[int, int]] = {}
+        self._read_at: Dict[str, float] = {}
+        self._stale_before = 0.0
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _pair_key(router: str, token_a: str, token_b: str) -> Tuple[str, str, str]:
+        token0, token1 = sorted((token_a.lower(), token_b.lower()))
+        return router.lower(), token0, token1
+
+    @staticmethod
+    def _decode_address(result: str) -> str:
+        (address,) = abi_decode(["address"], bytes.fromhex(result[2:]))
+        return address
+
+    def mark_stale(self, *_args):
+        """Force a reserve refresh on the next quote; usable as a new-block callback"""
+        self._stale_before = time.monotonic()
+
+    def pair_address(self, router: str, token_a: str, token_b: str) -> Optional[str]:
+        """Pair address of a tracked hop, or None before track() resolved it"""
+        return self._pairs.get(self._pair_key(router, token_a, token_b))
+
+    def store(self, pair: str, reserve0: int, reserve1: int):
+        """Record reserves read outside refresh()"""
+        self._reserves[pair] = (reserve0, reserve1)
+        self._read_at[pair] = time.monotonic()
+
+    async def track(self, router: str, path: List[str]):
+        """Resolve (once) the pair address of every hop in path"""
+        router_key = router.lower()
+        hops = [self._pair_key(router, a, b) for a, b in zip(path, path[1:])]
+        missing = list(dict.fromkeys(key for key in hops if key not in self._pairs))
+        if not missing:
+            return
+
+        if router_key not in self._factories:
+            (result,) = await self._rpc_batch([self._eth_call(router, FACTORY_SELECTOR)])
+            self._factories[router_key] = self._decode_address(result)
+        factory = self._factories[router_key]
+
+        results = await self._rpc_batch([
+            self._eth_call(factory, GET_PAIR_SELECTOR + abi_encode(
+                ["address", "address"], [checksum_address(token0), checksum_address(token1)]
+            ))
+            for _, token0, token1 in missing
+        ])
+        for key, result in zip(missing, results):
+            self._pairs[key] = self._decode_address(result)
+
+    async def refresh(self):
+        """Read getReserves() of every stale tracked pair in a single batch"""
+        async with self._lock:
+            pairs = [pair for pair in dict.fromkeys(self._pairs.values()) if not self._is_fresh(pair)]
+            if not pairs:
+                return
+            results = await self._rpc_batch([self._eth_call(pair, GET_RESERVES_SELECTOR) for pair in pairs])
+            for pair, result in zip(pairs, results):
+                reserve0, reserve1, _ = abi_decode(["uint112", "uint112", "uint32"], bytes.fromhex(result[2:]))
+                self.store(pair, reserve0, reserve1)
+
+    def _is_fresh(self, pair: str) -> bool:
+        read_at = self._read_at.get(pair)
+        return read_at is not None and read_at > self._stale_before and time.monotonic() - read_at < self.max_age
+
+    async def get_reserves(self, router: str, token_in: str, token_out: str) -> Tuple[int, int]:
+        """(reserve_in, reserve_out) for one hop"""
+        await self.track(router, [token_in, token_out])
+        pair = self._pairs[self._pair_key(router, token_in, token_out)]
+        if not self._is_fresh(pair):
+            await self.refresh()
+        reserve0, reserve1 = self._reserves[pair]
+        if token_in.lower() < token_out.lower():
+            return reserve0, reserve1
+        return reserve1, reserve0
+
+    async def quote(self, router: str, amount_in: int, path: List[str]) -> int:
+        """Multi-hop getAmountsOut computed locally from cached reserves"""
+        await self.track(router, path)
+        amount = amount_in
+        for token_in, token_out in zip(path, path[1:]):
+            reserve_in, reserve_out = await self.get_reserves(router, token_in, token_out)
+            amount = v2_amount_out(amount, reserve_in, reserve_out)
+        return amount
+
 # ============================================================================
 # FLASH LOAN EXECUTOR
 # ============================================================================
@@ -101,103 +306,259 @@ UNISWAP_V2_ROUTER_ABI = json.loads('''[
 class FlashLoanExecutor:
     """Executes flash loan arbitrage transactions"""
     
-    def __init__(self, w3: Web3, private_key: str, chain_config: Dict):
+    def __init__(self, w3: AsyncWeb3, private_key: str, chain_config: Dict,
+                 receipt_waiter: Optional[TxReceiptWaiter] = None,
+                 broadcast_pool: Optional[BroadcastPool] = None):
         self.w3 = w3
         self.account = Account.from_key(private_key)
         self.chain_config = chain_config
+        # Block-driven receipt waits; without one, fall back to web3's receipt polling
+        self.receipt_waiter = receipt_waiter
+        # Parallel multi-endpoint broadcast; swaps go to MEV-protected RPCs only
+        self.broadcast_pool = broadcast_pool
         
-        # Initialize contracts
-        pool_provider_address = chain_config['aave_pool_provider']
-        self.pool_provider = self.w3.eth.contract(
-            address=Web3.to_checksum_address(pool_provider_address),
-            abi=AAVE_POOL_ABI
-        )
+        # Read through a pre-encoded getPool() call, no contract object needed
+        # Optional: only flash loans need it, plain swaps and quotes work without
+        pool_provider = chain_config.get('aave_pool_provider')
+        self.pool_provider_address = checksum_address(pool_provider) if pool_provider else None
         
-        # Get actual pool address
-        self.pool_address = self.pool_provider.functions.getPool().call()
-        self.pool = self.w3.eth.contract(
-            address=self.pool_address,
-            abi=AAVE_POOL_ABI
-        )
+        # Resolved on first use by ensure_pool_initialized(), so construction makes no RPC
+        self.pool_address: Optional[str] = None
+        self.pool = None
+        self._pool_lock = asyncio.Lock()
+        
+        # Contract objects for callers that want them; the hot paths use pre-encoded calldata
+        self._token_contracts: Dict[str, Any] = {}
+        self._router_contracts: Dict[str, Any] = {}
+        
+        # Fee fields are refreshed at most once per block interval; the nonce is tracked locally
+        # after one 'pending' lookup, so back-to-back approve + swap never collide
+        self.gas_price_ttl = 12.0
+        self._gas_cache: Optional[Tuple[float, Dict[str, int]]] = None
+        # EIP-1559 tip; the fee cap is 2 * base fee + tip, so it survives a full block of base fee increases
+        self.max_priority_fee = Web3.to_wei(chain_config.get('max_priority_fee_gwei', 2), 'gwei')
+        self._nonce: Optional[int] = None
+        self._nonce_lock = asyncio.Lock()
+        self._chain_id: Optional[int] = None
+        # ECDSA signing runs on worker threads so it never stalls the event loop
+        self._sign_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tx-sign')
+        
+        self._rpc_session: Optional[aiohttp.ClientSession] = None
+        
+        # Swap quotes are computed locally from pair reserves read once per block
+        self.reserve_cache = PoolReserveCache(self._rpc_batch, self._eth_call)
+        self.multicall = Multicall(w3)
+    
+    async def ensure_pool_initialized(self):
+        """Resolve the Aave pool address from the pool provider, once"""
+        if self.pool is not None:
+            return
+        if self.pool_provider_address is None:
+            raise ValueError("chain_config has no 'aave_pool_provider'")
+        async with self._pool_lock:
+            if self.pool is None:
+                raw = await self.w3.eth.call({'to': self.pool_provider_address, 'data': GET_POOL_SELECTOR})
+                (self.pool_address,) = abi_decode(["address"], bytes(raw))
+                self.pool = self.w3.eth.contract(
+                    address=self.pool_address,
+                    abi=AAVE_POOL_ABI
+                )
+    
+    async def _rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """Send several JSON-RPC calls as one batched HTTP POST and return results in order"""
+        if self._rpc_session is None or self._rpc_session.closed:
+            self._rpc_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        async with self._rpc_session.post(self.w3.provider.endpoint_uri, json=payload) as response:
+            replies = await response.json(content_type=None)
+        
+        results: List[Any] = [None] * len(calls)
+        for reply in replies:
+            if "error" in reply:
+                raise RuntimeError(f"RPC error: {reply['error']}")
+            results[reply["id"]] = reply["result"]
+        return results
+    
+    @staticmethod
+    def _eth_call(to: str, data: bytes) -> Tuple[str, list]:
+        return "eth_call", [{"to": checksum_address(to), "data": "0x" + data.hex()}, "latest"]
+    
+    async def prepare_arbitrage_reads(self, token_address: str,
+                                      legs: List[Tuple[str, List[str]]]) -> Dict:
+        """
+        Read the token balance (in wei), the reserves of every pool along legs
+        ((router, path) pairs) and the block timestamp in one Multicall3 eth_call.
+        
+        The reserves go into reserve_cache, so quotes for these legs need no RPC.
+        """
+        for router_address, path in legs:
+            await self.reserve_cache.track(router_address, path)
+        pairs = list(dict.fromkeys(
+            self.reserve_cache.pair_address(router_address, token_in, token_out)
+            for router_address, path in legs
+            for token_in, token_out in zip(path, path[1:])
+        ))
+        
+        token = checksum_address(token_address)
+        calls = [
+            (token, BALANCE_OF_SELECTOR + _address_word(self.account.address)),
+            self.multicall.block_timestamp_call(),
+        ]
+        calls.extend((pair, GET_RESERVES_SELECTOR) for pair in pairs)
+        
+        results = await self.multicall.aggregate3(calls)
+        (balance,) = abi_decode(["uint256"], results[0])
+        (block_timestamp,) = abi_decode(["uint256"], results[1])
+        for pair, data in zip(pairs, results[2:]):
+            reserve0, reserve1, _ = abi_decode(["uint112", "uint112", "uint32"], data)
+            self.reserve_cache.store(pair, reserve0, reserve1)
+        
+        return {
+            'balance': balance,
+            'block_timestamp': block_timestamp,
+        }
+    
+    async def _fee_fields(self) -> Dict[str, int]:
+        """
+        EIP-1559 fee fields from the pending block's base fee, cached for
+        gas_price_ttl seconds. Chains without a base fee get a legacy gasPrice.
+        """
+        now = time.monotonic()
+        if self._gas_cache is None or now - self._gas_cache[0] >= self.gas_price_ttl:
+            pending = await self.w3.eth.get_block('pending')
+            base_fee = pending.get('baseFeePerGas')
+            if base_fee is None:
+                fields = {'gasPrice': await self.w3.eth.gas_price}
+            else:
+                fields = {
+                    'type': 2,
+                    'maxPriorityFeePerGas': self.max_priority_fee,
+                    'maxFeePerGas': 2 * base_fee + self.max_priority_fee,
+                }
+            self._gas_cache = (now, fields)
+        return self._gas_cache[1]
+    
+    async def _send_transaction(self, to: str, data: bytes, gas: int, protected: bool = False) -> bytes:
+        """
+        Sign and send a call to `to` with prebuilt calldata, the cached fee fields
+        and the next local nonce.
+        
+        With a broadcast pool the raw transaction is fanned out to its endpoints;
+        protected restricts that to this chain's MEV-protected ones.
+        
+        The transaction dict is assembled directly rather than through
+        build_transaction. On a failed send the nonce is re-read from the node
+        on the next transaction.
+        """
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        tx = {
+            'from': self.account.address,
+            'to': checksum_address(to),
+            'data': data,
+            'value': 0,
+            'gas': gas,
+            'chainId': self._chain_id,
+            **await self._fee_fields(),
+        }
+        async with self._nonce_lock:
+            if self._nonce is None:
+                self._nonce = await self.w3.eth.get_transaction_count(self.account.address, 'pending')
+            tx['nonce'] = self._nonce
+            try:
+                signed_tx = await asyncio.get_running_loop().run_in_executor(
+                    self._sign_pool, self.account.sign_transaction, tx
+                )
+                if self.broadcast_pool is not None:
+                    tx_hash = HexBytes(await self.broadcast_pool.send_raw(signed_tx.rawTransaction, protected, self._chain_id))
+                else:
+                    tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            except Exception:
+                self._nonce = None
+                raise
+            self._nonce += 1
+        return tx_hash
+    
+    async def wait_for_receipt(self, tx_hash) -> Dict:
+        """Wait for a transaction receipt, checking once per block when a waiter is configured"""
+        if self.receipt_waiter is not None:
+            return await self.receipt_waiter.wait(tx_hash.hex())
+        return await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+    
+    async def close(self):
+        """Close the batch RPC session and the signing threads"""
+        if self._rpc_session is not None:
+            await self._rpc_session.close()
+            self._rpc_session = None
+        self._sign_pool.shutdown(wait=False)
     
     def get_token_contract(self, token_address: str):
         """Get ERC20 token contract instance"""
-        return self.w3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=ERC20_ABI
-        )
+        key = token_address.lower()
+        contract = self._token_contracts.get(key)
+        if contract is None:
+            contract = self._token_contracts[key] = self.w3.eth.contract(
+                address=checksum_address(token_address),
+                abi=ERC20_ABI
+            )
+        return contract
     
     def get_router_contract(self, router_address: str):
         """Get DEX router contract instance"""
-        return self.w3.eth.contract(
-            address=Web3.to_checksum_address(router_address),
-            abi=UNISWAP_V2_ROUTER_ABI
-        )
+        key = router_address.lower()
+        contract = self._router_contracts.get(key)
+        if contract is None:
+            contract = self._router_contracts[key] = self.w3.eth.contract(
+                address=checksum_address(router_address),
+                abi=UNISWAP_V2_ROUTER_ABI
+            )
+        return contract
     
-    async def check_token_balance(self, token_address: str) -> Decimal:
-        """Check token balance of account"""
-        token = self.get_token_contract(token_address)
-        balance = token.functions.balanceOf(self.account.address).call()
-        decimals = token.functions.decimals().call()
-        return Decimal(str(balance)) / Decimal(str(10 ** decimals))
+    async def check_token_balance(self, token_address: str) -> int:
+        """Check token balance of account, in the token's smallest unit"""
+        raw = await self.w3.eth.call({
+            'to': checksum_address(token_address),
+            'data': BALANCE_OF_SELECTOR + _address_word(self.account.address),
+        })
+        (balance,) = abi_decode(["uint256"], bytes(raw))
+        return balance
     
     async def approve_token(self, token_address: str, spender: str, amount: int):
         """Approve token spending"""
-        token = self.get_token_contract(token_address)
-        
-        tx = token.functions.approve(
-            Web3.to_checksum_address(spender),
-            amount
-        ).build_transaction({
-            'from': self.account.address,
-            'gas': 100000,
-            'gasPrice': self.w3.eth.gas_price,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-        })
-        
-        signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = await self._send_transaction(
+            token_address, encode_approve(checksum_address(spender), amount), 100000
+        )
         
-        print(f"Approval tx: {tx_hash.hex()}")
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        logger.info("Approval tx: %s", tx_hash.hex())
+        receipt = await self.wait_for_receipt(tx_hash)
         return receipt
     
     async def get_swap_quote(self, router_address: str, amount_in: int, 
                            path: List[str]) -> int:
-        """Get quote for a swap"""
-        router = self.get_router_contract(router_address)
-        
-        amounts = router.functions.getAmountsOut(
-            amount_in,
-            [Web3.to_checksum_address(addr) for addr in path]
-        ).call()
-        
-        return amounts[-1]
+        """Get quote for a swap (V2 formula over cached reserves, no eth_call per quote)"""
+        return await self.reserve_cache.quote(router_address, amount_in, path)
     
     async def execute_swap(self, router_address: str, amount_in: int,
                          min_amount_out: int, path: List[str],
                          deadline: int) -> Dict:
         """Execute a token swap"""
-        router = self.get_router_contract(router_address)
-        
-        tx = router.functions.swapExactTokensForTokens(
+        calldata = encode_swap_exact_tokens(
             amount_in,
             min_amount_out,
-            [Web3.to_checksum_address(addr) for addr in path],
+            checksum_path(tuple(path)),
             self.account.address,
             deadline
-        ).build_transaction({
-            'from': self.account.address,
-            'gas': 300000,
-            'gasPrice': self.w3.eth.gas_price,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-        })
-        
-        signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        )
+        tx_hash = await self._send_transaction(router_address, calldata, 300000, protected=True)
         
-        print(f"Swap tx: {tx_hash.hex()}")
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        logger.info("Swap tx: %s", tx_hash.hex())
+        receipt = await self.wait_for_receipt(tx_hash)
         
         return {
             'hash': tx_hash.hex(),
@@ -222,17 +583,20 @@ class FlashLoanExecutor:
         5. Keep profit
         """
         
-        print(f"\n{'='*60}")
-        print(f"🚀 EXECUTING FLASH LOAN ARBITRAGE")
-        print(f"{'='*60}")
-        print(f"Loan Token: {token_address}")
-        print(f"Loan Amount: {loan_amount}")
-        print(f"Buy Router: {buy_router}")
-        print(f"Sell Router: {sell_router}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 60)
+            logger.info("🚀 EXECUTING FLASH LOAN ARBITRAGE")
+            logger.info("=" * 60)
+            logger.info("Loan Token: %s", token_address)
+            logger.info("Loan Amount: %s", loan_amount)
+            logger.info("Buy Router: %s", buy_router)
+            logger.info("Sell Router: %s", sell_router)
         
         try:
+            await self.ensure_pool_initialized()
+            
             # Step 1: Prepare flash loan parameters
-            assets = [Web3.to_checksum_address(token_address)]
+            assets = [checksum_address(token_address)]
             amounts = [loan_amount]
             modes = [0]  # 0 = no debt, pay back in this transaction
             
@@ -253,8 +617,8 @@ class FlashLoanExecutor:
             # For this example, we're showing the structure
             # In production, you need to deploy your own arbitrage contract
             
-            print("\n⚠️  NOTE: This requires a deployed arbitrage contract!")
-            print("The contract must implement IFlashLoanSimpleReceiver interface")
+            logger.warning("⚠️  NOTE: This requires a deployed arbitrage contract!")
+            logger.warning("The contract must implement IFlashLoanSimpleReceiver interface")
             
             # Mock execution for demonstration
             return {
@@ -265,7 +629,7 @@ class FlashLoanExecutor:
             }
             
         except Exception as e:
-            print(f"❌ Flash loan execution failed: {e}")
+            logger.error("❌ Flash loan execution failed: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -278,10 +642,17 @@ class FlashLoanExecutor:
 class SimpleArbitrageExecutor:
     """Execute arbitrage with owned capital (no flash loans)"""
     
-    def __init__(self, w3: Web3, private_key: str):
+    def __init__(self, w3: AsyncWeb3, private_key: str, chain_config: Optional[Dict] = None,
+                 receipt_waiter: Optional[TxReceiptWaiter] = None,
+                 broadcast_pool: Optional[BroadcastPool] = None):
         self.w3 = w3
         self.account = Account.from_key(private_key)
-        self.flash_executor = FlashLoanExecutor(w3, private_key, {})
+        # Used for its quoting, signing and sending helpers; no pool provider is needed
+        self.flash_executor = FlashLoanExecutor(
+            w3, private_key, chain_config or {},
+            receipt_waiter=receipt_waiter,
+            broadcast_pool=broadcast_pool
+        )
     
     async def execute_arbitrage(self,
                                token_in_address: str,
@@ -289,7 +660,8 @@ class SimpleArbitrageExecutor:
                                amount: int,
                                buy_router: str,
                                sell_router: str,
-                               min_profit: Decimal) -> Dict:
+                               min_profit: Decimal,
+                               slippage_bps: int = SLIPPAGE_BPS) -> Dict:
         """
         Execute simple two-leg arbitrage
         
@@ -300,62 +672,82 @@ class SimpleArbitrageExecutor:
         4. Approve sell_router to spend token_out
         5. Swap token_out -> token_in on sell_router
         6. Calculate profit
+        
+        amount is the most capital to commit; the trade is sized to the
+        closed-form optimum from cached reserves, capped at amount.
         """
         
-        print(f"\n{'='*60}")
-        print(f"⚡ EXECUTING SIMPLE ARBITRAGE")
-        print(f"{'='*60}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 60)
+            logger.info("⚡ EXECUTING SIMPLE ARBITRAGE")
+            logger.info("=" * 60)
         
         try:
-            # Check balance
-            balance = await self.flash_executor.check_token_balance(token_in_address)
-            print(f"Balance: {balance}")
+            # Balance, both pools' reserves and the block timestamp arrive in one multicall
+            path1 = [token_in_address, token_out_address]
+            path2 = [token_out_address, token_in_address]
+            reads = await self.flash_executor.prepare_arbitrage_reads(
+                token_in_address, [(buy_router, path1), (sell_router, path2)]
+            )
+            
+            # Size the trade from the fresh reserves; unprofitable pairs stop here
+            reserves = self.flash_executor.reserve_cache
+            buy_in, buy_out = await reserves.get_reserves(buy_router, token_in_address, token_out_address)
+            sell_in, sell_out = await reserves.get_reserves(sell_router, token_out_address, token_in_address)
+            optimal = optimal_v2_arbitrage_size(buy_in, buy_out, sell_in, sell_out)
+            if optimal == 0:
+                return {
+                    'success': False,
+                    'error': 'No profitable trade size'
+                }
+            amount = min(amount, optimal)
+            logger.info("Trade size: %s", amount)
             
-            if balance < Decimal(str(amount)) / Decimal('1e18'):
+            balance = reads['balance']
+            logger.info("Balance: %s", balance)
+            
+            if balance < amount:
                 return {
                     'success': False,
                     'error': 'Insufficient balance'
                 }
             
             # Get current timestamp + 20 minutes for deadline
-            deadline = self.w3.eth.get_block('latest')['timestamp'] + 1200
+            deadline = reads['block_timestamp'] + 1200
             
-            # Step 1: Get quote for first swap
-            path1 = [token_in_address, token_out_address]
-            amount_out_1 = await self.flash_executor.get_swap_quote(
-                buy_router, amount, path1
-            )
-            print(f"First swap quote: {amount_out_1}")
+            # Step 1: Quote for first swap
+            amount_out_1 = await self.flash_executor.get_swap_quote(buy_router, amount, path1)
+            logger.info("First swap quote: %s", amount_out_1)
             
-            # Step 2: Get quote for second swap
-            path2 = [token_out_address, token_in_address]
+            # Step 2: Get quote for second swap (its input is the first quote's output)
             amount_out_2 = await self.flash_executor.get_swap_quote(
                 sell_router, amount_out_1, path2
             )
-            print(f"Second swap quote: {amount_out_2}")
+            logger.info("Second swap quote: %s", amount_out_2)
             
             # Calculate profit
+            # Integer wei throughout; min_profit is converted once
             profit = amount_out_2 - amount
-            profit_decimal = Decimal(str(profit)) / Decimal('1e18')
+            min_profit_wei = int(min_profit * 10**18)
             
-            print(f"Expected profit: {profit_decimal}")
+            logger.info("Expected profit (wei): %s", profit)
             
-            if profit_decimal < min_profit:
+            if profit < min_profit_wei:
                 return {
                     'success': False,
-                    'error': f'Profit too low: {profit_decimal} < {min_profit}'
+                    'error': f'Profit too low: {Decimal(profit) / 10**18} < {min_profit}'
                 }
             
             # Step 3: Approve first router
-            print("\n📝 Approving first router...")
+            logger.info("📝 Approving first router...")
             await self.flash_executor.approve_token(
                 token_in_address, buy_router, amount
             )
             
             # Step 4: Execute first swap
-            print("\n💱 Executing first swap...")
+            logger.info("💱 Executing first swap...")
             result1 = await self.flash_executor.execute_swap(
-                buy_router, amount, int(amount_out_1 * 0.99), path1, deadline
+                buy_router, amount, apply_slippage(amount_out_1, slippage_bps), path1, deadline
             )
             
             if result1['status'] != 1:
@@ -365,15 +757,15 @@ class SimpleArbitrageExecutor:
                 }
             
             # Step 5: Approve second router
-            print("\n📝 Approving second router...")
+            logger.info("📝 Approving second router...")
             await self.flash_executor.approve_token(
                 token_out_address, sell_router, amount_out_1
             )
             
             # Step 6: Execute second swap
-            print("\n💱 Executing second swap...")
+            logger.info("💱 Executing second swap...")
             result2 = await self.flash_executor.execute_swap(
-                sell_router, amount_out_1, int(amount_out_2 * 0.99), path2, deadline
+                sell_router, amount_out_1, apply_slippage(amount_out_2, slippage_bps), path2, deadline
             )
             
             if result2['status'] != 1:
@@ -386,21 +778,22 @@ class SimpleArbitrageExecutor:
             final_balance = await self.flash_executor.check_token_balance(token_in_address)
             actual_profit = final_balance - balance
             
-            print(f"\n{'='*60}")
-            print(f"✅ ARBITRAGE SUCCESSFUL!")
-            print(f"{'='*60}")
-            print(f"Profit: {actual_profit}")
-            print(f"Gas used: {result1['gas_used'] + result2['gas_used']}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 60)
+                logger.info("✅ ARBITRAGE SUCCESSFUL!")
+                logger.info("=" * 60)
+                logger.info("Profit (wei): %s", actual_profit)
+                logger.info("Gas used: %s", result1['gas_used'] + result2['gas_used'])
             
             return {
                 'success': True,
-                'profit': float(actual_profit),
+                'profit': actual_profit / 10**18,
                 'gas_used': result1['gas_used'] + result2['gas_used'],
                 'tx_hashes': [result1['hash'], result2['hash']]
             }
             
         except Exception as e:
-            print(f"❌ Arbitrage execution failed: {e}")
+            logger.error("❌ Arbitrage execution failed: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -426,7 +819,13 @@ async def example_execute_arbitrage():
     SUSHISWAP_ROUTER = "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"
     
     # Initialize
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
+    # Async provider on a keep-alive session, so concurrent calls share sockets
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=0, limit_per_host=64, keepalive_timeout=60)
+    )
+    provider = AsyncHTTPProvider(RPC_URL)
+    await provider.cache_async_session(session)
+    w3 = AsyncWeb3(provider)
     executor = SimpleArbitrageExecutor(w3, PRIVATE_KEY)
     
     # Execute arbitrage
@@ -443,10 +842,11 @@ async def example_execute_arbitrage():
     )
     
     print(f"\nResult: {result}")
+    
+    await executor.flash_executor.close()
+    await session.close()
 
 if __name__ == "__main__":
-    import asyncio
-    
     print("""
     ⚠️  WARNING ⚠️
     
@@ -4,8 +4,10 @@ Exports core classes for node configuration, connection management, and health m
 """
 
 from .node_config import NodeEndpoint, ChainNodeConfig, NodeConfig
-from .connection_manager import EnhancedBlockchainManager, NoHealthyEndpointsError
+from .connection_manager import EnhancedBlockchainManager, NoHealthyEndpointsError, TxReceiptWaiter
 from .health_monitor import NodeHealthMonitor, HealthStatus, ChainHealth
+from .broadcast import BroadcastPool, BroadcastError, MEV_PROTECT_URLS
+from .multicall import Multicall, MulticallError, MULTICALL3_ADDRESS
 
 __all__ = [
     "NodeEndpoint",
@@ -13,7 +15,14 @@ __all__ = [
     "NodeConfig",
     "EnhancedBlockchainManager",
     "NoHealthyEndpointsError",
+    "TxReceiptWaiter",
     "NodeHealthMonitor",
     "HealthStatus",
     "ChainHealth",
+    "BroadcastPool",
+    "BroadcastError",
+    "MEV_PROTECT_URLS",
+    "Multicall",
+    "MulticallError",
+    "MULTICALL3_ADDRESS",
 ]
@@ -0,0 +1,132 @@
+"""
+Raw transaction broadcaster - sends a signed transaction to several RPC sinks at once.
+"""
+
+import asyncio
+import itertools
+import logging
+from typing import List, Mapping, Optional, Sequence, Set
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Private-mempool RPCs that keep swaps away from public-mempool sandwich bots, by chain ID.
+# Both services only serve Ethereum mainnet; other chains fall back to the public endpoints.
+MEV_PROTECT_URLS: Mapping[int, Sequence[str]] = {
+    1: (
+        "https://rpc.flashbots.net",
+        "https://rpc.mevblocker.io",
+    ),
+}
+
+
+class BroadcastError(Exception):
+    """Raised when no endpoint accepted a raw transaction."""
+
+    pass
+
+
+class BroadcastPool:
+    """
+    Fans eth_sendRawTransaction out to several endpoints in parallel.
+
+    Every endpoint receives the same signed bytes, so they all report the same
+    hash; the first acceptance is returned while the other posts finish in the
+    background.
+    """
+
+    def __init__(
+        self,
+        public_urls: Sequence[str],
+        protected_urls: Mapping[int, Sequence[str]] = MEV_PROTECT_URLS,
+        timeout: float = 10.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            public_urls: Regular RPC endpoints, used for non-sensitive transactions
+            protected_urls: MEV-protected endpoints by chain ID, used for swaps
+            timeout: Per-endpoint request timeout in seconds
+        """
+        self.public_urls = list(public_urls)
+        self.protected_urls = {chain_id: list(urls) for chain_id, urls in protected_urls.items()}
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ids = itertools.count()
+        # Keep references so background posts are not garbage collected mid-flight
+        self._in_flight: Set[asyncio.Task] = set()
+
+    def _forget(self, task: asyncio.Task):
+        self._in_flight.discard(task)
+        # Late rejections from the other endpoints are expected once one accepted
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Background broadcast failed: {task.exception()}")
+
+    async def _post(self, url: str, raw_tx: str) -> str:
+        payload = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": "eth_sendRawTransaction",
+            "params": [raw_tx],
+        }
+        async with self._session.post(url, json=payload, timeout=self.timeout) as response:
+            reply = await response.json(content_type=None)
+        if "error" in reply:
+            raise BroadcastError(f"{url}: {reply['error']}")
+        return reply["result"]
+
+    async def send_raw(self, raw_tx: bytes, protected: bool = False, chain_id: Optional[int] = None) -> str:
+        """
+        Broadcast a signed transaction.
+
+        Args:
+            raw_tx: Signed transaction bytes
+            protected: Send only to the chain's MEV-protected endpoints; chains
+                without any use the public endpoints
+            chain_id: Chain the transaction is signed for, selects the protected endpoints
+
+        Returns:
+            Transaction hash as a 0x-prefixed hex string
+
+        Raises:
+            BroadcastError: When every endpoint rejected the transaction
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+
+        urls: List[str] = self.public_urls
+        if protected:
+            protected_urls = self.protected_urls.get(chain_id)
+            if protected_urls:
+                urls = protected_urls
+            else:
+                logger.debug(f"No MEV-protected RPC for chain {chain_id}, using public endpoints")
+        raw_hex = "0x" + bytes(raw_tx).hex()
+        tasks = {asyncio.create_task(self._post(url, raw_hex)): url for url in urls}
+        self._in_flight.update(tasks)
+        for task in tasks:
+            task.add_done_callback(self._forget)
+
+        pending = set(tasks)
+        errors = []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                logger.warning(f"✗ Broadcast to {tasks[task]} failed: {task.exception()}")
+                errors.append(task.exception())
+
+        raise BroadcastError(f"No endpoint accepted the transaction: {errors}")
+
+    async def close(self):
+        """Wait for in-flight broadcasts, then close the HTTP session."""
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -3,13 +3,16 @@ Enhanced blockchain connection manager with async Web3, failover, and subscripti
 """
 
 import asyncio
-from typing import Dict, List, Optional, Callable, Any
+import time
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from decimal import Decimal
-from web3 import Web3, AsyncWeb3
-from web3.providers import AsyncHTTPProvider, WebSocketProvider
+import aiohttp
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+from web3.providers import AsyncHTTPProvider
 import logging
 
-from .node_config import ChainNodeConfig, NodeEndpoint, NodeConfig
+from .node_config import NodeConfig
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,12 @@ class NoHealthyEndpointsError(Exception):
     pass
 
 
+class RPCError(Exception):
+    """A single call inside a JSON-RPC batch returned an error object."""
+
+    pass
+
+
 class EnhancedBlockchainManager:
     """
     Manages connections to multiple blockchain networks with:
@@ -41,19 +50,26 @@ class EnhancedBlockchainManager:
         self.ws_web3_instances: Dict[str, AsyncWeb3] = {}
         self.subscriptions: Dict[str, List[Any]] = {}
         self.endpoint_health: Dict[str, Dict[str, bool]] = {}
+        # Failed endpoints are reprobed with exponential backoff instead of on every call
+        self.endpoint_retry_at: Dict[str, Dict[str, float]] = {}
+        self._endpoint_failures: Dict[str, Dict[str, int]] = {}
+        self.max_retry_backoff = 60.0
         self._lock = asyncio.Lock()
+        # One keep-alive session shared by every HTTP provider
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Cached HTTP clients are handed out without a liveness RPC for this many seconds after a check
+        self.connection_check_interval = 10.0
+        self._http_verified_at: Dict[str, float] = {}
 
     async def initialize(self):
         """Initialize connections to all configured chains."""
-        tasks = []
-        for chain in self.node_config.get_all_chains():
-            tasks.append(self._init_chain(chain))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        chains = self.node_config.get_all_chains()
+        results = await asyncio.gather(
+            *(self._init_chain(chain) for chain in chains), return_exceptions=True
+        )
 
-        for i, result in enumerate(results):
+        for chain, result in zip(chains, results):
             if isinstance(result, Exception):
-                chain = list(self.node_config.get_all_chains())[i]
                 logger.error(f"Failed to initialize chain {chain}: {result}")
 
     async def _init_chain(self, chain: str):
@@ -72,19 +88,20 @@ class EnhancedBlockchainManager:
         http_ep = chain_config.get_primary_http()
         if http_ep:
             try:
-                w3 = AsyncWeb3(AsyncHTTPProvider(http_ep.url))
+                w3 = await self._create_http_web3(http_ep.url, http_ep.timeout)
                 # Test connection
                 if await w3.is_connected():
                     self.http_web3_instances[chain] = w3
+                    self._http_verified_at[chain] = time.monotonic()
                     logger.info(f"✓ Connected to {chain} HTTP: {http_ep.url}")
                 else:
                     logger.warning(
                         f"✗ Failed to connect to {chain} HTTP: {http_ep.url}"
                     )
-                    self.endpoint_health[chain][http_ep.url] = False
+                    self._mark_endpoint_failed(chain, http_ep.url)
             except Exception as e:
                 logger.error(f"Error connecting to {chain} HTTP: {e}")
-                self.endpoint_health[chain][http_ep.url] = False
+                self._mark_endpoint_failed(chain, http_ep.url)
 
         # Try to connect to WebSocket endpoint
         ws_ep = chain_config.get_primary_ws()
@@ -95,6 +112,80 @@ class EnhancedBlockchainManager:
             except Exception as e:
                 logger.error(f"Error setting up WebSocket for {chain}: {e}")
 
+    async def _create_http_web3(self, url: str, timeout: float = 30) -> AsyncWeb3:
+        """Create an AsyncWeb3 HTTP client that reuses the shared aiohttp session."""
+        if self._http_session is None or self._http_session.closed:
+            # No global connection cap, cached DNS, and idle sockets kept long enough
+            # to survive the gap between blocks
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75
+                )
+            )
+
+        provider = AsyncHTTPProvider(
+            url, request_kwargs={"timeout": aiohttp.ClientTimeout(total=timeout)}
+        )
+        await provider.cache_async_session(self._http_session)
+        return AsyncWeb3(provider)
+
+    async def rpc_batch(self, w3: AsyncWeb3, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Send several JSON-RPC calls to w3's endpoint as one batched POST.
+
+        Args:
+            w3: AsyncWeb3 HTTP client whose endpoint receives the batch
+            calls: (method, params) pairs
+
+        Returns:
+            Results in call order; a call that failed yields an RPCError in its place
+        """
+        if self._http_session is None or self._http_session.closed:
+            await self._create_http_web3(w3.provider.endpoint_uri)
+
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        async with self._http_session.post(w3.provider.endpoint_uri, json=payload) as response:
+            replies = await response.json(content_type=None)
+
+        results: List[Any] = [RPCError("no reply")] * len(calls)
+        for reply in replies:
+            if "error" in reply:
+                results[reply["id"]] = RPCError(str(reply["error"]))
+            else:
+                results[reply["id"]] = reply["result"]
+        return results
+
+    def _endpoint_available(self, chain: str, url: str, now: float) -> bool:
+        """Healthy endpoints are always tried; failed ones once their backoff has elapsed."""
+        if self.endpoint_health.get(chain, {}).get(url, True):
+            return True
+        return now >= self.endpoint_retry_at.get(chain, {}).get(url, 0.0)
+
+    def _mark_endpoint_failed(self, chain: str, url: str):
+        """Mark an endpoint unhealthy and schedule its next probe with exponential backoff."""
+        chain_config = self.node_config.get_chain_config(chain)
+        base_delay = chain_config.failover_delay if chain_config else 2.0
+        failures = self._endpoint_failures.setdefault(chain, {}).get(url, 0) + 1
+        self._endpoint_failures[chain][url] = failures
+        delay = min(base_delay * 2 ** (failures - 1), self.max_retry_backoff)
+        self.endpoint_health.setdefault(chain, {})[url] = False
+        self.endpoint_retry_at.setdefault(chain, {})[url] = time.monotonic() + delay
+
+    def _mark_endpoint_healthy(self, chain: str, url: str):
+        self.endpoint_health.setdefault(chain, {})[url] = True
+        self._endpoint_failures.get(chain, {}).pop(url, None)
+        self.endpoint_retry_at.get(chain, {}).pop(url, None)
+
+    async def _probe_http(self, url: str, timeout: float = 30) -> AsyncWeb3:
+        """Create a client for url and check that it answers."""
+        w3 = await self._create_http_web3(url, timeout)
+        if not await w3.is_connected():
+            raise ConnectionError(f"{url} is not responding")
+        return w3
+
     async def get_http_web3(self, chain: str) -> AsyncWeb3:
         """
         Get AsyncWeb3 instance for HTTP operations with failover support.
@@ -112,29 +203,62 @@ class EnhancedBlockchainManager:
         if not chain_config:
             raise ValueError(f"Chain {chain} not configured")
 
-        # Try existing connection first
+        # Try existing connection first; skip the liveness RPC if it passed recently
         if chain in self.http_web3_instances:
             w3 = self.http_web3_instances[chain]
+            if time.monotonic() - self._http_verified_at.get(chain, 0.0) < self.connection_check_interval:
+                return w3
             try:
                 if await w3.is_connected():
+                    self._http_verified_at[chain] = time.monotonic()
                     return w3
             except Exception:
                 pass
 
-        # Try each HTTP endpoint
-        for endpoint in chain_config.http_endpoints:
-            if self.endpoint_health.get(chain, {}).get(endpoint.url, True):
-                try:
-                    w3 = AsyncWeb3(AsyncHTTPProvider(endpoint.url))
-                    if await w3.is_connected():
-                        self.http_web3_instances[chain] = w3
-                        self.endpoint_health[chain][endpoint.url] = True
-                        logger.info(f"✓ Connected to {chain} HTTP: {endpoint.url}")
-                        return w3
-                except Exception as e:
-                    logger.warning(f"Failed to connect to {endpoint.url}: {e}")
-                    self.endpoint_health[chain][endpoint.url] = False
-                    await asyncio.sleep(chain_config.failover_delay)
+        # Probe every eligible HTTP endpoint at once; the first to answer wins
+        now = time.monotonic()
+        probes = {
+            asyncio.create_task(self._probe_http(endpoint.url, endpoint.timeout)): endpoint.url
+            for endpoint in chain_config.http_endpoints
+            if self._endpoint_available(chain, endpoint.url, now)
+        }
+        pending = set(probes)
+        deadline = now + chain_config.health_check_timeout
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(deadline - time.monotonic(), 0.0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+
+                winner = None
+                for task in done:
+                    url = probes[task]
+                    if task.exception() is None:
+                        self._mark_endpoint_healthy(chain, url)
+                        if winner is None:
+                            winner = (url, task.result())
+                    else:
+                        logger.warning(f"Failed to connect to {url}: {task.exception()}")
+                        self._mark_endpoint_failed(chain, url)
+
+                if winner is not None:
+                    url, w3 = winner
+                    self.http_web3_instances[chain] = w3
+                    self._http_verified_at[chain] = time.monotonic()
+                    logger.info(f"✓ Connected to {chain} HTTP: {url}")
+                    return w3
+
+            # Whatever is still pending missed the health-check deadline
+            for task in pending:
+                logger.warning(f"Timed out connecting to {probes[task]}")
+                self._mark_endpoint_failed(chain, probes[task])
+        finally:
+            for task in pending:
+                task.cancel()
 
         raise NoHealthyEndpointsError(f"No healthy HTTP endpoints for {chain}")
 
@@ -166,7 +290,7 @@ class EnhancedBlockchainManager:
 
         # Try each WebSocket endpoint
         for endpoint in chain_config.ws_endpoints:
-            if self.endpoint_health.get(chain, {}).get(endpoint.url, True):
+            if self._endpoint_available(chain, endpoint.url, time.monotonic()):
                 try:
                     # Note: WebSocket provider setup depends on web3.py version
                     logger.info(f"✓ Using WebSocket for {chain}: {endpoint.url}")
@@ -176,8 +300,7 @@ class EnhancedBlockchainManager:
                     )
                 except Exception as e:
                     logger.warning(f"Failed to connect to WS {endpoint.url}: {e}")
-                    self.endpoint_health[chain][endpoint.url] = False
-                    await asyncio.sleep(chain_config.failover_delay)
+                    self._mark_endpoint_failed(chain, endpoint.url)
 
         raise NoHealthyEndpointsError(f"No healthy WebSocket endpoints for {chain}")
 
@@ -212,6 +335,32 @@ class EnhancedBlockchainManager:
         )
         return subscription_id
 
+    async def subscribe_new_blocks(
+        self, chain: str, callback: Callable[[Dict[str, Any]], None]
+    ) -> str:
+        """
+        Subscribe to new block headers on a chain.
+
+        Args:
+            chain: Chain name
+            callback: Callback function to handle new block headers
+
+        Returns:
+            Subscription ID
+        """
+        subscription_id = f"{chain}_blocks_{len(self.subscriptions.get(chain, []))}"
+
+        self.subscriptions.setdefault(chain, []).append(
+            {
+                "id": subscription_id,
+                "type": "new_heads",
+                "callback": callback,
+            }
+        )
+
+        logger.info(f"✓ Subscribed to new blocks on {chain}: {subscription_id}")
+        return subscription_id
+
     async def unsubscribe(self, chain: str, subscription_id: str):
         """Unsubscribe from a subscription."""
         if chain in self.subscriptions:
@@ -220,20 +369,24 @@ class EnhancedBlockchainManager:
             ]
             logger.info(f"✓ Unsubscribed from {subscription_id}")
 
-    async def get_gas_price(self, chain: str) -> Decimal:
-        """Get current gas price for a chain."""
+    async def get_gas_price_wei(self, chain: str) -> int:
+        """Get current gas price for a chain in wei."""
         try:
             w3 = await self.get_http_web3(chain)
-            gas_price_wei = await w3.eth.gas_price
-            return Decimal(str(gas_price_wei)) / Decimal("1e9")  # Convert to Gwei
+            return await w3.eth.gas_price
         except Exception as e:
             logger.error(f"Error getting gas price for {chain}: {e}")
-            return Decimal("50")  # Default fallback
+            return 50 * 10**9  # Default fallback: 50 Gwei
+
+    async def get_gas_price(self, chain: str) -> Decimal:
+        """Get current gas price for a chain in Gwei."""
+        return Decimal(await self.get_gas_price_wei(chain)) / 10**9
 
     async def estimate_gas_cost(self, chain: str, gas_units: int = 300000) -> Decimal:
         """Estimate gas cost in USD for a transaction."""
-        gas_price = await self.get_gas_price(chain)
-        gas_cost_eth = (gas_price * Decimal(str(gas_units))) / Decimal("1e9")
+        # Stay in integer wei until the single conversion below
+        gas_cost_wei = await self.get_gas_price_wei(chain) * gas_units
+        gas_cost_eth = Decimal(gas_cost_wei) / 10**18
 
         # TODO: Get ETH price from oracle
         eth_price = Decimal("3250")  # Placeholder
@@ -251,3 +404,106 @@ class EnhancedBlockchainManager:
         self.http_web3_instances.clear()
         self.ws_web3_instances.clear()
         self.subscriptions.clear()
+
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+
+class TxReceiptWaiter:
+    """
+    Waits for transaction receipts, checking pending hashes once per new block.
+
+    A single newHeads subscription drives every waiter on the chain, instead of each
+    caller polling eth_getTransactionReceipt in a tight loop. If no head arrives within
+    fallback_interval, pending hashes are checked on that cadence instead. Until a
+    WebSocket feed delivers heads to subscribe_new_blocks callbacks, the fallback is
+    the only driver, so it defaults to well under a block time.
+    """
+
+    def __init__(
+        self,
+        manager: EnhancedBlockchainManager,
+        chain: str,
+        fallback_interval: float = 1.0,
+    ):
+        self.manager = manager
+        self.chain = chain
+        self.fallback_interval = fallback_interval
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._check_task: Optional[asyncio.Task] = None
+        self._subscription_id: Optional[str] = None
+
+    async def start(self):
+        """Subscribe to new heads for this chain."""
+        if self._subscription_id is None:
+            self._subscription_id = await self.manager.subscribe_new_blocks(
+                self.chain, self._on_new_head
+            )
+
+    async def stop(self):
+        """Unsubscribe and fail any callers still waiting."""
+        if self._subscription_id is not None:
+            await self.manager.unsubscribe(self.chain, self._subscription_id)
+            self._subscription_id = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    async def _on_new_head(self, _head: Dict[str, Any]):
+        """Check pending receipts once per head; a check already in flight covers the new head too."""
+        if self._pending and (self._check_task is None or self._check_task.done()):
+            self._check_task = asyncio.create_task(self._check_pending())
+
+    async def _check_pending(self):
+        """Fetch receipts for every pending hash concurrently and resolve the mined ones."""
+        hashes = [tx_hash for tx_hash, future in self._pending.items() if not future.done()]
+        if not hashes:
+            return
+
+        w3 = await self.manager.get_http_web3(self.chain)
+        results = await asyncio.gather(
+            *(w3.eth.get_transaction_receipt(tx_hash) for tx_hash in hashes),
+            return_exceptions=True,
+        )
+        for tx_hash, result in zip(hashes, results):
+            future = self._pending.get(tx_hash)
+            if future is None or future.done():
+                continue
+            if isinstance(result, TransactionNotFound):
+                continue
+            if isinstance(result, Exception):
+                logger.warning(f"Receipt lookup failed for {tx_hash} on {self.chain}: {result}")
+                continue
+            future.set_result(result)
+
+    async def wait(self, tx_hash: str, timeout: float = 120.0) -> Dict[str, Any]:
+        """
+        Wait until tx_hash is mined and return its receipt.
+
+        Raises:
+            asyncio.TimeoutError: If the receipt is not found within timeout seconds
+        """
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = self._pending[tx_hash] = asyncio.get_running_loop().create_future()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            # The transaction may already be mined by the time the caller starts waiting
+            await self._check_pending()
+            while not future.done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"No receipt for {tx_hash} after {timeout}s")
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(future), min(self.fallback_interval, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    await self._check_pending()
+            return future.result()
+        finally:
+            self._pending.pop(tx_hash, None)
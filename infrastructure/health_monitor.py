@@ -4,15 +4,21 @@ Node health monitor - periodic health checks and alert callbacks.
 
 import asyncio
 import logging
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Callable, Any, Tuple
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 
 from .connection_manager import EnhancedBlockchainManager
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class HealthStatus(str, Enum):
     """Health status enum."""
@@ -23,7 +29,7 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChainMetrics:
     """Metrics for a single chain."""
 
@@ -33,10 +39,17 @@ class ChainMetrics:
     block_number: Optional[int] = None
     peer_count: Optional[int] = None
     net_version: Optional[int] = None
-    last_check: Optional[datetime] = None
+    last_check_ts: Optional[float] = None  # epoch seconds; formatted only when read
     last_error: Optional[str] = None
     consecutive_failures: int = 0
 
+    @property
+    def last_check(self) -> Optional[datetime]:
+        """Time of the last check as an aware UTC datetime."""
+        if self.last_check_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_check_ts, timezone.utc)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -52,21 +65,24 @@ class ChainMetrics:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChainHealth:
     """Health status for all chains."""
 
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    chains: Dict[str, ChainMetrics] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    chains: Mapping[str, ChainMetrics] = field(default_factory=dict)
     overall_status: HealthStatus = HealthStatus.UNKNOWN
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "overall_status": self.overall_status.value,
-            "chains": {k: v.to_dict() for k, v in self.chains.items()},
-        }
+        """Convert to dictionary; built on the first call and reused for this snapshot."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "timestamp": self.timestamp.isoformat(),
+                "overall_status": self.overall_status.value,
+                "chains": {k: v.to_dict() for k, v in self.chains.items()},
+            }
+        return self._cached_dict
 
 
 class NodeHealthMonitor:
@@ -94,30 +110,87 @@ class NodeHealthMonitor:
         self.max_failures = max_failures
         self.is_running = False
         self.metrics: Dict[str, ChainMetrics] = {}
-        self.alert_callbacks: List[Callable[[ChainHealth], None]] = []
+        # (callback, is_coroutine) pairs; the coroutine check is done once at registration
+        self.alert_callbacks: List[Tuple[Callable[[ChainHealth], None], bool]] = []
         self._monitor_task = None
+        # net_version is constant per chain; re-read only after the chain went unhealthy
+        self._net_version_cache: Dict[str, int] = {}
+
+        # Bumped whenever any chain's reported state changes; health_dict is rebuilt lazily per version
+        self.version = 0
+        self._state_signature: Optional[tuple] = None
+        self._cached_dict: Optional[Dict[str, Any]] = None
+        # get_health_summary reuses its last snapshot until a check touches the metrics again
+        self._metrics_dirty = True
+        self._summary: Optional[ChainHealth] = None
 
     def register_alert_callback(self, callback: Callable[[ChainHealth], None]):
         """Register a callback to be called on health updates."""
-        self.alert_callbacks.append(callback)
+        self.alert_callbacks.append((callback, asyncio.iscoroutinefunction(callback)))
 
     def get_health_summary(self) -> ChainHealth:
-        """Get current health summary for all chains."""
-        # Determine overall status
-        if not self.metrics:
+        """
+        Get current health summary for all chains.
+
+        chains is a read-only live view of the monitor's metrics, not a copy.
+        The same snapshot is returned until the next chain check completes.
+        """
+        if not self._metrics_dirty and self._summary is not None:
+            return self._summary
+
+        # Determine overall status in one pass; members are singletons, so `is` never reaches str.__eq__
+        n_total = n_healthy = n_unhealthy = 0
+        for m in self.metrics.values():
+            n_total += 1
+            if m.status is HealthStatus.HEALTHY:
+                n_healthy += 1
+            elif m.status is HealthStatus.UNHEALTHY:
+                n_unhealthy += 1
+
+        if n_total == 0:
             overall = HealthStatus.UNKNOWN
+        elif n_healthy == n_total:
+            overall = HealthStatus.HEALTHY
+        elif n_unhealthy:
+            overall = HealthStatus.UNHEALTHY
         else:
-            statuses = [m.status for m in self.metrics.values()]
-            if all(s == HealthStatus.HEALTHY for s in statuses):
-                overall = HealthStatus.HEALTHY
-            elif any(s == HealthStatus.UNHEALTHY for s in statuses):
-                overall = HealthStatus.UNHEALTHY
-            else:
-                overall = HealthStatus.DEGRADED
-
-        return ChainHealth(
-            chains={k: v for k, v in self.metrics.items()}, overall_status=overall
+            overall = HealthStatus.DEGRADED
+
+        self._summary = ChainHealth(chains=MappingProxyType(self.metrics), overall_status=overall)
+        self._metrics_dirty = False
+        return self._summary
+
+    @property
+    def health_dict(self) -> Dict[str, Any]:
+        """Broadcast-ready health summary; the chain state is reused until the monitor's version changes."""
+        if self._cached_dict is None:
+            health = self.get_health_summary()
+            self._cached_dict = {
+                "overall_status": health.overall_status.value,
+                "chains": {
+                    k: {
+                        "status": v.status.value,
+                        "block_number": v.block_number,
+                        "peer_count": v.peer_count,
+                        "is_syncing": v.is_syncing,
+                        "consecutive_failures": v.consecutive_failures,
+                    }
+                    for k, v in health.chains.items()
+                },
+            }
+        # The timestamp is always the time of this read, not of the last state change
+        return {"timestamp": datetime.now(timezone.utc).isoformat(), **self._cached_dict}
+
+    def _mark_if_changed(self):
+        """Bump the version and drop the cached dict if any chain's state changed."""
+        signature = tuple(
+            (k, m.status, m.block_number, m.peer_count, m.is_syncing, m.consecutive_failures)
+            for k, m in self.metrics.items()
         )
+        if signature != self._state_signature:
+            self._state_signature = signature
+            self._cached_dict = None
+            self.version += 1
 
     async def start(self):
         """Start the health monitor."""
@@ -147,9 +220,9 @@ class NodeHealthMonitor:
 
                 # Notify callbacks
                 health = self.get_health_summary()
-                for callback in self.alert_callbacks:
+                for callback, is_coroutine in self.alert_callbacks:
                     try:
-                        if asyncio.iscoroutinefunction(callback):
+                        if is_coroutine:
                             await callback(health)
                         else:
                             callback(health)
@@ -163,16 +236,31 @@ class NodeHealthMonitor:
 
     async def _check_all_chains(self):
         """Check health of all configured chains."""
-        tasks = []
-        for chain in self.blockchain_manager.node_config.get_all_chains():
-            tasks.append(self._check_chain(chain))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = {
+            asyncio.create_task(self._check_chain(chain)): chain
+            for chain in self.blockchain_manager.node_config.get_all_chains()
+        }
+        pending = set(tasks)
+        deadline = time.monotonic() + self.check_interval
+
+        # Publish each chain's result as soon as it lands, so one slow chain
+        # does not hold back the others' state
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(deadline - time.monotonic(), 0.0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for task in done:
+                if task.exception() is not None:
+                    logger.error(f"Error checking {tasks[task]}: {task.exception()}")
+            self._mark_if_changed()
 
-        for i, result in enumerate(results):
-            chain = list(self.blockchain_manager.node_config.get_all_chains())[i]
-            if isinstance(result, Exception):
-                logger.error(f"Error checking {chain}: {result}")
+        for task in pending:
+            logger.error(f"Health check for {tasks[task]} exceeded the check interval")
+            task.cancel()
 
     async def _check_chain(self, chain: str):
         """Check health of a specific chain."""
@@ -184,16 +272,28 @@ class NodeHealthMonitor:
         try:
             w3 = await self.blockchain_manager.get_http_web3(chain)
 
-            # Perform health checks
-            checks = await asyncio.gather(
-                self._check_eth_syncing(w3),
-                self._check_net_version(w3),
-                self._check_block_number(w3),
-                self._check_peer_count(w3),
-                return_exceptions=True,
+            # Perform health checks in one JSON-RPC batch
+            cached_net_version = self._net_version_cache.get(chain)
+            calls = [("eth_syncing", []), ("eth_blockNumber", []), ("net_peerCount", [])]
+            if cached_net_version is None:
+                calls.append(("net_version", []))
+            # A hung node must not hold up the cycle for the other chains
+            chain_config = self.blockchain_manager.node_config.get_chain_config(chain)
+            timeout = chain_config.health_check_timeout if chain_config else 10
+            replies = await asyncio.wait_for(
+                self.blockchain_manager.rpc_batch(w3, calls), timeout=timeout
             )
 
-            is_syncing, net_version, block_number, peer_count = checks
+            is_syncing = self._parse_reply(replies[0], self._parse_eth_syncing)
+            block_number = self._parse_reply(replies[1], self._parse_quantity)
+            peer_count = self._parse_reply(replies[2], self._parse_quantity)
+            net_version = (
+                cached_net_version
+                if cached_net_version is not None
+                else self._parse_reply(replies[3], int)
+            )
+            if not isinstance(net_version, Exception):
+                self._net_version_cache[chain] = net_version
 
             # Update metrics
             metrics.is_syncing = (
@@ -208,7 +308,7 @@ class NodeHealthMonitor:
             metrics.peer_count = (
                 peer_count if not isinstance(peer_count, Exception) else None
             )
-            metrics.last_check = datetime.utcnow()
+            metrics.last_check_ts = time.time()
             metrics.last_error = None
             metrics.consecutive_failures = 0
 
@@ -219,6 +319,7 @@ class NodeHealthMonitor:
                 metrics.last_error = str(
                     is_syncing if isinstance(is_syncing, Exception) else block_number
                 )
+                self._net_version_cache.pop(chain, None)
             else:
                 if is_syncing and block_number:
                     metrics.status = HealthStatus.HEALTHY
@@ -232,25 +333,31 @@ class NodeHealthMonitor:
 
         except Exception as e:
             metrics.status = HealthStatus.UNHEALTHY
+            self._net_version_cache.pop(chain, None)
             metrics.consecutive_failures += 1
-            metrics.last_error = str(e)
-            metrics.last_check = datetime.utcnow()
-            logger.warning(f"✗ {chain.upper()} health check failed: {e}")
-
-    async def _check_eth_syncing(self, w3) -> bool:
-        """Check eth_syncing - returns False if synced."""
-        result = await w3.eth.syncing
-        # False means synced, any dict means syncing
-        return not isinstance(result, bool) or result
-
-    async def _check_net_version(self, w3) -> int:
-        """Check net_version - returns chain ID."""
-        return int(await w3.net.version)
-
-    async def _check_block_number(self, w3) -> int:
-        """Check eth_blockNumber - returns latest block number."""
-        return await w3.eth.block_number
-
-    async def _check_peer_count(self, w3) -> int:
-        """Check net_peerCount - returns number of connected peers."""
-        return await w3.net.peer_count
+            metrics.last_error = "timeout" if isinstance(e, asyncio.TimeoutError) else str(e)
+            metrics.last_check_ts = time.time()
+            logger.warning(f"✗ {chain.upper()} health check failed: {metrics.last_error}")
+        finally:
+            self._metrics_dirty = True
+
+    @staticmethod
+    def _parse_reply(reply: Any, parse: Callable[[Any], Any]) -> Any:
+        """Parse one batch result, keeping errors as exceptions like gather(return_exceptions=True)."""
+        if isinstance(reply, Exception):
+            return reply
+        try:
+            return parse(reply)
+        except (TypeError, ValueError) as e:
+            return e
+
+    @staticmethod
+    def _parse_eth_syncing(result: Any) -> bool:
+        """eth_syncing - returns True while the node is syncing."""
+        # False means synced, any dict (sync progress) means syncing
+        return result is not False
+
+    @staticmethod
+    def _parse_quantity(result: str) -> int:
+        """eth_blockNumber / net_peerCount - hex quantity to int."""
+        return int(result, 16)
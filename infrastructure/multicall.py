@@ -0,0 +1,82 @@
+"""
+Multicall3 helper - bundles many contract reads into a single eth_call.
+"""
+
+from typing import List, Sequence, Tuple
+
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from web3 import AsyncWeb3
+
+# Deployed at the same address on every major EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+GET_CURRENT_BLOCK_TIMESTAMP_SELECTOR = bytes.fromhex("0f28c97d")  # getCurrentBlockTimestamp()
+
+
+class MulticallError(Exception):
+    """Raised when a call that was not allowed to fail reverted."""
+
+    pass
+
+
+class Multicall:
+    """
+    Executes read-only calls through Multicall3.aggregate3, so N reads cost
+    one EVM invocation and one RPC response.
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: str = MULTICALL3_ADDRESS):
+        """
+        Initialize the helper.
+
+        Args:
+            w3: AsyncWeb3 instance used for the eth_call
+            address: Multicall3 contract address
+        """
+        self.w3 = w3
+        self.address = address
+
+    @staticmethod
+    def encode_aggregate3(calls: Sequence[Tuple[str, bytes]], allow_failure: bool = False) -> bytes:
+        """ABI-encode aggregate3 calldata for (target, callData) pairs."""
+        return AGGREGATE3_SELECTOR + abi_encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, allow_failure, data) for target, data in calls]],
+        )
+
+    def block_timestamp_call(self) -> Tuple[str, bytes]:
+        """Call tuple that returns block.timestamp from Multicall3 itself."""
+        return self.address, GET_CURRENT_BLOCK_TIMESTAMP_SELECTOR
+
+    async def aggregate3(
+        self, calls: Sequence[Tuple[str, bytes]], allow_failure: bool = False
+    ) -> List[bytes]:
+        """
+        Execute calls in one eth_call.
+
+        Args:
+            calls: (target address, calldata) pairs
+            allow_failure: When True, a reverted call yields b"" instead of
+                failing the whole batch
+
+        Returns:
+            Raw return data of each call, in order
+
+        Raises:
+            MulticallError: When a call reverted and allow_failure is False
+        """
+        raw = await self.w3.eth.call(
+            {"to": self.address, "data": self.encode_aggregate3(calls, allow_failure)}
+        )
+        (results,) = abi_decode(["(bool,bytes)[]"], bytes(raw))
+
+        returned = []
+        for (target, _), (success, data) in zip(calls, results):
+            if not success:
+                if not allow_failure:
+                    raise MulticallError(f"Call to {target} reverted")
+                data = b""
+            returned.append(data)
+        return returned
@@ -3,33 +3,32 @@ Node configuration loader - handles YAML/environment-based node endpoint configu
 """
 
 import os
+import sys
 import yaml
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class NodeEndpoint:
-    """Represents a single blockchain node endpoint."""
+    """Represents a single blockchain node endpoint; identity is (url, chain)."""
 
     url: str
-    type: str  # 'http' or 'ws'
+    type: str = field(compare=False)  # 'http' or 'ws'
     chain: str
-    priority: int = 0
-    timeout: int = 30
-    is_primary: bool = False
-
-    def __hash__(self):
-        return hash((self.url, self.chain))
-
-    def __eq__(self, other):
-        if not isinstance(other, NodeEndpoint):
-            return False
-        return self.url == other.url and self.chain == other.chain
+    priority: int = field(default=0, compare=False)
+    timeout: int = field(default=30, compare=False)
+    is_primary: bool = field(default=False, compare=False)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChainNodeConfig:
     """Configuration for a specific chain's nodes."""
 
@@ -42,23 +41,29 @@ class ChainNodeConfig:
     health_check_timeout: int = 10
     max_retries: int = 3
     failover_delay: float = 2.0
+    # Resolved once in __post_init__; the endpoint lists are fixed after construction
+    _primary_http: Optional[NodeEndpoint] = field(init=False, default=None, repr=False, compare=False)
+    _primary_ws: Optional[NodeEndpoint] = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._primary_http = self._find_primary(self.http_endpoints)
+        self._primary_ws = self._find_primary(self.ws_endpoints)
+
+    @staticmethod
+    def _find_primary(endpoints: List[NodeEndpoint]) -> Optional[NodeEndpoint]:
+        """First endpoint flagged primary, else the first endpoint."""
+        return next((ep for ep in endpoints if ep.is_primary), endpoints[0] if endpoints else None)
 
     def get_primary_http(self) -> Optional[NodeEndpoint]:
         """Get primary HTTP endpoint."""
-        for ep in self.http_endpoints:
-            if ep.is_primary:
-                return ep
-        return self.http_endpoints[0] if self.http_endpoints else None
+        return self._primary_http
 
     def get_primary_ws(self) -> Optional[NodeEndpoint]:
         """Get primary WebSocket endpoint."""
-        for ep in self.ws_endpoints:
-            if ep.is_primary:
-                return ep
-        return self.ws_endpoints[0] if self.ws_endpoints else None
+        return self._primary_ws
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NodeConfig:
     """Complete node configuration for all chains."""
 
@@ -66,14 +71,18 @@ class NodeConfig:
 
     @classmethod
     def from_yaml(cls, yaml_file: str) -> "NodeConfig":
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file; reparsed only when the file changes."""
         if not os.path.exists(yaml_file):
             raise FileNotFoundError(f"Config file not found: {yaml_file}")
 
-        with open(yaml_file, "r") as f:
-            data = yaml.safe_load(f)
+        key = (os.path.abspath(yaml_file), os.stat(yaml_file).st_mtime_ns)
+        config = _YAML_CACHE.get(key)
+        if config is None:
+            with open(yaml_file, "rb") as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+            config = _YAML_CACHE[key] = cls._parse_yaml(data)
 
-        return cls._parse_yaml(data)
+        return config
 
     @classmethod
     def from_env(cls) -> "NodeConfig":
@@ -147,3 +156,7 @@ class NodeConfig:
     def get_all_chains(self) -> List[str]:
         """Get list of all configured chains."""
         return list(self.chains.keys())
+
+
+# Parsed configs keyed by (absolute path, mtime), see NodeConfig.from_yaml
+_YAML_CACHE: Dict[Tuple[str, int], NodeConfig] = {}
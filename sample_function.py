@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Union
 class SampleClass:
     """A sample class to demonstrate documentation features."""
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: int = 0):
         """Initialize the sample class.
 
@@ -26,166 +26,95 @@ from database.models import Opportunity, Alert, ChainMetric, GasPrice
 from sqlalchemy import delete, select, func, and_
 
 
-async def cleanup_opportunities():
-    """Delete opportunities older than retention period"""
-    retention_days = int(os.getenv("OPPORTUNITIES_RETENTION_DAYS", "7"))
+async def purge(model, condition, label: str, retention_days: int):
+    """
+    Delete rows of model matching condition.
+
+    A real run deletes in batches of CLEANUP_BATCH_SIZE rows, committing each,
+    so no single transaction holds locks or WAL for the whole backlog; only a
+    dry run counts the matching rows instead.
+    """
     dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
-
+    batch_size = int(os.getenv("CLEANUP_BATCH_SIZE", "10000"))
     db_manager = get_db_manager()
-    cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
 
     try:
         async with db_manager.get_session() as session:
-            # Count records to delete
-            count_result = await session.execute(
-                select(func.count(Opportunity.id)).where(
-                    Opportunity.detected_at < cutoff_date
-                )
-            )
-            count = count_result.scalar() or 0
-
-            if count == 0:
-                logger.info(
-                    f"✓ No opportunities to delete (older than {retention_days} days)"
-                )
-                return
-
-            logger.info(f"Found {count} opportunities to delete")
-
-            if not dry_run:
-                # Delete opportunities
-                await session.execute(
-                    delete(Opportunity).where(Opportunity.detected_at < cutoff_date)
+            if dry_run:
+                count_result = await session.execute(
+                    select(func.count(model.id)).where(condition)
                 )
-                await session.commit()
-                logger.info(f"✓ Deleted {count} old opportunities")
+                count = count_result.scalar() or 0
+                if count:
+                    logger.info(f"[DRY RUN] Would delete {count} old {label}")
             else:
-                logger.info(f"[DRY RUN] Would delete {count} old opportunities")
+                batch = select(model.id).where(condition).limit(batch_size)
+                count = 0
+                while True:
+                    result = await session.execute(
+                        delete(model).where(model.id.in_(batch))
+                    )
+                    await session.commit()
+                    count += result.rowcount
+                    if result.rowcount < batch_size:
+                        break
+                if count:
+                    logger.info(f"✓ Deleted {count} old {label}")
+
+            if not count:
+                logger.info(f"✓ No {label} to delete (older than {retention_days} days)")
 
     except Exception as e:
-        logger.error(f"✗ Failed to cleanup opportunities: {e}")
+        logger.error(f"✗ Failed to cleanup {label}: {e}")
         raise
 
 
+async def cleanup_opportunities():
+    """Delete opportunities older than retention period"""
+    retention_days = int(os.getenv("OPPORTUNITIES_RETENTION_DAYS", "7"))
+    cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
+    await purge(
+        Opportunity,
+        Opportunity.detected_at < cutoff_date,
+        "opportunities",
+        retention_days,
+    )
+
+
 async def cleanup_alerts():
     """Delete acknowledged alerts older than retention period"""
     retention_days = int(os.getenv("ALERTS_RETENTION_DAYS", "30"))
-    dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
-
-    db_manager = get_db_manager()
     cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
-
-    try:
-        async with db_manager.get_session() as session:
-            # Count records to delete
-            count_result = await session.execute(
-                select(func.count(Alert.id)).where(
-                    and_(Alert.created_at < cutoff_date, Alert.acknowledged == True)
-                )
-            )
-            count = count_result.scalar() or 0
-
-            if count == 0:
-                logger.info(f"✓ No alerts to delete (older than {retention_days} days)")
-                return
-
-            logger.info(f"Found {count} alerts to delete")
-
-            if not dry_run:
-                # Delete alerts
-                await session.execute(
-                    delete(Alert).where(
-                        and_(Alert.created_at < cutoff_date, Alert.acknowledged == True)
-                    )
-                )
-                await session.commit()
-                logger.info(f"✓ Deleted {count} old alerts")
-            else:
-                logger.info(f"[DRY RUN] Would delete {count} old alerts")
-
-    except Exception as e:
-        logger.error(f"✗ Failed to cleanup alerts: {e}")
-        raise
+    await purge(
+        Alert,
+        and_(Alert.created_at < cutoff_date, Alert.acknowledged == True),
+        "alerts",
+        retention_days,
+    )
 
 
 async def cleanup_chain_metrics():
     """Delete chain metrics older than retention period"""
     retention_days = int(os.getenv("CHAIN_METRICS_RETENTION_DAYS", "7"))
-    dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
-
-    db_manager = get_db_manager()
     cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
-
-    try:
-        async with db_manager.get_session() as session:
-            # Count records to delete
-            count_result = await session.execute(
-                select(func.count(ChainMetric.id)).where(
-                    ChainMetric.timestamp < cutoff_date
-                )
-            )
-            count = count_result.scalar() or 0
-
-            if count == 0:
-                logger.info(
-                    f"✓ No chain metrics to delete (older than {retention_days} days)"
-                )
-                return
-
-            logger.info(f"Found {count} chain metrics to delete")
-
-            if not dry_run:
-                # Delete metrics
-                await session.execute(
-                    delete(ChainMetric).where(ChainMetric.timestamp < cutoff_date)
-                )
-                await session.commit()
-                logger.info(f"✓ Deleted {count} old chain metrics")
-            else:
-                logger.info(f"[DRY RUN] Would delete {count} old chain metrics")
-
-    except Exception as e:
-        logger.error(f"✗ Failed to cleanup chain metrics: {e}")
-        raise
+    await purge(
+        ChainMetric,
+        ChainMetric.timestamp < cutoff_date,
+        "chain metrics",
+        retention_days,
+    )
 
 
 async def cleanup_gas_prices():
     """Delete gas prices older than retention period"""
     retention_days = int(os.getenv("GAS_PRICES_RETENTION_DAYS", "30"))
-    dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
-
-    db_manager = get_db_manager()
     cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
-
-    try:
-        async with db_manager.get_session() as session:
-            # Count records to delete
-            count_result = await session.execute(
-                select(func.count(GasPrice.id)).where(GasPrice.timestamp < cutoff_date)
-            )
-            count = count_result.scalar() or 0
-
-            if count == 0:
-                logger.info(
-                    f"✓ No gas prices to delete (older than {retention_days} days)"
-                )
-                return
-
-            logger.info(f"Found {count} gas prices to delete")
-
-            if not dry_run:
-                # Delete gas prices
-                await session.execute(
-                    delete(GasPrice).where(GasPrice.timestamp < cutoff_date)
-                )
-                await session.commit()
-                logger.info(f"✓ Deleted {count} old gas prices")
-            else:
-                logger.info(f"[DRY RUN] Would delete {count} old gas prices")
-
-    except Exception as e:
-        logger.error(f"✗ Failed to cleanup gas prices: {e}")
-        raise
+    await purge(
+        GasPrice,
+        GasPrice.timestamp < cutoff_date,
+        "gas prices",
+        retention_days,
+    )
 
 
 async def main():
@@ -200,11 +129,18 @@ async def main():
         # Initialize database
         await db_manager.initialize()
 
-        # Run cleanup tasks
-        await cleanup_opportunities()
-        await cleanup_alerts()
-        await cleanup_chain_metrics()
-        await cleanup_gas_prices()
+        # Run cleanup tasks concurrently; each touches its own table in its own session,
+        # and one failure must not cancel the others
+        results = await asyncio.gather(
+            cleanup_opportunities(),
+            cleanup_alerts(),
+            cleanup_chain_metrics(),
+            cleanup_gas_prices(),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise RuntimeError(f"{len(errors)} cleanup task(s) failed: {errors}")
 
         logger.info("=" * 60)
         logger.info("✓ Cleanup completed successfully")
@@ -5,116 +5,210 @@ Tests AI assistants, blockchain tools, and automation features.
 """
 
 import asyncio
-import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Dict, List, Any, Optional, Tuple
+
+import aiofiles
+import aiohttp
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+# Read size for the streaming docstring scan in _test_documentation
+DOC_SCAN_CHUNK_SIZE = 8192
+
+# Google-style docstring markers; each alternative is its own group so one scan tells them apart
+_DOC_RE = re.compile(rb'(""")|(Args:)|(Returns:)')
+_DOC_ALL_SEEN = (1 << _DOC_RE.groups) - 1
+_DOC_OVERLAP = len(b'Returns:') - 1
 
 
 class ExtensionTester:
     """Test VS Code extensions functionality."""
 
+    # Budget for a single check; a hung probe or tool degrades to a warning instead of stalling the run
+    CHECK_TIMEOUT = 10.0
+
+    # aiAssistants config key -> probe method, run when that assistant is enabled
+    AI_PROBES = {
+        "githubCopilot": "_test_copilot",
+        "tabnine": "_test_tabnine",
+        "codeium": "_test_codeium",
+        "continue": "_test_continue",
+        "cody": "_test_cody",
+    }
+
     def __init__(self, workspace_root: Path):
         self.workspace_root = workspace_root
         self.config_file = workspace_root / "ai-config.json"
         self.results = {}
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._config: Optional[Dict[str, Any]] = None
+        self._fixture_dir: Optional[Path] = None
+
+    def _fixture_path(self, name: str) -> Path:
+        """Path for a throwaway fixture file in this tester's private temp directory."""
+        if self._fixture_dir is None:
+            self._fixture_dir = Path(tempfile.mkdtemp(prefix="extension-tests-"))
+        return self._fixture_dir / name
+
+    async def _url_reachable(self, url: str) -> bool:
+        """HEAD url on the shared session; True if the service answered without a server error."""
+        if self._http is None or self._http.closed:
+            # One pooled session for every probe: DNS answers and keep-alive connections are reused
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=16, limit_per_host=4, ttl_dns_cache=600, enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+                raise_for_status=False,
+            )
+        try:
+            # HEAD: only the status matters, so skip the response body
+            async with self._http.head(url) as response:
+                return response.status < 500
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def _run(self, *argv: str, timeout: float = 30, cwd: Optional[Path] = None) -> Tuple[int, str, str]:
+        """Run a command without blocking the event loop; returns (returncode, stdout, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(list(argv), timeout)
+        except asyncio.CancelledError:
+            # The check's own budget ran out; do not leave the tool running
+            if proc.returncode is None:
+                proc.kill()
+            raise
+        return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
 
     async def load_config(self) -> Dict[str, Any]:
-        """Load AI configuration."""
+        """Load AI configuration; the file is parsed once per tester."""
+        if self._config is not None:
+            return self._config
+
         if not self.config_file.exists():
             print("❌ AI config file not found")
             return {}
 
-        with open(self.config_file, 'r') as f:
-            return json.load(f)
+        async with aiofiles.open(self.config_file, 'rb') as f:
+            self._config = orjson.loads(await f.read())
+        return self._config
 
-    async def test_ai_extensions(self) -> Dict[str, Any]:
-        """Test AI assistant extensions."""
-        print("🤖 Testing AI Extensions...")
-
-        config = await self.load_config()
-        ai_config = config.get("aiAssistants", {})
+    async def _run_checks(self, checks: Dict[str, Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run independent checks concurrently, each bounded by CHECK_TIMEOUT, and map each name to its result."""
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(check, timeout=self.CHECK_TIMEOUT) for check in checks.values()),
+            return_exceptions=True,
+        )
 
         results = {}
+        for name, outcome in zip(checks, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                outcome = {
+                    "status": "warning",
+                    "message": f"{name} check timed out after {self.CHECK_TIMEOUT:.0f}s"
+                }
+            elif isinstance(outcome, Exception):
+                outcome = {
+                    "status": "error",
+                    "message": f"{name} test failed: {str(outcome)}"
+                }
+            results[name] = outcome
+        return results
 
-        # Test GitHub Copilot
-        if ai_config.get("githubCopilot", {}).get("enabled"):
-            results["githubCopilot"] = await self._test_copilot()
-
-        # Test Tabnine
-        if ai_config.get("tabnine", {}).get("enabled"):
-            results["tabnine"] = await self._test_tabnine()
-
-        # Test Codeium
-        if ai_config.get("codeium", {}).get("enabled"):
-            results["codeium"] = await self._test_codeium()
+    async def test_ai_extensions(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Test AI assistant extensions."""
+        print("🤖 Testing AI Extensions...")
 
-        # Test Continue
-        if ai_config.get("continue", {}).get("enabled"):
-            results["continue"] = await self._test_continue()
+        if config is None:
+            config = await self.load_config()
+        ai_config = config.get("aiAssistants", {})
 
-        # Test Cody
-        if ai_config.get("cody", {}).get("enabled"):
-            results["cody"] = await self._test_cody()
+        checks = {
+            name: getattr(self, probe)()
+            for name, probe in self.AI_PROBES.items()
+            if ai_config.get(name, {}).get("enabled")
+        }
 
-        return results
+        return await self._run_checks(checks)
 
-    async def test_blockchain_extensions(self) -> Dict[str, Any]:
+    async def test_blockchain_extensions(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Test blockchain development extensions."""
         print("⛓️ Testing Blockchain Extensions...")
 
-        config = await self.load_config()
+        if config is None:
+            config = await self.load_config()
         blockchain_config = config.get("blockchainTools", {})
 
-        results = {}
+        checks = {}
 
         # Test Solidity extension
-        results["solidity"] = await self._test_solidity_extension()
+        checks["solidity"] = self._test_solidity_extension()
 
         # Test Hardhat
         if blockchain_config.get("hardhat"):
-            results["hardhat"] = await self._test_hardhat()
+            checks["hardhat"] = self._test_hardhat()
 
         # Test Solidity Visual Auditor
         if blockchain_config.get("auditor", {}).get("enabled"):
-            results["auditor"] = await self._test_solidity_auditor()
+            checks["auditor"] = self._test_solidity_auditor()
 
         # Test Ethover
         if blockchain_config.get("ethover", {}).get("enabled"):
-            results["ethover"] = await self._test_ethover()
+            checks["ethover"] = self._test_ethover()
 
-        return results
+        return await self._run_checks(checks)
 
     async def test_automation_features(self) -> Dict[str, Any]:
         """Test automation and productivity features."""
         print("⚡ Testing Automation Features...")
 
-        results = {}
-
-        # Test formatting automation
-        results["formatting"] = await self._test_formatting()
-
-        # Test linting automation
-        results["linting"] = await self._test_linting()
-
-        # Test import organization
-        results["imports"] = await self._test_imports()
-
-        # Test type checking
-        results["typeChecking"] = await self._test_type_checking()
-
-        # Test documentation automation
-        results["documentation"] = await self._test_documentation()
-
-        return results
+        # Four tool subprocesses, each started once on its own fixture, plus the docstring scan; all five overlap
+        return await self._run_checks({
+            # Test formatting automation
+            "formatting": self._test_formatting(),
+            # Test linting automation
+            "linting": self._test_linting(),
+            # Test import organization
+            "imports": self._test_imports(),
+            # Test type checking
+            "typeChecking": self._test_type_checking(),
+            # Test documentation automation
+            "documentation": self._test_documentation(),
+        })
 
     async def _test_copilot(self) -> Dict[str, Any]:
         """Test GitHub Copilot functionality."""
         try:
             # Check if Copilot is responding to code completions
-            test_file = self.workspace_root / "test_copilot.py"
+            test_file = self._fixture_path("test_copilot.py")
             test_content = '''
 def calculate_profit(price: float, cost: float) -> float:
     """Calculate profit from price and cost."""
@@ -122,11 +216,8 @@ def calculate_profit(price: float, cost: float) -> float:
     pass
 '''
 
-            with open(test_file, 'w') as f:
-                f.write(test_content)
-
-            # Simulate waiting for Copilot suggestions
-            await asyncio.sleep(2)
+            async with aiofiles.open(test_file, 'w') as f:
+                await f.write(test_content)
 
             return {
                 "status": "success",
@@ -139,21 +230,13 @@ def calculate_profit(price: float, cost: float) -> float:
                 "message": f"GitHub Copilot test failed: {str(e)}"
             }
         finally:
-            if test_file.exists():
-                test_file.unlink()
+            await asyncio.to_thread(test_file.unlink, missing_ok=True)
 
     async def _test_tabnine(self) -> Dict[str, Any]:
         """Test Tabnine AI assistant."""
         try:
             # Check Tabnine cloud connection
-            result = subprocess.run(
-                ["curl", "-s", "https://api.tabnine.com/health"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
+            if await self._url_reachable("https://api.tabnine.com/health"):
                 return {
                     "status": "success",
                     "message": "Tabnine cloud service accessible"
@@ -174,15 +257,10 @@ def calculate_profit(price: float, cost: float) -> float:
         """Test Codeium AI assistant."""
         try:
             # Check Codeium service availability
-            result = subprocess.run(
-                ["curl", "-s", "https://api.codeium.com/health"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            reachable = await self._url_reachable("https://api.codeium.com/health")
 
             return {
-                "status": "success" if result.returncode == 0 else "warning",
+                "status": "success" if reachable else "warning",
                 "message": "Codeium service checked"
             }
 
@@ -218,15 +296,10 @@ def calculate_profit(price: float, cost: float) -> float:
         """Test Cody AI assistant."""
         try:
             # Check Sourcegraph connection
-            result = subprocess.run(
-                ["curl", "-s", "https://api.sourcegraph.com/.api/graphql"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            reachable = await self._url_reachable("https://api.sourcegraph.com/.api/graphql")
 
             return {
-                "status": "success" if result.returncode == 0 else "warning",
+                "status": "success" if reachable else "warning",
                 "message": "Cody Sourcegraph API checked"
             }
 
@@ -240,7 +313,7 @@ def calculate_profit(price: float, cost: float) -> float:
         """Test Solidity language extension."""
         try:
             # Check if Solidity files are recognized
-            solidity_file = self.workspace_root / "test.sol"
+            solidity_file = self._fixture_path("test.sol")
             test_content = '''
 pragma solidity ^0.8.0;
 
@@ -253,8 +326,8 @@ contract TestContract {
 }
 '''
 
-            with open(solidity_file, 'w') as f:
-                f.write(test_content)
+            async with aiofiles.open(solidity_file, 'w') as f:
+                await f.write(test_content)
 
             # Check if file exists and can be read
             if solidity_file.exists():
@@ -274,25 +347,18 @@ contract TestContract {
                 "message": f"Solidity extension test failed: {str(e)}"
             }
         finally:
-            if solidity_file.exists():
-                solidity_file.unlink()
+            await asyncio.to_thread(solidity_file.unlink, missing_ok=True)
 
     async def _test_hardhat(self) -> Dict[str, Any]:
         """Test Hardhat functionality."""
         try:
             # Check if Hardhat is installed
-            result = subprocess.run(
-                ["npx", "hardhat", "--version"],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_root,
-                timeout=30
-            )
+            returncode, stdout, _ = await self._run("npx", "hardhat", "--version", cwd=self.workspace_root)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "status": "success",
-                    "message": f"Hardhat {result.stdout.strip()} is available"
+                    "message": f"Hardhat {stdout.strip()} is available"
                 }
             else:
                 return {
@@ -310,7 +376,7 @@ contract TestContract {
         """Test Solidity Visual Auditor."""
         try:
             # Check if auditor can analyze Solidity code
-            solidity_file = self.workspace_root / "audit_test.sol"
+            solidity_file = self._fixture_path("audit_test.sol")
             test_content = '''
 pragma solidity ^0.8.0;
 
@@ -326,11 +392,8 @@ contract VulnerableContract {
 }
 '''
 
-            with open(solidity_file, 'w') as f:
-                f.write(test_content)
-
-            # Auditor should detect issues
-            await asyncio.sleep(3)  # Allow auditor to analyze
+            async with aiofiles.open(solidity_file, 'w') as f:
+                await f.write(test_content)
 
             return {
                 "status": "success",
@@ -343,8 +406,7 @@ contract VulnerableContract {
                 "message": f"Solidity auditor test failed: {str(e)}"
             }
         finally:
-            if solidity_file.exists():
-                solidity_file.unlink()
+            await asyncio.to_thread(solidity_file.unlink, missing_ok=True)
 
     async def _test_ethover(self) -> Dict[str, Any]:
         """Test Ethover extension."""
@@ -365,7 +427,7 @@ contract VulnerableContract {
         """Test code formatting automation."""
         try:
             # Create a poorly formatted Python file
-            test_file = self.workspace_root / "format_test.py"
+            test_file = self._fixture_path("format_test.py")
             bad_content = '''
 import os,sys,json
 def test_function(  ):
@@ -373,18 +435,15 @@ def test_function(  ):
     return x
 '''
 
-            with open(test_file, 'w') as f:
-                f.write(bad_content)
+            async with aiofiles.open(test_file, 'w') as f:
+                await f.write(bad_content)
 
             # Run Black formatter
-            result = subprocess.run(
-                [sys.executable, "-m", "black", "--check", "--diff", str(test_file)],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_root
+            returncode, _, _ = await self._run(
+                sys.executable, "-m", "black", "--check", "--diff", str(test_file), cwd=self.workspace_root
             )
 
-            if result.returncode == 1:  # Black would reformat
+            if returncode == 1:  # Black would reformat
                 return {
                     "status": "success",
                     "message": "Black formatting detected issues to fix"
@@ -401,14 +460,13 @@ def test_function(  ):
                 "message": f"Formatting test failed: {str(e)}"
             }
         finally:
-            if test_file.exists():
-                test_file.unlink()
+            await asyncio.to_thread(test_file.unlink, missing_ok=True)
 
     async def _test_linting(self) -> Dict[str, Any]:
         """Test linting automation."""
         try:
             # Create a file with linting issues
-            test_file = self.workspace_root / "lint_test.py"
+            test_file = self._fixture_path("lint_test.py")
             bad_content = '''
 import os
 def test():
@@ -416,19 +474,16 @@ def test():
     print("hello")
 '''
 
-            with open(test_file, 'w') as f:
-                f.write(bad_content)
+            async with aiofiles.open(test_file, 'w') as f:
+                await f.write(bad_content)
 
             # Run flake8
-            result = subprocess.run(
-                [sys.executable, "-m", "flake8", str(test_file)],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_root
+            returncode, _, _ = await self._run(
+                sys.executable, "-m", "flake8", str(test_file), cwd=self.workspace_root
             )
 
             return {
-                "status": "success" if result.returncode == 1 else "warning",
+                "status": "success" if returncode == 1 else "warning",
                 "message": "Flake8 linting check completed"
             }
 
@@ -438,14 +493,13 @@ def test():
                 "message": f"Linting test failed: {str(e)}"
             }
         finally:
-            if test_file.exists():
-                test_file.unlink()
+            await asyncio.to_thread(test_file.unlink, missing_ok=True)
 
     async def _test_imports(self) -> Dict[str, Any]:
         """Test import organization."""
         try:
             # Create file with disorganized imports
-            test_file = self.workspace_root / "import_test.py"
+            test_file = self._fixture_path("import_test.py")
             bad_content = '''
 import sys
 import os
@@ -454,19 +508,16 @@ import json
 from pathlib import Path
 '''
 
-            with open(test_file, 'w') as f:
-                f.write(bad_content)
+            async with aiofiles.open(test_file, 'w') as f:
+                await f.write(bad_content)
 
             # Run isort
-            result = subprocess.run(
-                [sys.executable, "-m", "isort", "--check-only", "--diff", str(test_file)],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_root
+            returncode, _, _ = await self._run(
+                sys.executable, "-m", "isort", "--check-only", "--diff", str(test_file), cwd=self.workspace_root
             )
 
             return {
-                "status": "success" if result.returncode == 1 else "warning",
+                "status": "success" if returncode == 1 else "warning",
                 "message": "isort import organization check completed"
             }
 
@@ -476,14 +527,13 @@ from pathlib import Path
                 "message": f"Import organization test failed: {str(e)}"
             }
         finally:
-            if test_file.exists():
-                test_file.unlink()
+            await asyncio.to_thread(test_file.unlink, missing_ok=True)
 
     async def _test_type_checking(self) -> Dict[str, Any]:
         """Test type checking automation."""
         try:
             # Create file with type issues
-            test_file = self.workspace_root / "type_test.py"
+            test_file = self._fixture_path("type_test.py")
             bad_content = '''
 def add_numbers(a, b):
     return a + b
@@ -491,19 +541,17 @@ def add_numbers(a, b):
 result = add_numbers("hello", 5)
 '''
 
-            with open(test_file, 'w') as f:
-                f.write(bad_content)
+            async with aiofiles.open(test_file, 'w') as f:
+                await f.write(bad_content)
 
-            # Run mypy
-            result = subprocess.run(
-                [sys.executable, "-m", "mypy", str(test_file)],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_root
+            # Run mypy; cwd=workspace keeps its incremental cache in .mypy_cache, so typeshed
+            # is only analysed on the first run
+            returncode, _, _ = await self._run(
+                sys.executable, "-m", "mypy", str(test_file), cwd=self.workspace_root
             )
 
             return {
-                "status": "success" if result.returncode == 1 else "warning",
+                "status": "success" if returncode == 1 else "warning",
                 "message": "MyPy type checking completed"
             }
 
@@ -513,8 +561,7 @@ result = add_numbers("hello", 5)
                 "message": f"Type checking test failed: {str(e)}"
             }
         finally:
-            if test_file.exists():
-                test_file.unlink()
+            await asyncio.to_thread(test_file.unlink, missing_ok=True)
 
     async def _test_documentation(self) -> Dict[str, Any]:
         """Test documentation automation."""
@@ -527,12 +574,21 @@ result = add_numbers("hello", 5)
                     "message": "Sample documentation file not found"
                 }
 
-            # Read the file and check for docstrings
-            with open(sample_file, 'r') as f:
-                content = f.read()
-
-            # Check for Google-style docstrings
-            has_docstrings = '"""' in content and 'Args:' in content and 'Returns:' in content
+            # Check for Google-style docstrings, reading in chunks and stopping once all markers were seen
+            seen = 0
+            tail = b""
+            async with aiofiles.open(sample_file, 'rb') as f:
+                while seen != _DOC_ALL_SEEN:
+                    chunk = await f.read(DOC_SCAN_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    # Keep the end of the previous chunk so a marker split across chunks is still found
+                    window = tail + chunk
+                    for match in _DOC_RE.finditer(window):
+                        seen |= 1 << (match.lastindex - 1)
+                    tail = window[-_DOC_OVERLAP:]
+
+            has_docstrings = seen == _DOC_ALL_SEEN
 
             if has_docstrings:
                 return {
@@ -555,47 +611,49 @@ result = add_numbers("hello", 5)
         """Run all extension tests."""
         print("🚀 Starting comprehensive extension testing...")
 
-        results = {
-            "ai_extensions": await self.test_ai_extensions(),
-            "blockchain_extensions": await self.test_blockchain_extensions(),
-            "automation_features": await self.test_automation_features(),
-            "summary": {}
-        }
+        # Every category and every check in it is independent, so run them all at once
+        config = await self.load_config()
+        try:
+            ai_results, blockchain_results, automation_results = await asyncio.gather(
+                self.test_ai_extensions(config),
+                self.test_blockchain_extensions(config),
+                self.test_automation_features(),
+            )
+        finally:
+            if self._fixture_dir is not None:
+                await asyncio.to_thread(shutil.rmtree, self._fixture_dir, ignore_errors=True)
+                self._fixture_dir = None
 
         # Calculate summary
-        total_tests = 0
-        passed_tests = 0
-        failed_tests = 0
-        warning_tests = 0
+        counts = Counter(
+            test_result.get("status", "unknown")
+            for tests in (ai_results, blockchain_results, automation_results)
+            for test_result in tests.values()
+        )
+        total_tests = sum(counts.values())
 
-        for category, tests in results.items():
-            if category == "summary":
-                continue
-            for test_name, test_result in tests.items():
-                total_tests += 1
-                status = test_result.get("status", "unknown")
-                if status == "success":
-                    passed_tests += 1
-                elif status == "error":
-                    failed_tests += 1
-                elif status == "warning":
-                    warning_tests += 1
-
-        results["summary"] = {
-            "total_tests": total_tests,
-            "passed": passed_tests,
-            "failed": failed_tests,
-            "warnings": warning_tests,
-            "success_rate": (passed_tests / total_tests * 100) if total_tests > 0 else 0
+        results = {
+            "ai_extensions": ai_results,
+            "blockchain_extensions": blockchain_results,
+            "automation_features": automation_results,
+            "summary": {
+                "total_tests": total_tests,
+                "passed": counts["success"],
+                "failed": counts["error"],
+                "warnings": counts["warning"],
+                "success_rate": (counts["success"] / total_tests * 100) if total_tests > 0 else 0
+            }
         }
 
         return results
 
     def print_results(self, results: Dict[str, Any]):
-        """Print test results in a formatted way."""
-        print("\n" + "="*60)
-        print("🎯 EXTENSION TESTING RESULTS")
-        print("="*60)
+        """Print test results in a formatted way; the report is written in one go."""
+        lines = [
+            "\n" + "="*60,
+            "🎯 EXTENSION TESTING RESULTS",
+            "="*60,
+        ]
 
         summary = results.get("summary", {})
 
@@ -603,29 +661,32 @@ result = add_numbers("hello", 5)
             if category == "summary":
                 continue
 
-            print(f"\n📁 {category.replace('_', ' ').title()}:")
-            print("-" * 40)
+            lines.append(f"\n📁 {category.replace('_', ' ').title()}:")
+            lines.append("-" * 40)
 
             for test_name, test_result in tests.items():
                 status = test_result.get("status", "unknown")
                 message = test_result.get("message", "")
 
                 if status == "success":
-                    print(f"  ✅ {test_name}: {message}")
+                    lines.append(f"  ✅ {test_name}: {message}")
                 elif status == "error":
-                    print(f"  ❌ {test_name}: {message}")
+                    lines.append(f"  ❌ {test_name}: {message}")
                 elif status == "warning":
-                    print(f"  ⚠️  {test_name}: {message}")
+                    lines.append(f"  ⚠️  {test_name}: {message}")
                 else:
-                    print(f"  ❓ {test_name}: {message}")
+                    lines.append(f"  ❓ {test_name}: {message}")
 
-        print(f"\n📊 SUMMARY:")
-        print(f"   Total Tests: {summary.get('total_tests', 0)}")
-        print(f"   ✅ Passed: {summary.get('passed', 0)}")
-        print(f"   ❌ Failed: {summary.get('failed', 0)}")
-        print(f"   ⚠️  Warnings: {summary.get('warnings', 0)}")
-        print(f"   📈 Success Rate: {summary.get('success_rate', 0):.1f}%")
-        print("="*60)
+        lines += [
+            "\n📊 SUMMARY:",
+            f"   Total Tests: {summary.get('total_tests', 0)}",
+            f"   ✅ Passed: {summary.get('passed', 0)}",
+            f"   ❌ Failed: {summary.get('failed', 0)}",
+            f"   ⚠️  Warnings: {summary.get('warnings', 0)}",
+            f"   📈 Success Rate: {summary.get('success_rate', 0):.1f}%",
+            "="*60,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -639,8 +700,8 @@ async def main():
 
         # Save results to file
         results_file = workspace_root / "extension_test_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        async with aiofiles.open(results_file, 'wb') as f:
+            await f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
         print(f"\n💾 Results saved to: {results_file}")
 
@@ -662,7 +723,11 @@ async def main():
     except Exception as e:
         print(f"💥 Test runner failed: {str(e)}")
         sys.exit(1)
+    finally:
+        await tester.aclose()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())